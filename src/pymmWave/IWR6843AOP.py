@@ -1,14 +1,42 @@
-from asyncio import Queue, sleep
+import os
+import struct
+from asyncio import (
+    AbstractEventLoop,
+    Future,
+    Queue,
+    QueueFull,
+    Task,
+    current_task,
+    get_running_loop,
+    run_coroutine_threadsafe,
+    sleep,
+    wait,
+    wrap_future,
+)
+from concurrent.futures import Future as ConcurrentFuture
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from dataclasses import dataclass
-from time import time
-from typing import Dict, Optional
+from threading import Event, Semaphore, Thread
+from time import monotonic, perf_counter, time
+from typing import Callable, Dict, Optional
 
 from aioserial import AioSerial, SerialException
 
-from .constants import ASYNC_SLEEP, MAGIC_NUMBER
+from .capture import CaptureWriter
+from .clock import ClockModel
+from .constants import ASYNC_SLEEP, MAGIC_NUMBER, QueuePolicy, ReadMode
+from .frame_queue import FrameQueue
+from .frame_reader import FrameStats
+from .metrics import SensorMetrics
 from .parsing.area_scanner.area_scanner_parser import AreaScannerParser
-from .parsing.sensor_parser import SensorParser
+from .parsing.parser_pool import ParserPool
+from .parsing.sensor_parser import PacketParser, SensorParser
+from .parsing.stream_parser import StreamParser
 from .sensor import Sensor
+from .timestamps import FrameTimestamps, stamp
+
+# Maximum number of bytes read per readiness event in ReadMode.SELECTOR
+_SELECTOR_READ_SIZE = 1 << 16
 
 
 @dataclass(init=False)
@@ -37,12 +65,29 @@ class IWR6843AOP(Sensor):
     parser: SensorParser
     """The parser used to parse raw data from the sensor. Defaults to AreaScannerParser()"""
 
-    def __init__(self, name: str, verbose: bool = False):
+    def __init__(
+        self,
+        name: str,
+        verbose: bool = False,
+        read_mode: ReadMode = ReadMode.ASYNC,
+        queue_size: int = 1,
+        queue_policy: QueuePolicy = QueuePolicy.DROP_OLDEST,
+        parser_pool: Optional[ParserPool] = None,
+    ):
         """Initialize the sensor
 
         Args:
             verbose (bool, optional): Print out extra initialization information, can be useful. Defaults to False.
+            read_mode (ReadMode, optional): How the data port is read. ReadMode.THREAD reads on a dedicated thread and ReadMode.SELECTOR reads when the event loop reports the port readable, instead of polling from the event loop. Defaults to ReadMode.ASYNC.
+            queue_size (int, optional): Number of parsed frames kept for get_data. Defaults to 1.
+            queue_policy (QueuePolicy, optional): What happens to new frames when the queue is full. Defaults to QueuePolicy.DROP_OLDEST.
+            parser_pool (Optional[ParserPool], optional): Parse frames in the worker processes of this pool instead of with the parser attribute. Frames are still handed out in order, as the parser would return them. Requires ReadMode.THREAD. Defaults to None.
+
+        Raises:
+            ValueError: If a parser pool is used without ReadMode.THREAD.
         """
+        if parser_pool is not None and read_mode != ReadMode.THREAD:
+            raise ValueError("A parser pool requires ReadMode.THREAD")
 
         super().__init__()
         self._is_alive: bool = False
@@ -56,14 +101,29 @@ class IWR6843AOP(Sensor):
         self._config_baud: Optional[int] = None
         self._data_baud: Optional[int] = None
 
-        # Why a queue? This is forward looking. asyncio defaults to single threaded behavior and therefore this should
-        #   be thread safe by default. The upside of a queue is if this changes to a multi-process system on some executor,
-        #   this code remains valid as this is a safe shared option.
-        self._active_data: Queue[dict] = Queue(1)
+        # Parsed frames wait here for get_data. The policy decides what is lost when consumers fall behind.
+        self._active_data: FrameQueue[Dict] = FrameQueue(queue_size, queue_policy)
         self._freq: float = 10.0
         self._last_t: float = 0.0
+        self._read_mode = read_mode
+        self._stop_reading = Event()
+        self._detach_reader: Optional[Callable[[], None]] = None
+        self._recorder: Optional[CaptureWriter] = None
+        self._parser_pool = parser_pool
+        # Pending results of the parser pool, with the receive and submit time of their frames
+        self._pool_results: Queue[tuple[ConcurrentFuture, Optional[float], float]] = (
+            Queue()
+        )
+        self._pool_in_flight = Semaphore()
+        # Last frame from the reader thread waiting for room in a queue, later frames queue up behind it
+        self._pending_put: Optional[Task] = None
 
         self.parser: SensorParser = AreaScannerParser()
+        self._metrics = SensorMetrics()
+        self._clock = ClockModel()
+        self._stream = StreamParser(
+            self.parser, on_frame=self._record, metrics=self._metrics, clock=self._clock
+        )
 
     def connect_config(self, com_port: str, baud_rate: int, timeout: int = 1) -> bool:
         """Connect to the config port. Must be done before sending config.
@@ -251,6 +311,8 @@ class IWR6843AOP(Sensor):
         Since this relies on the asyncio Queue, limitations may stem from asyncio. These issues, mainly revolving around thread safety, can be dealt with at the application layer.
 
         This function also actively attempts to context switch between intervals to minimize overhead.
+        With ReadMode.THREAD or ReadMode.SELECTOR, the data port is read on a dedicated thread or from readiness callbacks instead.
+        In every mode, this function returns once the sensor is stopped.
 
         Raises:
             Exception: If sensor has some failure, will throw a SerialException.
@@ -263,30 +325,292 @@ class IWR6843AOP(Sensor):
         if not self._config_sent:
             raise Exception("Config never sent to device")
 
+        self._stop_reading.clear()
+        self._stream.parser = self.parser
+
+        # Parsers which can parse complete packets are fed from the frame reader, others read from the port themselves
+        use_reader = isinstance(self.parser, PacketParser)
+
+        if self._read_mode != ReadMode.ASYNC:
+            if not use_reader:
+                raise Exception(f"{self._read_mode} requires a PacketParser")
+            if self._read_mode == ReadMode.THREAD:
+                await self._run_reader_thread()
+            else:
+                await self._run_selector_reader()
+            return None
+
         current_data: bytes = b""
-        while True:
+        while not self._stop_reading.is_set():
             await sleep(ASYNC_SLEEP)
             try:
-                # Find our packet start
-                current_data = await self._ser_data.read_until_async(MAGIC_NUMBER)
-
-                if current_data is None:
-                    raise SerialException()
+                if use_reader:
+                    new_data = await self._stream.read(self._ser_data)
+                else:
+                    # Find our packet start
+                    start = perf_counter()
+                    current_data = await self._ser_data.read_until_async(MAGIC_NUMBER)
+
+                    if current_data is None:
+                        raise SerialException()
+
+                    received = monotonic()
+                    self._metrics.sync_scan.record(perf_counter() - start)
+                    start = perf_counter()
+                    new_data = await self.parser.parse(self._ser_data)
+                    if new_data is not None:
+                        self._metrics.parse.record(perf_counter() - start)
+                        self._metrics.count_frame(new_data)
+                    stamp(new_data, received, monotonic())
+                    self._clock.stamp(new_data)
 
-                new_data = await self.parser.parse(self._ser_data)
                 if new_data is None:
                     continue  # Packet was discarded. Try again.
 
-                if self._active_data.full():
-                    self._active_data.get_nowait()
-
-                self._active_data.put_nowait(new_data)
+                await self._put(new_data)
 
-            except (IndexError, ValueError) as _:
+            except (IndexError, ValueError, struct.error) as _:
                 pass
+            except Exception:
+                if self._stop_reading.is_set():
+                    break  # stop_sensor closed the port during a read
+                raise
 
         return None
 
+    def _record(self, frame: memoryview) -> None:
+        """Internal func which hands a raw frame to the recording in progress, if any, with the time its magic word was received."""
+        recorder = self._recorder
+        if recorder is not None:
+            received = self._stream.reader.frame_time
+            recorder.write(
+                frame, recorder.epoch_ns(received) if received is not None else None
+            )
+
+    def _frame_queues(self) -> list[FrameQueue]:
+        return [self._active_data] + super()._frame_queues()
+
+    async def _run_reader_thread(self) -> None:
+        """Internal func which runs the reader thread and waits until it stops."""
+        loop = get_running_loop()
+        done: Future[None] = loop.create_future()
+
+        thread = Thread(
+            target=self._read_frames_blocking,
+            args=(loop, done),
+            name=f"{self.model()} {self.name} reader",
+            daemon=True,
+        )
+
+        publisher: Optional[Task[None]] = None
+        if self._parser_pool is not None:
+            # Frames parsed by the pool are published in the order they were read
+            self._pool_results = Queue()
+            self._pool_in_flight = Semaphore(self._parser_pool.slots)
+            publisher = loop.create_task(self._publish_pool_results())
+
+        thread.start()
+
+        try:
+            await done
+        finally:
+            self._stop_reading.set()
+            if publisher is not None:
+                publisher.cancel()
+
+    async def _publish_pool_results(self) -> None:
+        """Internal func which publishes the frames parsed by the parser pool, in the order they were submitted."""
+        while True:
+            parsed, received, submitted = await self._pool_results.get()
+            try:
+                new_data = await wrap_future(parsed)
+            except (IndexError, ValueError, struct.error) as _:
+                self._stream.stats.corrupt += 1
+            else:
+                if new_data is None:
+                    self._stream.stats.discarded += 1
+                else:
+                    stamp(new_data, received, monotonic())
+                    self._clock.stamp(new_data)
+                    self._metrics.parse.record(perf_counter() - submitted)
+                    self._metrics.count_frame(new_data)
+                    await self._put(new_data)
+            finally:
+                self._pool_in_flight.release()
+
+    def _submit_to_pool(self, loop: AbstractEventLoop, frame: memoryview) -> None:
+        """Internal func which hands a frame to the parser pool from the reader thread. Blocks while too many frames are still being parsed or published."""
+        while not self._pool_in_flight.acquire(timeout=0.1):
+            if self._stop_reading.is_set():
+                return
+
+        self._record(frame)
+        submitted = perf_counter()
+        parsed = self._parser_pool.submit(  # type: ignore
+            frame[len(MAGIC_NUMBER) :], transform_time=self._metrics.transform
+        )
+        loop.call_soon_threadsafe(
+            self._pool_results.put_nowait,
+            (parsed, self._stream.reader.frame_time, submitted),
+        )
+
+    async def _run_selector_reader(self) -> None:
+        """Internal func which reads the data port whenever the event loop reports it readable, until the sensor is stopped."""
+        loop = get_running_loop()
+        done: Future[None] = loop.create_future()
+
+        try:
+            fd = self._ser_data.fileno()  # type: ignore
+        except (AttributeError, OSError):
+            raise Exception("The data port has no file descriptor to select on")
+
+        # Set while reading is paused because the queue is full
+        resume_task: Optional[Task[None]] = None
+
+        def detach(error: Optional[Exception] = None) -> None:
+            loop.remove_reader(fd)
+            self._detach_reader = None
+            if resume_task is not None:
+                resume_task.cancel()
+            if done.done():
+                return
+            if error is not None:
+                done.set_exception(error)
+            else:
+                done.set_result(None)
+
+        def on_readable() -> None:
+            try:
+                data = os.read(fd, _SELECTOR_READ_SIZE)
+            except BlockingIOError:
+                return
+            except OSError as e:
+                detach(SerialException(e))
+                return
+
+            if not data:
+                detach(SerialException("Data port closed"))
+                return
+
+            self._stream.push(data)
+            publish_buffered()
+
+        def publish_buffered() -> None:
+            nonlocal resume_task
+            while (new_data := self._stream.next_parsed()) is not None:
+                try:
+                    self._publish(new_data)
+                except QueueFull:
+                    # Stop reading until a consumer made room, unread data stays in the OS buffer meanwhile
+                    loop.remove_reader(fd)
+                    resume_task = loop.create_task(resume(new_data))
+                    return
+
+        async def resume(pending: Dict) -> None:
+            nonlocal resume_task
+            await self._put(pending)
+            resume_task = None
+            loop.add_reader(fd, on_readable)
+            publish_buffered()
+
+        self._detach_reader = detach
+        loop.add_reader(fd, on_readable)
+        try:
+            await done
+        finally:
+            if self._detach_reader is detach:
+                detach()
+
+    def _read_frames_blocking(self, loop: AbstractEventLoop, done: Future) -> None:
+        """Body of the reader thread. Reads and parses frames with blocking calls, and posts them to the event loop."""
+        error: Optional[BaseException] = None
+        try:
+            while not self._stop_reading.is_set():
+                frame = self._stream.next_frame()
+                if frame is None:
+                    # Blocks until enough data arrived or the port timeout passed
+                    self._stream.push(
+                        self._ser_data.read(  # type: ignore
+                            max(self._ser_data.in_waiting, self._stream.bytes_missing())  # type: ignore
+                        )
+                    )
+                    continue
+
+                if self._parser_pool is not None:
+                    self._submit_to_pool(loop, frame)
+                    continue
+
+                new_data = self._stream.parse_frame(frame)
+                if new_data is None:
+                    continue
+
+                if self._may_block():
+                    self._put_from_thread(loop, new_data)
+                else:
+                    loop.call_soon_threadsafe(self._publish_in_order, new_data)
+        except Exception as e:
+            # Closing the port from stop_sensor interrupts a pending read
+            if not self._stop_reading.is_set():
+                error = e
+
+        def finish() -> None:
+            if done.done():
+                return
+            if error is not None:
+                done.set_exception(error)
+            else:
+                done.set_result(None)
+
+        if not loop.is_closed():
+            loop.call_soon_threadsafe(finish)
+
+    def _put_from_thread(self, loop: AbstractEventLoop, data: Dict) -> None:
+        """Internal func which blocks the reader thread until the frame is queued, or the sensor is stopped."""
+
+        async def put() -> None:
+            pending = self._publish_in_order(data)
+            if pending is not None:
+                await pending
+
+        queued = run_coroutine_threadsafe(put(), loop)
+        while not self._stop_reading.is_set():
+            try:
+                queued.result(timeout=0.1)
+                return
+            except FutureTimeoutError:
+                pass
+        queued.cancel()
+
+    def _publish_in_order(self, data: Dict) -> Optional[Task]:
+        """Internal func which publishes a frame from the reader thread on the event loop.
+        A subscription with QueuePolicy.BLOCK may have been added after the reader thread decided not to wait, so a frame finding a queue full waits for room in a task instead of being lost.
+        Frames published while an earlier frame waits queue up behind it, so they stay in order.
+
+        Returns:
+            Optional[Task]: Task queueing the frame, None if the frame was published right away
+        """
+        if self._pending_put is None:
+            try:
+                self._publish(data)
+                return None
+            except QueueFull:
+                pass
+
+        self._pending_put = get_running_loop().create_task(
+            self._put_after(self._pending_put, data)
+        )
+        return self._pending_put
+
+    async def _put_after(self, previous: Optional[Task], data: Dict) -> None:
+        """Internal func which queues a frame once the previous frame was queued, or given up on."""
+        try:
+            if previous is not None:
+                await wait([previous])
+            await self._put(data)
+        finally:
+            if self._pending_put is current_task():
+                self._pending_put = None
+
     async def get_data(self) -> Dict:
         """Returns data when it is ready. This function also updates the frequency measurement of the sensor.
         This function is blocking.
@@ -295,6 +619,7 @@ class IWR6843AOP(Sensor):
             dict: Sensor data
         """
         data = await self._active_data.get()
+        self._dequeued(data)
         tt = time()
         self._freq = (1 / (tt - self._last_t)) * 0.5 + self._freq * 0.5
         self._last_t = tt
@@ -306,14 +631,37 @@ class IWR6843AOP(Sensor):
         Returns:
             Optional[dict]: Data if there is data available, otherwise returns None.
         """
-        if self._active_data.full():
+        if not self._active_data.empty():
             tt = time()
             self._freq = (1 / (tt - self._last_t)) * 0.5 + self._freq * 0.5
             self._last_t = tt
-            return self._active_data.get_nowait()
+            data = self._active_data.get_nowait()
+            self._dequeued(data)
+            return data
 
         return None
 
+    def start_recording(self, path: str) -> CaptureWriter:
+        """Record every raw frame read from the data port to a capture file, while the sensor keeps running. Replaces a recording in progress.
+        Only frames read through the frame reader are recorded, which requires a PacketParser.
+
+        Args:
+            path (str): Capture file to write
+
+        Returns:
+            CaptureWriter: The writer of the capture file
+        """
+        self.stop_recording()
+        self._recorder = CaptureWriter(path)
+        return self._recorder
+
+    def stop_recording(self) -> None:
+        """Stop recording, after writing all pending frames to the capture file."""
+        recorder = self._recorder
+        self._recorder = None
+        if recorder is not None:
+            recorder.close()
+
     def stop_sensor(self, send_stop: bool = True) -> None:
         """This function attempts to close all serial ports and update internal state booleans.
 
@@ -321,6 +669,11 @@ class IWR6843AOP(Sensor):
             send_stop (bool, optional): Sends a sensorStop command to the conf port before disconnecting. Defaults to True.
         """
 
+        self._stop_reading.set()
+        if self._detach_reader is not None:
+            # Must happen before the port is closed, since its file descriptor may be reused
+            self._detach_reader()
+
         # Send stop command
         if send_stop:
             try:
@@ -338,8 +691,47 @@ class IWR6843AOP(Sensor):
         except SerialException:
             pass
 
+        self.stop_recording()
         self._update_alive()
 
+    def _dequeued(self, data: Dict) -> None:
+        super()._dequeued(data)
+        timestamps = FrameTimestamps.of(data)
+        if timestamps is not None and timestamps.parsed is not None:
+            self._metrics.queue_wait.record(monotonic() - timestamps.parsed)
+
+    @property
+    def metrics(self) -> SensorMetrics:
+        """Latency histograms of every stage of reading frames, and the frames, bytes and points per second. Can be queried while the sensor runs.
+
+        Example:
+            >>> my_sensor.metrics.parse.percentile(99)
+            0.00041
+            >>> my_sensor.metrics.frames.rate()
+            20.0
+        """
+        return self._metrics
+
+    @property
+    def clock(self) -> ClockModel:
+        """Model of the device clock, fit to the time_cpu_cycles and receive time of every frame. Sets the corrected timestamp of the frames."""
+        return self._clock
+
+    @property
+    def frame_stats(self) -> FrameStats:
+        """Counters for frames read from the data port, including lost, corrupt and resynchronized frames. Only maintained if the parser is a PacketParser."""
+        return self._stream.stats
+
+    @property
+    def dropped_frames(self) -> int:
+        """Number of parsed frames discarded because the queue was full."""
+        return self._active_data.dropped
+
+    @property
+    def overwritten_frames(self) -> int:
+        """Number of queued frames replaced by a newer frame because the queue was full."""
+        return self._active_data.overwritten
+
     def get_update_freq(self) -> float:
         """Returns the frequency that the sensor is returning data at. This is not equivalent to the true capacity of the sensor, but rather the rate which the application is successfully getting data.
 
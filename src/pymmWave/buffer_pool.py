@@ -0,0 +1,111 @@
+from collections import deque
+from threading import Lock
+from typing import Deque
+
+from .constants import MAX_PACKET_LEN
+
+
+class BufferPool:
+    """Pool of preallocated buffers for frame data, so a long running sensor does not allocate and free a buffer per frame.
+    Buffers come in size classes, doubling from min_size until MAX_PACKET_LEN fits, and a frame takes the smallest that fits its packet. A small frame thus does not pin a buffer sized for the largest.
+    Buffers come back to the pool when the frame holding them is released or garbage collected. A buffer some array or memoryview still points into is never reused.
+    Safe to use from several threads.
+
+    Example:
+        >>> my_sensor.parser.buffer_pool = BufferPool()
+    """
+
+    def __init__(self, min_size: int = 2048, max_buffers: int = 64):
+        """Initialize the pool, buffers are allocated on demand
+
+        Args:
+            min_size (int, optional): Size of the smallest buffers. Defaults to 2048, which fits a frame with about 100 points.
+            max_buffers (int, optional): Maximum number of free buffers kept per size class. Defaults to 64.
+        """
+        self.min_size = min_size
+        self.max_buffers = max_buffers
+
+        self.allocated: int = 0
+        """Number of buffers allocated, because no free buffer was available."""
+        self.reused: int = 0
+        """Number of buffers handed out again after they were released."""
+
+        # Guards the counters. Free buffers need no lock, since deque.append and deque.pop are atomic.
+        self._lock = Lock()
+        # Free buffers of every size class
+        self._free: list[Deque[bytearray]] = [
+            deque() for _ in range(self._size_class(MAX_PACKET_LEN) + 1)
+        ]
+
+    def __getstate__(self) -> dict:
+        # Locks cannot be pickled, e.g. with a parser handed to a ParserPool
+        state = dict(self.__dict__)
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        """Number of free buffers, of all sizes."""
+        return sum(len(free) for free in self._free)
+
+    @property
+    def max_size(self) -> int:
+        """Size of the largest buffers, at least MAX_PACKET_LEN."""
+        return self.min_size << (len(self._free) - 1)
+
+    def _size_class(self, size: int) -> int:
+        """Index of the smallest size class fitting size bytes."""
+        return ((max(size, 1) - 1) // self.min_size).bit_length()
+
+    def acquire(self, size: int = 0) -> bytearray:
+        """Take a free buffer of at least size bytes, or allocate one if there is none. Its contents are undefined.
+
+        Args:
+            size (int, optional): Number of bytes needed. Defaults to 0, a buffer of min_size.
+
+        Returns:
+            bytearray: Buffer of the smallest size class fitting size
+
+        Raises:
+            ValueError: If size exceeds max_size.
+        """
+        if size > self.max_size:
+            raise ValueError(f"Buffer of {size} bytes exceeds {self.max_size} bytes")
+
+        size_class = self._size_class(size)
+        try:
+            buf = self._free[size_class].pop()
+        except IndexError:
+            with self._lock:
+                self.allocated += 1
+            return bytearray(self.min_size << size_class)
+
+        with self._lock:
+            self.reused += 1
+        return buf
+
+    def release(self, buf: bytearray) -> None:
+        """Return a buffer to the pool. It is dropped instead if something still points into it, or its size class is full.
+
+        Args:
+            buf (bytearray): Buffer taken from this pool
+        """
+        size_class = self._size_class(len(buf))
+        if (
+            size_class >= len(self._free)
+            or len(buf) != self.min_size << size_class
+            or len(self._free[size_class]) >= self.max_buffers
+        ):
+            return
+
+        try:
+            # Resizing fails while a memoryview or NumPy array uses the buffer
+            buf.append(0)
+            buf.pop()
+        except BufferError:
+            return
+
+        self._free[size_class].append(buf)
@@ -0,0 +1,165 @@
+from queue import Empty, Full, Queue
+from struct import Struct
+from threading import Thread
+from time import monotonic_ns, time_ns
+from typing import BinaryIO, Iterator, Optional
+
+# Start of every capture file, the last two characters are the format version.
+CAPTURE_MAGIC: bytes = b"PMWCAP01"
+
+# Every record: host receive time in nanoseconds since the epoch, and length of the frame which follows.
+_RECORD_HEADER = Struct("<qI")
+
+
+class CaptureWriter:
+    """Records raw frames to a capture file. Writing happens on a background thread, so recording never waits for the disk.
+    A capture file starts with CAPTURE_MAGIC, followed by one record per frame: the host receive time in nanoseconds (int64), the frame length (uint32) and the raw frame including its magic word.
+    """
+
+    def __init__(self, path: str, max_pending: int = 1024):
+        """Open the capture file and start the writer thread
+
+        Args:
+            path (str): File to write, an existing file is overwritten
+            max_pending (int, optional): Maximum number of frames waiting to be written. Frames beyond this are dropped, so a stalled disk cannot exhaust memory. Defaults to 1024.
+        """
+        self.path = path
+        self.dropped: int = 0
+        """Number of frames not recorded because too many were waiting to be written."""
+
+        # Receive times are taken from the monotonic clock. One offset for the whole recording keeps their intervals exact, even if the system clock is adjusted.
+        self._epoch_offset_ns = time_ns() - monotonic_ns()
+
+        self._file: BinaryIO = open(path, "wb")
+        self._file.write(CAPTURE_MAGIC)
+        self._pending: Queue[Optional[bytes]] = Queue(max_pending)
+        self._closed = False
+        self._thread = Thread(
+            target=self._write_records, name=f"capture {path}", daemon=True
+        )
+        self._thread.start()
+
+    def write(
+        self, frame: bytes | memoryview, timestamp_ns: Optional[int] = None
+    ) -> None:
+        """Queue a frame for writing. Never blocks. Safe to call from any thread.
+
+        Args:
+            frame (bytes | memoryview): Raw frame, starting with the magic word. It is copied, so it may be a view into a reused buffer.
+            timestamp_ns (Optional[int], optional): Host receive time in nanoseconds since the epoch, see :meth:`epoch_ns`. Defaults to now.
+        """
+        if self._closed:
+            return
+
+        if timestamp_ns is None:
+            timestamp_ns = self._epoch_offset_ns + monotonic_ns()
+
+        try:
+            self._pending.put_nowait(
+                _RECORD_HEADER.pack(timestamp_ns, len(frame)) + frame
+            )
+        except Full:
+            self.dropped += 1
+
+    def epoch_ns(self, monotonic_time: float) -> int:
+        """Convert a time of time.monotonic(), like the receive time of a frame, to nanoseconds since the epoch.
+
+        Args:
+            monotonic_time (float): Seconds of time.monotonic()
+
+        Returns:
+            int: Nanoseconds since the epoch
+        """
+        return self._epoch_offset_ns + round(monotonic_time * 1e9)
+
+    def _write_records(self) -> None:
+        """Body of the writer thread."""
+        while True:
+            record = self._pending.get()
+            # Write everything that piled up in one go, and only flush once the backlog is cleared
+            while record is not None:
+                self._file.write(record)
+                try:
+                    record = self._pending.get_nowait()
+                except Empty:
+                    break
+
+            self._file.flush()
+            if record is None:
+                return
+
+    def close(self) -> None:
+        """Write all pending frames and close the file."""
+        if self._closed:
+            return
+
+        self._closed = True
+        self._pending.put(None)
+        self._thread.join()
+        self._file.close()
+
+    def __enter__(self) -> "CaptureWriter":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+
+def read_capture(path: str) -> Iterator[tuple[int, bytes]]:
+    """Read the frames of a capture file written by :obj:`CaptureWriter<pymmWave.capture.CaptureWriter>`.
+    A record cut short at the end of the file, for example because recording was interrupted, is ignored.
+
+    Args:
+        path (str): Capture file
+
+    Yields:
+        tuple[int, bytes]: Host receive time in nanoseconds since the epoch, and the raw frame including its magic word.
+
+    Raises:
+        ValueError: If the file is not a capture file.
+    """
+    with open(path, "rb") as f:
+        if f.read(len(CAPTURE_MAGIC)) != CAPTURE_MAGIC:
+            raise ValueError(f"{path} is not a capture file")
+
+        while True:
+            header = f.read(_RECORD_HEADER.size)
+            if len(header) < _RECORD_HEADER.size:
+                return
+
+            timestamp_ns, length = _RECORD_HEADER.unpack(header)
+            frame = f.read(length)
+            if len(frame) < length:
+                return
+
+            yield timestamp_ns, frame
+
+
+def index_capture(data: bytes | bytearray | memoryview) -> list[tuple[int, int, int]]:
+    """Locate the frames of a capture file which is already in memory or memory-mapped, without copying them.
+    A record cut short at the end, for example because recording was interrupted, is ignored.
+
+    Args:
+        data (bytes | bytearray | memoryview): Contents of a capture file, e.g. an mmap of it
+
+    Returns:
+        list[tuple[int, int, int]]: Host receive time in nanoseconds since the epoch, offset of the frame in data and its length, for every record.
+
+    Raises:
+        ValueError: If data is not a capture file.
+    """
+    if bytes(data[: len(CAPTURE_MAGIC)]) != CAPTURE_MAGIC:
+        raise ValueError("Data is not a capture file")
+
+    records = []
+    offset = len(CAPTURE_MAGIC)
+    end = len(data)
+    while offset + _RECORD_HEADER.size <= end:
+        timestamp_ns, length = _RECORD_HEADER.unpack_from(data, offset)
+        offset += _RECORD_HEADER.size
+        if offset + length > end:
+            break
+
+        records.append((timestamp_ns, offset, length))
+        offset += length
+    return records
@@ -0,0 +1,150 @@
+from typing import Any, Optional
+
+import numpy as np
+
+from .timestamps import FrameTimestamps, set_timestamp
+
+# time_cpu_cycles is a 32 bit counter
+_CYCLE_WRAP = 1 << 32
+
+# Clock of the core counting time_cpu_cycles on the IWR6843
+DEVICE_CLOCK_HZ = 200e6
+
+# Frames per block, of which only the least delayed one is used to fit the drift
+_BLOCK = 16
+
+
+class ClockModel:
+    """Online model of the free-running clock of a sensor, relating the time_cpu_cycles of its frames to the host clock.
+    Fits host time = offset + device time * (1 + drift) over a sliding window of frames. Delays of the UART, the OS and the event loop only ever make frames arrive late, so the model follows
+    the earliest arrivals: the drift is a least squares fit to the least delayed frame of every block of 16 frames, and the offset puts the line below all frames.
+    Corrected timestamps follow the device clock instead of the arrival jitter, so frames of several sensors can be aligned in the host time base.
+    """
+
+    def __init__(
+        self,
+        clock_hz: float = DEVICE_CLOCK_HZ,
+        window: int = 512,
+        reset_threshold: float = 1.0,
+    ):
+        """Initialize an empty model
+
+        Args:
+            clock_hz (float, optional): Nominal rate of time_cpu_cycles. Defaults to DEVICE_CLOCK_HZ.
+            window (int, optional): Number of recent frames the model is fit to. Defaults to 512.
+            reset_threshold (float, optional): Seconds the device clock may run ahead of the host clock between two frames before the sensor is considered restarted, which starts a new model. Defaults to 1.0.
+        """
+        self.clock_hz = clock_hz
+        self.window = window
+        self.reset_threshold = reset_threshold
+
+        self.resets: int = 0
+        """Number of times the device clock restarted, or jumped, and the model started over"""
+
+        # Device time in seconds since the model started
+        self._device = np.empty(window)
+        self._host = np.empty(window)  # Receive time
+        self._samples = 0
+        self._ticks = 0  # Unwrapped cycles since the model started
+        self._last_cycles: Optional[int] = None
+        self._last_host = 0.0
+        self._offset = 0.0
+        self._slope = 1.0
+
+    @property
+    def samples(self) -> int:
+        """Number of frames the model is currently fit to."""
+        return min(self._samples, self.window)
+
+    @property
+    def drift(self) -> float:
+        """Rate of the device clock relative to its nominal rate, as measured by the host clock, minus 1. E.g. 2e-5 means the device clock runs 20 ppm slow."""
+        return self._slope - 1.0
+
+    def reset(self) -> None:
+        """Forget all frames, e.g. after the sensor was restarted."""
+        self._samples = 0
+        self._ticks = 0
+        self._last_cycles = None
+        self._slope = 1.0
+
+    def _unwrap(self, time_cpu_cycles: int, received: float) -> int:
+        """Cycles since the model started. The receive times tell how often the counter wrapped in between, even when frames were lost for longer than a wrap."""
+        if self._last_cycles is None:
+            return 0
+
+        elapsed = received - self._last_host
+        delta = (time_cpu_cycles - self._last_cycles) % _CYCLE_WRAP
+        wraps = round((elapsed * self.clock_hz - delta) / _CYCLE_WRAP)
+        delta += max(0, wraps) * _CYCLE_WRAP
+        # Frames can arrive late, but not before they were sent
+        if delta / self.clock_hz - elapsed > self.reset_threshold:
+            self.resets += 1
+            self.reset()
+            return 0
+        return self._ticks + delta
+
+    def update(self, time_cpu_cycles: int, received: float) -> float:
+        """Add a frame to the model, and estimate when it was sent.
+
+        Args:
+            time_cpu_cycles (int): Device time of the frame in cycles
+            received (float): Host time the frame was received at, in seconds of time.monotonic()
+
+        Returns:
+            float: Corrected timestamp of the frame, in seconds of time.monotonic(). Never later than received.
+        """
+        self._ticks = self._unwrap(time_cpu_cycles, received)
+        self._last_cycles = time_cpu_cycles
+        self._last_host = received
+
+        index = self._samples % self.window
+        self._device[index] = self._ticks / self.clock_hz
+        self._host[index] = received
+        self._samples += 1
+        self._fit()
+        return float(self._offset + self._slope * self._device[index])
+
+    def _fit(self) -> None:
+        """Fit the drift and offset to the frames in the window."""
+        n = self.samples
+        device = self._device[:n]
+        host = self._host[:n]
+
+        # Least delayed frame of every block. Fitting all frames would follow the jitter.
+        blocks = -(-n // _BLOCK)
+        delays = np.full(blocks * _BLOCK, np.inf)
+        delays[:n] = host - device
+        picks = delays.reshape(blocks, _BLOCK).argmin(axis=1)
+        picks += np.arange(0, blocks * _BLOCK, _BLOCK)
+        x = device[picks]
+        y = host[picks]
+
+        self._slope = 1.0
+        if blocks >= 2:
+            centered = x - x.mean()
+            spread = np.dot(centered, centered)
+            if spread > 0:
+                self._slope = float(np.dot(centered, y - y.mean()) / spread)
+        self._offset = float(np.min(host - self._slope * device))
+
+    def stamp(self, data: Any) -> None:
+        """Add a parsed frame to the model, and set its corrected timestamp. Frames without time_cpu_cycles or receive time are left alone.
+
+        Args:
+            data (Any): Parsed frame, a dict or an object with header fields and timestamps
+        """
+        timestamps = FrameTimestamps.of(data)
+        if timestamps is None or timestamps.received is None:
+            return
+
+        if isinstance(data, dict):
+            time_cpu_cycles = data.get("time_cpu_cycles")
+        else:
+            time_cpu_cycles = getattr(data, "time_cpu_cycles", None)
+        if time_cpu_cycles is None:
+            return
+
+        set_timestamp(
+            data, "corrected", self.update(time_cpu_cycles, timestamps.received)
+        )
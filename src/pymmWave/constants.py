@@ -18,6 +18,30 @@ class TLV_type(Enum):
     MMWDEMO_OUTPUT_MSG_MAX= 10
 
 
+class ReadMode(Enum):
+    """How :obj:`IWR6843AOP<pymmWave.IWR6843AOP.IWR6843AOP>` reads the data port."""
+
+    ASYNC = 0
+    """Read with aioserial from within the event loop."""
+    THREAD = 1
+    """Read with blocking calls on a dedicated thread, which posts parsed frames to the event loop."""
+    SELECTOR = 2
+    """Register the data port with the event loop and only read when it is readable. Requires a port with a file descriptor, such as on Linux and MacOS."""
+
+
+class QueuePolicy(Enum):
+    """What happens to a new frame when the frame queue of a sensor is full."""
+
+    DROP_OLDEST = 0
+    """Discard the oldest queued frame to make room."""
+    DROP_NEWEST = 1
+    """Discard the new frame."""
+    BLOCK = 2
+    """Stop reading until a consumer makes room. No frames are lost in the queue, but the OS buffer of the port may overflow."""
+    COALESCE = 3
+    """Replace the most recently queued frame with the new one."""
+
+
 # Sleep value to allow for thread context switching.
 # Can reduce or increase, but frankly, I wouldn't unless you have a good reason.
 ASYNC_SLEEP: float = .000001
@@ -25,4 +49,9 @@ ASYNC_SLEEP: float = .000001
 # Straight up magic number from TI...
 MAGIC_NUMBER: bytes = b'\x02\x01\x04\x03\x06\x05\x08\x07'
 
+# Bounds for the total packet length in a frame header. Frames outside of these are considered corrupt.
+# Every TI frame header is at least 40 bytes, and the UART cannot carry more than a few KiB per frame at usual frame rates.
+MIN_PACKET_LEN: int = 40
+MAX_PACKET_LEN: int = 1 << 16
+
 EXAMPLE_CONFIG: list[str] = ['% ***************************************************************\n', '% Created for SDK ver:03.04\n', '% Created using Visualizer ver:3.5.0.0\n', '% Frequency:60\n', '% Platform:xWR68xx_AOP\n', '% Scene Classifier:best_range_res\n', '% Azimuth Resolution(deg):60 + 60\n', '% Range Resolution(m):0.044\n', '% Maximum unambiguous Range(m):9.02\n', '% Maximum Radial Velocity(m/s):1.21\n', '% Radial velocity resolution(m/s):0.16\n', '% Frame Duration(msec):50\n', '% RF calibration data:None\n', '% ***************************************************************\n', 'sensorStop\n', 'flushCfg\n', 'dfeDataOutputMode 1\n', 'channelCfg 15 7 0\n', 'adcCfg 2 1\n', 'adcbufCfg -1 0 1 1 1\n', 'profileCfg 0 60 975 7 57.14 0 0 70 1 256 5209 0 0 158\n', 'chirpCfg 0 0 0 0 0 0 0 1\n', 'frameCfg 0 0 16 0 40 1 0\n', 'lowPower 0 0\n', 'guiMonitor -1 1 1 0 0 0 1\n', 'cfarCfg -1 0 2 8 4 3 0 15 0\n', 'cfarCfg -1 1 0 4 2 3 1 15 1\n', 'multiObjBeamForming -1 1 0.5\n', 'clutterRemoval -1 0\n', 'calibDcRangeSig -1 0 -5 8 256\n', 'extendedMaxVelocity -1 0\n', 'lvdsStreamCfg -1 0 0 0\n', 'compRangeBiasAndRxChanPhase 0.0 1 0 -1 0 1 0 -1 0 1 0 -1 0 1 0 -1 0 1 0 -1 0 1 0 -1 0\n', 'measureRangeBiasAndRxChanPhase 0 1.5 0.2\n', 'CQRxSatMonitor 0 3 5 121 0\n', 'CQSigImgMonitor 0 127 4\n', 'analogMonitor 0 0\n', 'aoaFovCfg -1 -90 90 -90 90\n', 'cfarFovCfg -1 0 0 8.92\n', 'cfarFovCfg -1 1 -1.21 1.21\n', 'sensorStart\n']
\ No newline at end of file
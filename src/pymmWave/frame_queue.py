@@ -0,0 +1,153 @@
+from asyncio import Future, QueueEmpty, QueueFull, get_running_loop
+from collections import deque
+from typing import Deque, Generic, TypeVar
+
+from .constants import QueuePolicy
+
+T = TypeVar("T")
+
+
+class FrameQueue(Generic[T]):
+    """Bounded queue of frames with a configurable policy for when it is full.
+    Mirrors the interface of asyncio.Queue, and counts the frames it drops or overwrites. Not thread safe, only use it from the event loop.
+    """
+
+    def __init__(self, maxsize: int = 1, policy: QueuePolicy = QueuePolicy.DROP_OLDEST):
+        """Initialize the queue
+
+        Args:
+            maxsize (int, optional): Maximum number of queued frames. Defaults to 1.
+            policy (QueuePolicy, optional): What happens to a frame put into a full queue. Defaults to QueuePolicy.DROP_OLDEST.
+
+        Raises:
+            ValueError: If maxsize is smaller than 1.
+        """
+        if maxsize < 1:
+            raise ValueError("Queue size must be at least 1")
+
+        self.maxsize = maxsize
+        self.policy = policy
+
+        self.dropped: int = 0
+        """Number of frames discarded, either the oldest queued one (DROP_OLDEST) or the incoming one (DROP_NEWEST)."""
+        self.overwritten: int = 0
+        """Number of queued frames replaced by a newer frame."""
+
+        self._items: Deque[T] = deque()
+        self._getters: Deque[Future[None]] = deque()
+        self._putters: Deque[Future[None]] = deque()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def qsize(self) -> int:
+        """Number of queued frames."""
+        return len(self._items)
+
+    def empty(self) -> bool:
+        """True if no frames are queued."""
+        return not self._items
+
+    def full(self) -> bool:
+        """True if maxsize frames are queued."""
+        return len(self._items) >= self.maxsize
+
+    @staticmethod
+    def _wake_next(waiters: Deque[Future[None]]) -> None:
+        while waiters:
+            waiter = waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+
+    def put_nowait(self, item: T) -> None:
+        """Put a frame into the queue, applying the policy if it is full.
+
+        Args:
+            item (T): Frame to queue
+
+        Raises:
+            QueueFull: If the queue is full and the policy is QueuePolicy.BLOCK.
+        """
+        if self.full():
+            match self.policy:
+                case QueuePolicy.DROP_OLDEST:
+                    self._items.popleft()
+                    self.dropped += 1
+                case QueuePolicy.DROP_NEWEST:
+                    self.dropped += 1
+                    return
+                case QueuePolicy.COALESCE:
+                    self._items[-1] = item
+                    self.overwritten += 1
+                    return
+                case QueuePolicy.BLOCK:
+                    raise QueueFull()
+
+        self._items.append(item)
+        self._wake_next(self._getters)
+
+    async def put(self, item: T) -> None:
+        """Put a frame into the queue. With QueuePolicy.BLOCK, waits until there is room, otherwise never waits.
+
+        Args:
+            item (T): Frame to queue
+        """
+        if self.policy == QueuePolicy.BLOCK:
+            await self.wait_for_room()
+
+        self.put_nowait(item)
+
+    async def wait_for_room(self) -> None:
+        """Wait until the queue is not full."""
+        while self.full():
+            putter = get_running_loop().create_future()
+            self._putters.append(putter)
+            try:
+                await putter
+            except BaseException:
+                putter.cancel()
+                if not self.full() and not putter.cancelled():
+                    self._wake_next(self._putters)
+                raise
+
+    def get_nowait(self) -> T:
+        """Remove and return the oldest frame.
+
+        Returns:
+            T: Oldest queued frame
+
+        Raises:
+            QueueEmpty: If no frames are queued.
+        """
+        if not self._items:
+            raise QueueEmpty()
+
+        item = self._items.popleft()
+        self._wake_next(self._putters)
+        return item
+
+    def clear(self) -> None:
+        """Remove all queued frames."""
+        self._items.clear()
+        while self._putters:
+            self._wake_next(self._putters)
+
+    async def get(self) -> T:
+        """Remove and return the oldest frame, waiting until one is available.
+
+        Returns:
+            T: Oldest queued frame
+        """
+        while not self._items:
+            getter = get_running_loop().create_future()
+            self._getters.append(getter)
+            try:
+                await getter
+            except BaseException:
+                getter.cancel()
+                if self._items and not getter.cancelled():
+                    self._wake_next(self._getters)
+                raise
+
+        return self.get_nowait()
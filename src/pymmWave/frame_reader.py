@@ -0,0 +1,188 @@
+from dataclasses import dataclass
+from struct import Struct
+from time import monotonic
+from typing import Optional
+
+from .constants import MAGIC_NUMBER, MAX_PACKET_LEN, MIN_PACKET_LEN
+
+# Start of every TI frame: magic word, packet version, total packet length (including the magic word), platform and frame number.
+_FRAME_PREAMBLE = Struct("<8s4I")
+
+
+@dataclass
+class FrameStats:
+    """Counters describing the health of a frame stream."""
+
+    frames: int = 0
+    """Complete frames read."""
+    lost: int = 0
+    """Frames which never arrived, according to gaps in the frame numbers not explained by corrupt frames."""
+    corrupt: int = 0
+    """Frames with an invalid header, or which the parser failed on."""
+    discarded: int = 0
+    """Frames the parser chose to discard."""
+    resynced: int = 0
+    """Times bytes had to be skipped to find the next magic word."""
+
+
+class FrameReader:
+    """Splits the raw byte stream of a data port into complete frames.
+    Data is read in large chunks into a reusable buffer, the magic word is located with a single search, and
+    complete frames are handed out as memoryviews into that buffer without copying.
+    """
+
+    def __init__(self, capacity: int = 1 << 16, magic: bytes = MAGIC_NUMBER):
+        """Initialize the reader
+
+        Args:
+            capacity (int, optional): Initial size of the buffer in bytes. The buffer grows if a frame does not fit. Defaults to 64 KiB.
+            magic (bytes, optional): Magic word marking the start of a frame. Defaults to MAGIC_NUMBER.
+        """
+        self._magic = magic
+        self._buf = bytearray(capacity)
+        self._view = memoryview(self._buf)
+        self._start = 0  # First unconsumed byte
+        self._end = 0  # One past the last received byte
+        self._scanned = 0  # Bytes after _start already searched for a magic word
+        self._skipping = False
+        self._last_frame_number: Optional[int] = None
+        # Frames skipped as corrupt since the last complete frame
+        self._corrupt_since_last = 0
+        self._found_at: Optional[float] = (
+            None  # When the magic word at _start was found
+        )
+
+        self.frame_time: Optional[float] = None
+        """Monotonic time at which the magic word of the frame last returned by :meth:`next_frame` was found."""
+
+        self.stats = FrameStats()
+        """Counters for the frames read so far."""
+
+    def __len__(self) -> int:
+        """Number of buffered bytes which have not been handed out as a frame yet."""
+        return self._end - self._start
+
+    def feed(self, data: bytes) -> None:
+        """Append received bytes to the buffer.
+        Frames previously returned by :meth:`next_frame` are invalidated by this call.
+
+        Args:
+            data (bytes): Raw bytes from the data port
+        """
+        n = len(data)
+        if self._end + n > len(self._buf):
+            self._make_room(n)
+        self._view[self._end : self._end + n] = data
+        self._end += n
+
+    def _make_room(self, incoming: int) -> None:
+        """Move pending bytes to the front of the buffer, growing it if they still would not fit."""
+        pending = self._end - self._start
+        needed = pending + incoming
+        if needed > len(self._buf):
+            # A new buffer is allocated instead of resizing, since frames handed out may still reference the old one.
+            new_buf = bytearray(max(needed, 2 * len(self._buf)))
+            new_buf[:pending] = self._view[self._start : self._end]
+            self._buf = new_buf
+            self._view = memoryview(new_buf)
+        else:
+            # Only a partial frame is pending here, so this copy is small.
+            self._buf[:pending] = bytes(self._view[self._start : self._end])
+        self._start = 0
+        self._end = pending
+
+    def _skip_to(self, position: int) -> None:
+        """Discard everything before position while searching for the next frame."""
+        if position > self._start:
+            self._skipping = True
+            self._found_at = None
+        self._start = position
+        self._scanned = 0
+
+    def next_frame(self) -> Optional[memoryview]:
+        """Return the next complete frame in the buffer, if there is one.
+        Bytes before the magic word are discarded. Frames with a total packet length out of bounds, or containing another magic word, are counted as corrupt and skipped.
+
+        Returns:
+            Optional[memoryview]: View of the frame starting with the magic word, valid until the next call to :meth:`feed`. None if no complete frame is buffered.
+        """
+        magic_len = len(self._magic)
+        while True:
+            idx = self._buf.find(self._magic, self._start, self._end)
+            if idx < 0:
+                # Keep the tail in case it is the beginning of a magic word
+                self._skip_to(max(self._start, self._end - magic_len + 1))
+                return None
+
+            if idx != self._start:
+                self._skip_to(idx)
+            if self._found_at is None:
+                self._found_at = monotonic()
+
+            if self._end - idx < _FRAME_PREAMBLE.size:
+                return None
+
+            _, _, total_packet_len, _, frame_number = _FRAME_PREAMBLE.unpack_from(
+                self._buf, idx
+            )
+            if not MIN_PACKET_LEN <= total_packet_len <= MAX_PACKET_LEN:
+                # Corrupt header, look for the next magic word instead of waiting for a garbage length
+                self.stats.corrupt += 1
+                self._corrupt_since_last += 1
+                self._skip_to(idx + 1)
+                continue
+
+            # Another magic word within the frame means this frame was cut short, resync to it
+            inner = self._buf.find(
+                self._magic,
+                idx + max(magic_len, self._scanned),
+                min(self._end, idx + total_packet_len),
+            )
+            if inner >= 0:
+                self.stats.corrupt += 1
+                self._corrupt_since_last += 1
+                self._skip_to(inner)
+                continue
+
+            if self._end - idx < total_packet_len:
+                # A magic word may still start within the last bytes
+                self._scanned = max(0, self._end - idx - magic_len + 1)
+                return None
+
+            if self._skipping:
+                self.stats.resynced += 1
+                self._skipping = False
+            self._count_frame(frame_number)
+
+            self.frame_time = self._found_at
+            self._found_at = None
+            self._start = idx + total_packet_len
+            self._scanned = 0
+            return self._view[idx : idx + total_packet_len]
+
+    def _count_frame(self, frame_number: int) -> None:
+        """Update the frame counters with a newly read frame. Frames skipped as corrupt in between did arrive, so they are not counted as lost."""
+        self.stats.frames += 1
+        if (
+            self._last_frame_number is not None
+            and frame_number > self._last_frame_number
+        ):
+            gap = frame_number - self._last_frame_number - 1
+            self.stats.lost += max(0, gap - self._corrupt_since_last)
+        self._last_frame_number = frame_number
+        self._corrupt_since_last = 0
+
+    def bytes_missing(self) -> int:
+        """Minimum number of bytes that still have to be fed before the next frame can be complete.
+
+        Returns:
+            int: Number of bytes, at least 1.
+        """
+        available = self._end - self._start
+        if available >= _FRAME_PREAMBLE.size and self._buf.startswith(
+            self._magic, self._start
+        ):
+            total_packet_len = _FRAME_PREAMBLE.unpack_from(self._buf, self._start)[2]
+            if MIN_PACKET_LEN <= total_packet_len <= MAX_PACKET_LEN:
+                return max(1, total_packet_len - available)
+        return max(1, _FRAME_PREAMBLE.size - available)
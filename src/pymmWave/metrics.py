@@ -0,0 +1,244 @@
+from collections import deque
+from math import ceil
+from threading import Lock
+from time import monotonic
+from typing import Any, Deque, Dict, Optional
+
+
+class LatencyHistogram:
+    """Histogram of durations with a bounded relative error, in the style of HdrHistogram.
+    Durations are counted in nanoseconds. Values below 2**significant_bits are counted exactly, above that every power of two is split into 2**(significant_bits - 1) buckets.
+    Recording takes constant time and the memory is fixed. Meant to be recorded from a single thread, and read from any.
+    """
+
+    def __init__(self, significant_bits: int = 6, max_seconds: float = 60.0):
+        """Initialize an empty histogram
+
+        Args:
+            significant_bits (int, optional): Bits of precision kept per value. Values are off by at most 2**(1 - significant_bits) relative. Defaults to 6, about 3%.
+            max_seconds (float, optional): Largest duration told apart. Longer durations are counted as this. Defaults to 60.0.
+        """
+        self._bits = significant_bits
+        self._sub = 1 << significant_bits
+        self._half = self._sub >> 1
+        self._limit_ns = int(max_seconds * 1e9)
+        self._counts = [0] * (self._index(self._limit_ns) + 1)
+
+        self.count: int = 0
+        """Number of recorded durations"""
+        self._sum_ns = 0
+        self._min_ns: Optional[int] = None
+        self._max_ns_seen = 0
+
+    def _index(self, ns: int) -> int:
+        """Bucket of a value."""
+        if ns < self._sub:
+            return ns
+        shift = ns.bit_length() - self._bits
+        return shift * self._half + (ns >> shift)
+
+    def _value(self, index: int) -> float:
+        """Middle of the values counted in a bucket."""
+        if index < self._sub:
+            return index
+        shift = index // self._half - 1
+        return ((index - shift * self._half) << shift) + (1 << shift) / 2
+
+    def record(self, seconds: float) -> None:
+        """Record a duration.
+
+        Args:
+            seconds (float): Duration in seconds, negative durations count as 0
+        """
+        ns = max(0, int(seconds * 1e9))
+        self._counts[self._index(min(ns, self._limit_ns))] += 1
+        self.count += 1
+        self._sum_ns += ns
+        if self._min_ns is None or ns < self._min_ns:
+            self._min_ns = ns
+        if ns > self._max_ns_seen:
+            self._max_ns_seen = ns
+
+    @property
+    def min(self) -> Optional[float]:
+        """Shortest recorded duration in seconds, None if nothing was recorded."""
+        return self._min_ns / 1e9 if self._min_ns is not None else None
+
+    @property
+    def max(self) -> Optional[float]:
+        """Longest recorded duration in seconds, None if nothing was recorded."""
+        return self._max_ns_seen / 1e9 if self.count else None
+
+    @property
+    def mean(self) -> Optional[float]:
+        """Mean of the recorded durations in seconds, None if nothing was recorded."""
+        return self._sum_ns / self.count / 1e9 if self.count else None
+
+    def percentile(self, percentile: float) -> Optional[float]:
+        """Duration which the given percentage of the recorded durations do not exceed.
+
+        Args:
+            percentile (float): Percentage between 0 and 100
+
+        Returns:
+            Optional[float]: Duration in seconds, None if nothing was recorded.
+        """
+        counts = list(self._counts)
+        total = sum(counts)
+        if not total:
+            return None
+
+        rank = max(1, ceil(percentile / 100 * total))
+        seen = 0
+        for index, n in enumerate(counts):
+            seen += n
+            if seen >= rank:
+                return min(self._value(index), self._max_ns_seen) / 1e9
+        return self.max
+
+    def summary(self) -> Dict[str, Optional[float]]:
+        """Returns the count, mean, 50th, 90th, 99th and 99.9th percentile and maximum, durations in seconds."""
+        return {
+            "count": self.count,
+            "mean": self.mean,
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p99": self.percentile(99),
+            "p999": self.percentile(99.9),
+            "max": self.max,
+        }
+
+    def reset(self) -> None:
+        """Forget all recorded durations."""
+        self._counts = [0] * len(self._counts)
+        self.count = 0
+        self._sum_ns = 0
+        self._min_ns = None
+        self._max_ns_seen = 0
+
+
+class RateMeter:
+    """Counts events, and their rate per second over a sliding window of whole seconds. Thread safe."""
+
+    def __init__(self, window: int = 5):
+        """Initialize the meter
+
+        Args:
+            window (int, optional): Number of completed seconds the rate is averaged over. Defaults to 5.
+        """
+        self.window = window
+        self.total: int = 0
+        """Number of events counted so far"""
+        self._buckets: Deque[list[int]] = deque()  # Second and number of events in it
+        self._lock = Lock()
+
+    def add(self, n: int = 1) -> None:
+        """Count events.
+
+        Args:
+            n (int, optional): Number of events. Defaults to 1.
+        """
+        second = int(monotonic())
+        with self._lock:
+            self.total += n
+            if self._buckets and self._buckets[-1][0] == second:
+                self._buckets[-1][1] += n
+                return
+
+            self._buckets.append([second, n])
+            while self._buckets[0][0] < second - self.window:
+                self._buckets.popleft()
+
+    def rate(self) -> float:
+        """Events per second over the last window completed seconds."""
+        now = int(monotonic())
+        with self._lock:
+            events = sum(
+                n for second, n in self._buckets if now - self.window <= second < now
+            )
+        return events / self.window
+
+    def reset(self) -> None:
+        """Forget all counted events."""
+        with self._lock:
+            self.total = 0
+            self._buckets.clear()
+
+
+class SensorMetrics:
+    """Latency of every stage of reading a sensor, and its throughput. Can be queried while the sensor runs.
+    The stages of a frame, each recorded in a :obj:`LatencyHistogram`:
+
+    - sync_scan: searching the received data for the magic word and frame header, or waiting for the magic word with parsers which read the port themselves
+    - read: receiving the rest of the frame after its magic word was found
+    - parse: parsing the frame, including the transform. With a parser pool, from handing the frame to the pool until the result is back.
+    - transform: decoding and transforming the points into dicts, for parsers with a columnar form like AreaScannerParser. Columnar frames are decoded by their consumers, which is not recorded.
+      With a parser pool, the time the workers spent decoding and transforming into columns, plus building the dicts unless the parser is columnar.
+    - queue_wait: from parsing until a consumer took the frame from a queue
+    """
+
+    def __init__(self, window: int = 5):
+        """Initialize empty metrics
+
+        Args:
+            window (int, optional): Number of seconds the rates are averaged over. Defaults to 5.
+        """
+        self.sync_scan = LatencyHistogram()
+        self.read = LatencyHistogram()
+        self.parse = LatencyHistogram()
+        self.transform = LatencyHistogram()
+        self.queue_wait = LatencyHistogram()
+
+        self.frames = RateMeter(window)
+        """Frames parsed"""
+        self.bytes = RateMeter(window)
+        """Bytes received, not counted with parsers which read the port themselves"""
+        self.points = RateMeter(window)
+        """Dynamic and static points in the frames parsed"""
+
+    def count_frame(self, data: Any) -> None:
+        """Count a parsed frame, and its points according to the num_detected_obj and num_static_detected_obj fields of its header.
+
+        Args:
+            data (Any): Parsed frame, a dict or an object with header fields
+        """
+        if isinstance(data, dict):
+            points = data.get("num_detected_obj", 0) + data.get(
+                "num_static_detected_obj", 0
+            )
+        else:
+            points = getattr(data, "num_detected_obj", 0) + getattr(
+                data, "num_static_detected_obj", 0
+            )
+        self.frames.add()
+        self.points.add(points)
+
+    def summary(self) -> Dict[str, Any]:
+        """Returns a summary of every stage and the current rates.
+
+        Returns:
+            Dict[str, Any]: Summary of the histogram of every stage, and frames, bytes and points per second
+        """
+        return {
+            "sync_scan": self.sync_scan.summary(),
+            "read": self.read.summary(),
+            "parse": self.parse.summary(),
+            "transform": self.transform.summary(),
+            "queue_wait": self.queue_wait.summary(),
+            "frames_per_second": self.frames.rate(),
+            "bytes_per_second": self.bytes.rate(),
+            "points_per_second": self.points.rate(),
+        }
+
+    def reset(self) -> None:
+        """Forget everything recorded so far."""
+        for histogram in (
+            self.sync_scan,
+            self.read,
+            self.parse,
+            self.transform,
+            self.queue_wait,
+        ):
+            histogram.reset()
+        for meter in (self.frames, self.bytes, self.points):
+            meter.reset()
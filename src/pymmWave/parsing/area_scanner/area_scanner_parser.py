@@ -1,204 +1,217 @@
 import struct
-from typing import Dict
+from mmap import mmap
+from typing import Dict, Optional
 
-from aioserial import AioSerial
+import numpy as np
 
-from ...utils import transform_direction, transform_point, transform_spherical_point
-from ..sensor_parser import SensorParser
+from ...buffer_pool import BufferPool
+from ...utils import rotation_matrix
+from ..sensor_parser import PacketParser
+from ..tlv import TlvSchema
+from .batch import parse_batch
+from .models import AREA_SCANNER_TLVS, AreaScannerBatch, AreaScannerFrame
 
 
-class AreaScannerParser(SensorParser):
+class AreaScannerParser(PacketParser):
     """
     Parsing data in the format of the area scanner example project.<br/>
     Refer to the <a href="https://dev.ti.com/tirex/explore/content/mmwave_industrial_toolbox_4_12_1/labs/Area_Scanner/docs/area_scanner_users_guide.html#data-output-format">documentation</a> for more information.
     """
 
-    height: float = 0
-    """Height of the sensor from the ground in meters"""
-    elevation_tilt: float = 0
-    """Elevation tilt of the sensor in radians."""
-
-    async def parse(self, s: AioSerial) -> Dict | None:
-
-        result = {}
-
-        data = await s.read_async(8)
-
-        packet_version, total_packet_len = struct.unpack("<2I", data)
-
-        # Version
-        result["major_num"] = (packet_version >> 24) & 0xFF
-        result["minor_num"] = (packet_version >> 16) & 0xFF
-        result["bugfix_num"] = (packet_version >> 8) & 0xFF
-        result["build_num"] = packet_version & 0xFF
-
-        # Total packet length
-        result["total_packet_len"] = total_packet_len
-
-        data = await s.read_async(total_packet_len - 8)  # Read the rest of the packet
+    tlv_schemas: Dict[int, TlvSchema] = AREA_SCANNER_TLVS
+    """Schemas of the TLVs this parser decodes. TLVs of other types are skipped."""
+    buffer_pool: Optional[BufferPool] = None
+    """Pool for the packet copies of parsed frames. Without it, every frame allocates its own copy."""
+    float32: bool = False
+    """Compute and keep points and tracked objects in float32, the precision the sensor measures in, instead of float64. Halves the memory of frames in columnar form."""
+    columnar: bool = False
+    """Return :obj:`AreaScannerFrame<pymmWave.parsing.area_scanner.models.AreaScannerFrame>` instead of a dict from parse and parse_packet, so sensors hand out frames holding NumPy arrays."""
+
+    def __init__(
+        self, height: float = 0, elevation_tilt: float = 0, azimuth_tilt: float = 0
+    ):
+        """Initialize the parser with the placement of the sensor, which is applied to every point.
+
+        Args:
+            height (float, optional): Height of the sensor from the ground in meters. Defaults to 0.
+            elevation_tilt (float, optional): Elevation tilt of the sensor in radians. Defaults to 0.
+            azimuth_tilt (float, optional): Azimuth tilt of the sensor in radians. Defaults to 0.
+        """
+        self._height = float(height)
+        self._elevation_tilt = float(elevation_tilt)
+        self._azimuth_tilt = float(azimuth_tilt)
+        self._update_rotation()
+
+    def _update_rotation(self) -> None:
+        """Rebuild the rotation for the tilt of the sensor. Frames keep a reference to it, so it is replaced rather than modified."""
+        rotation = rotation_matrix(self._elevation_tilt, self._azimuth_tilt)
+        rotation.flags.writeable = False
+        self._rotation = rotation
+        self._rotation32 = rotation.astype(np.float32)
+        self._rotation32.flags.writeable = False
+
+    @property
+    def height(self) -> float:
+        """Height of the sensor from the ground in meters"""
+        return self._height
+
+    @height.setter
+    def height(self, height: float) -> None:
+        self._height = float(height)
+
+    @property
+    def elevation_tilt(self) -> float:
+        """Elevation tilt of the sensor in radians."""
+        return self._elevation_tilt
+
+    @elevation_tilt.setter
+    def elevation_tilt(self, elevation_tilt: float) -> None:
+        self._elevation_tilt = float(elevation_tilt)
+        self._update_rotation()
+
+    @property
+    def azimuth_tilt(self) -> float:
+        """Azimuth tilt of the sensor in radians."""
+        return self._azimuth_tilt
+
+    @azimuth_tilt.setter
+    def azimuth_tilt(self, azimuth_tilt: float) -> None:
+        self._azimuth_tilt = float(azimuth_tilt)
+        self._update_rotation()
+
+    @property
+    def rotation(self) -> np.ndarray:
+        """Read-only 3x3 rotation for the tilt of the sensor, computed once per change of the tilt. Points are rotated by it, then shifted up by height."""
+        return self._rotation
+
+    def parse_packet(self, packet: memoryview) -> Dict | AreaScannerFrame | None:
+        frame = self.parse_frame(packet)
+        if frame is None or self.columnar:
+            return frame
+        return frame.to_dict()
+
+    def parse_frame(self, packet: memoryview) -> AreaScannerFrame | None:
+        """Parse a complete packet into columnar form. The frame does not reference the packet, so the packet may be reused afterwards.
+
+        Args:
+            packet (memoryview): Packet bytes, starting right after the magic word
+
+        Returns:
+            AreaScannerFrame | None: Parsed frame, or None if the packet is discarded
+
+        Raises:
+            ValueError: If the TLVs do not fit the packet.
+        """
+        packet_version, total_packet_len = struct.unpack("<2I", packet[:8])
+
+        data = packet[8:]
 
         offset = 28
         (
-            result["platform_type"],  # Platform type
-            result["frame_number"],  # Frame number
-            result["time_cpu_cycles"],  # Time in cycles when the message was created
-            result["num_detected_obj"],  # Number of detected objects
-            result["num_tlvs"],  # Number of TLVs
-            result["subframe_number"],  # Subframe number
-            result["num_static_detected_obj"],  # Number of static detected objects
+            platform_type,  # Platform type
+            frame_number,  # Frame number
+            time_cpu_cycles,  # Time in cycles when the message was created
+            num_detected_obj,  # Number of detected objects
+            num_tlvs,  # Number of TLVs
+            subframe_number,  # Subframe number
+            num_static_detected_obj,  # Number of static detected objects
         ) = struct.unpack("<7I", data[:offset])
 
-        if result["num_tlvs"] != 0:
-            result["dynamic_points"] = []
-
-            # Parse TLVs
-            for _ in range(result["num_tlvs"]):
-                tlv_type, tlv_length = struct.unpack("<2I", data[offset : offset + 8])
-                offset += 8
-                tlv_payload = data[offset : offset + tlv_length]
-                offset += tlv_length
-
-                match tlv_type:
-                    case 1:
-                        result["dynamic_points"] = []
-                        for i in range(0, len(tlv_payload), 16):
-                            vals = tlv_payload[i : i + 16]
-
-                            raw_range, raw_angle, raw_elev, raw_doppler = struct.unpack(
-                                "<4f", vals
-                            )
-
-                            # Transformed spherical coordinates
-                            pos = transform_spherical_point(
-                                raw_range,
-                                raw_angle,
-                                raw_elev,
-                                self.height,
-                                self.elevation_tilt,
-                            )
-
-                            result["dynamic_points"].append(
-                                {
-                                    "target_id": 255,  # Default value
-                                    "range": pos[0],
-                                    "angle": pos[1],
-                                    "elev": pos[2],
-                                    "doppler": raw_doppler,
-                                    "snr": 0,  # Default value
-                                    "noise": 0,  # Default value
-                                }
-                            )
-                    case 7:
-                        j = 0
-                        for i in range(0, len(tlv_payload), 4):
-                            vals = tlv_payload[i : i + 4]
-                            (
-                                result["dynamic_points"][j]["snr"],
-                                result["dynamic_points"][j]["noise"],
-                            ) = struct.unpack("<2H", vals)
-                            j += 1
-                    case 8:
-                        result["static_points"] = []
-                        for i in range(0, len(tlv_payload), 16):
-                            vals = tlv_payload[i : i + 16]
-
-                            raw_x, raw_y, raw_z, raw_doppler = struct.unpack(
-                                "<4f", vals
-                            )
-
-                            # Transformed position
-                            pos = transform_point(
-                                raw_x,
-                                raw_y,
-                                raw_z,
-                                self.height,
-                                self.elevation_tilt,
-                            )
-
-                            result["static_points"].append(
-                                {
-                                    "x": pos[0],
-                                    "y": pos[1],
-                                    "z": pos[2],
-                                    "doppler": raw_doppler,
-                                    "snr": 0,  # Default value
-                                    "noise": 0,  # Default value
-                                }
-                            )
-                    case 9:
-                        j = 0
-                        for i in range(0, len(tlv_payload), 4):
-                            vals = tlv_payload[i : i + 4]
-                            (
-                                result["static_points"][j]["snr"],
-                                result["static_points"][j]["noise"],
-                            ) = struct.unpack("<2H", vals)
-                            j += 1
-                    case 10:
-                        result["tracked_objects"] = []
-                        for i in range(0, len(tlv_payload), 40):
-                            vals = tlv_payload[i : i + 40]
-
-                            target_id = int.from_bytes(vals[0:4], byteorder="little")
-                            (
-                                raw_pos_x,
-                                raw_pos_y,
-                                raw_vel_x,
-                                raw_vel_y,
-                                raw_accel_x,
-                                raw_accel_y,
-                                raw_pos_z,
-                                raw_vel_z,
-                                raw_accel_z,
-                            ) = struct.unpack("<9f", vals[4:40])
-
-                            # Transformed position
-                            pos = transform_point(
-                                raw_pos_x,
-                                raw_pos_y,
-                                raw_pos_z,
-                                self.height,
-                                self.elevation_tilt,
-                            )
-
-                            # Transformed velocity
-                            vel = transform_direction(
-                                raw_vel_x,
-                                raw_vel_y,
-                                raw_vel_z,
-                                self.elevation_tilt,
-                            )
-
-                            # Transformed acceleration
-                            accel = transform_direction(
-                                raw_accel_x,
-                                raw_accel_y,
-                                raw_accel_z,
-                                self.elevation_tilt,
-                            )
-
-                            result["tracked_objects"].append(
-                                {
-                                    "target_id": target_id,
-                                    "pos_x": pos[0],
-                                    "pos_y": pos[1],
-                                    "vel_x": vel[0],
-                                    "vel_y": vel[1],
-                                    "acc_x": accel[0],
-                                    "acc_y": accel[1],
-                                    "pos_z": pos[2],
-                                    "vel_z": vel[2],
-                                    "acc_z": accel[2],
-                                }
-                            )
-                    case 11:
-                        for i in range(len(tlv_payload)):
-                            result["dynamic_points"][i]["target_id"] = int.from_bytes(
-                                [tlv_payload[i]], byteorder="little"
-                            )
-                    case _:
-                        # Discard the packet or else it will mess up the parsing
-                        print(f"Unknown TLV type: {tlv_type}. Discarding packet")
-                        return None
-
-        return result
+        # Index the TLVs and check they fit, decoding happens when the points are accessed
+        schemas = self.tlv_schemas
+        tlvs: Dict[int, tuple[int, int]] = {}
+        counts: Dict[int, int] = {}
+        for _ in range(num_tlvs):
+            tlv_type, tlv_length = struct.unpack("<2I", data[offset : offset + 8])
+            offset += 8
+            if offset + tlv_length > len(data):
+                raise ValueError(f"TLV of {tlv_length} bytes exceeds the packet")
+
+            # Offsets are relative to the start of the packet
+            tlvs[tlv_type] = (offset + 8, tlv_length)
+            offset += tlv_length
+
+            # Unknown TLVs are skipped by their length
+            schema = schemas.get(tlv_type)
+            if schema is not None:
+                if tlv_length % schema.dtype.itemsize:
+                    raise ValueError(f"TLV {tlv_type} has a partial record")
+                counts[tlv_type] = tlv_length // schema.dtype.itemsize
+
+        # Like side info for points, some TLVs add fields to the records of another
+        for tlv_type, count in counts.items():
+            annotates = schemas[tlv_type].annotates
+            if annotates is not None and count > counts.get(annotates, 0):
+                raise ValueError(
+                    f"TLV {tlv_type} has more records than TLV {annotates}"
+                )
+
+        return AreaScannerFrame(
+            # Version
+            major_num=(packet_version >> 24) & 0xFF,
+            minor_num=(packet_version >> 16) & 0xFF,
+            bugfix_num=(packet_version >> 8) & 0xFF,
+            build_num=packet_version & 0xFF,
+            total_packet_len=total_packet_len,
+            platform_type=platform_type,
+            frame_number=frame_number,
+            time_cpu_cycles=time_cpu_cycles,
+            num_detected_obj=num_detected_obj,
+            num_tlvs=num_tlvs,
+            subframe_number=subframe_number,
+            num_static_detected_obj=num_static_detected_obj,
+            _packet=self._copy_packet(packet[: 8 + offset]),
+            _length=8 + offset,
+            _tlvs=tlvs,
+            _schemas=schemas,
+            _rotation=self._rotation32 if self.float32 else self._rotation,
+            _height=self._height,
+            _pool=self.buffer_pool,
+        )
+
+    def parse_batch(
+        self, data: bytes | bytearray | memoryview | mmap
+    ) -> AreaScannerBatch:
+        """Parse all frames of a capture file or raw byte stream at once, for offline processing.
+        Every step runs on all frames together, and the points of all frames end up in one set of columns instead of a dict per point.
+        Frames are checked like parse_packet does, and corrupt frames are left out. Only the TLVs of the Area Scanner firmware are decoded.
+
+        Args:
+            data (bytes | bytearray | memoryview | mmap): Contents of a capture file written by :obj:`CaptureWriter<pymmWave.capture.CaptureWriter>`, or raw bytes from the data port
+
+        Returns:
+            AreaScannerBatch: Parsed frames in CSR layout
+
+        Raises:
+            ValueError: If the schema of an Area Scanner TLV was replaced with register_tlv.
+
+        Example:
+            >>> with open("run.cap", "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+            ...     batch = parser.parse_batch(m)
+            >>> batch.dynamic_points.x[batch.dynamic_offsets[5] : batch.dynamic_offsets[6]]
+        """
+        return parse_batch(
+            data,
+            self.tlv_schemas,
+            self._rotation32 if self.float32 else self._rotation,
+            self._height,
+        )
+
+    def _copy_packet(self, packet: memoryview) -> bytes | bytearray:
+        """Copy a packet into a buffer from the pool if there is one and the packet fits."""
+        pool = self.buffer_pool
+        if pool is None or len(packet) > pool.max_size:
+            return bytes(packet)
+
+        buf = pool.acquire(len(packet))
+        buf[: len(packet)] = packet
+        return buf
+
+    def register_tlv(self, tlv_type: int, schema: TlvSchema) -> None:
+        """Decode TLVs of a type, or replace how they are decoded. Only affects this parser.
+
+        Args:
+            tlv_type (int): TLV type
+            schema (TlvSchema): Layout and transform of the TLV
+        """
+        self.tlv_schemas = {**self.tlv_schemas, tlv_type: schema}
@@ -0,0 +1,258 @@
+import struct
+from mmap import mmap
+from typing import Dict
+
+import numpy as np
+
+from ...capture import CAPTURE_MAGIC, index_capture
+from ...constants import MAGIC_NUMBER, MAX_PACKET_LEN, MIN_PACKET_LEN
+from ..tlv import TlvSchema
+from .models import (
+    AREA_SCANNER_TLVS,
+    FRAME_HEADER_DTYPE,
+    AreaScannerBatch,
+    DynamicPoints,
+    StaticPoints,
+    TrackedObjects,
+)
+
+_TLV_HEADER_DTYPE = np.dtype([("type", "<u4"), ("length", "<u4")])
+
+# Magic word and header, the smallest frame the parser accepts
+_MIN_FRAME_LEN = len(MAGIC_NUMBER) + FRAME_HEADER_DTYPE.itemsize
+
+
+def _gather(raw: np.ndarray, offsets: np.ndarray, dtype: np.dtype) -> np.ndarray:
+    """Read one record of dtype at every byte offset into raw."""
+    if not len(offsets):
+        return np.empty(0, dtype)
+    return raw[offsets[:, None] + np.arange(dtype.itemsize)].view(dtype).reshape(-1)
+
+
+def _concat(
+    raw: np.ndarray, offsets: np.ndarray, lengths: np.ndarray, dtype: np.dtype
+) -> np.ndarray:
+    """Concatenate the byte ranges of raw at offsets into one array of records of dtype."""
+    if not len(offsets):
+        return np.empty(0, dtype)
+    return np.concatenate(
+        [raw[o : o + n] for o, n in zip(offsets.tolist(), lengths.tolist())]
+    ).view(dtype)
+
+
+def _index_stream(data: bytes | bytearray | mmap) -> tuple[list[int], list[int], int]:
+    """Locate the frames of a raw byte stream, skipping and counting corrupt frames like :obj:`FrameReader<pymmWave.frame_reader.FrameReader>` does.
+
+    Returns:
+        tuple[list[int], list[int], int]: Offset and total packet length of every frame, and the number of corrupt frames.
+    """
+    starts: list[int] = []
+    lengths: list[int] = []
+    corrupt = 0
+    end = len(data)
+    pos = data.find(MAGIC_NUMBER)
+    while 0 <= pos and pos + len(MAGIC_NUMBER) + 8 <= end:
+        total_packet_len = struct.unpack_from("<I", data, pos + 12)[0]
+        if not MIN_PACKET_LEN <= total_packet_len <= MAX_PACKET_LEN:
+            corrupt += 1
+            pos = data.find(MAGIC_NUMBER, pos + 1)
+            continue
+
+        # Another magic word within the frame means this frame was cut short
+        inner = data.find(
+            MAGIC_NUMBER, pos + len(MAGIC_NUMBER), min(end, pos + total_packet_len)
+        )
+        if inner >= 0:
+            corrupt += 1
+            pos = inner
+            continue
+
+        if pos + total_packet_len > end:
+            break  # Incomplete frame at the end
+
+        starts.append(pos)
+        lengths.append(total_packet_len)
+        pos = data.find(MAGIC_NUMBER, pos + total_packet_len)
+    return starts, lengths, corrupt
+
+
+def _last_per_frame(frames: np.ndarray, *columns: np.ndarray) -> tuple[np.ndarray, ...]:
+    """Keep the last entry of every frame, in frame order. Like the parser, a later TLV replaces an earlier one of the same type."""
+    _, last = np.unique(frames[::-1], return_index=True)
+    keep = len(frames) - 1 - last
+    return (frames[keep],) + tuple(c[keep] for c in columns)
+
+
+def _align(
+    records: np.ndarray,
+    frames: np.ndarray,
+    counts: np.ndarray,
+    offsets: np.ndarray,
+    fill: int,
+) -> np.ndarray:
+    """Place the records of a TLV annotating another TLV next to the records they annotate. Records without an annotation get fill."""
+    aligned = np.zeros(offsets[-1], records.dtype)
+    if fill:
+        aligned[:] = fill
+    first = np.cumsum(counts) - counts
+    aligned[np.arange(len(records)) + np.repeat(offsets[frames] - first, counts)] = (
+        records
+    )
+    return aligned
+
+
+def parse_batch(
+    data: bytes | bytearray | memoryview | mmap,
+    schemas: Dict[int, TlvSchema],
+    rotation: np.ndarray,
+    height: float,
+) -> AreaScannerBatch:
+    """Parse all frames of a capture file or raw byte stream at once. See :meth:`AreaScannerParser.parse_batch<pymmWave.parsing.area_scanner.area_scanner_parser.AreaScannerParser.parse_batch>`."""
+    # The TLVs are decoded with the Area Scanner layouts, so they must also be checked with them
+    for tlv_type, schema in AREA_SCANNER_TLVS.items():
+        if schemas.get(tlv_type) != schema:
+            raise ValueError(
+                f"The parser overrides the schema of TLV {tlv_type}, which parse_batch cannot decode"
+            )
+
+    # Locate the frames
+    timestamps_ns = None
+    if bytes(data[: len(CAPTURE_MAGIC)]) == CAPTURE_MAGIC:
+        records = np.array(index_capture(data), np.int64).reshape(-1, 3)
+        timestamps_ns, starts, lengths = records.T
+        corrupt = 0
+    else:
+        if isinstance(data, memoryview):
+            data = data.tobytes()  # For find
+        stream_starts, stream_lengths, corrupt = _index_stream(data)
+        starts = np.array(stream_starts, np.int64)
+        lengths = np.array(stream_lengths, np.int64)
+
+    raw = np.frombuffer(data, np.uint8)
+
+    # Check the magic word and length of every frame, and read their headers
+    valid = lengths >= _MIN_FRAME_LEN
+    valid[valid] = _gather(
+        raw, starts[valid], np.dtype((np.void, len(MAGIC_NUMBER)))
+    ) == np.void(MAGIC_NUMBER)
+    starts, lengths = starts[valid], lengths[valid]
+    if timestamps_ns is not None:
+        timestamps_ns = timestamps_ns[valid]
+    corrupt += int(np.count_nonzero(~valid))
+
+    headers = _gather(raw, starts + len(MAGIC_NUMBER), FRAME_HEADER_DTYPE)
+    total_packet_len = headers["total_packet_len"].astype(np.int64)
+    valid = (
+        (total_packet_len >= max(MIN_PACKET_LEN, _MIN_FRAME_LEN))
+        & (total_packet_len <= MAX_PACKET_LEN)
+        & (total_packet_len <= lengths)
+    )
+
+    # Walk the TLVs of all frames at once, taking one TLV of every frame per step
+    num_tlvs = headers["num_tlvs"].astype(np.int64)
+    ends = starts + total_packet_len
+    pos = starts + _MIN_FRAME_LEN
+    entries: list[tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]] = []
+    step = 0
+    active = np.flatnonzero(valid & (num_tlvs > 0))
+    while len(active):
+        p = pos[active]
+        fits = p + _TLV_HEADER_DTYPE.itemsize <= ends[active]
+        valid[active[~fits]] = False
+        active, p = active[fits], p[fits]
+
+        tlv_headers = _gather(raw, p, _TLV_HEADER_DTYPE)
+        p += _TLV_HEADER_DTYPE.itemsize
+        tlv_lengths = tlv_headers["length"].astype(np.int64)
+        fits = p + tlv_lengths <= ends[active]
+        valid[active[~fits]] = False
+        active, p = active[fits], p[fits]
+        tlv_types, tlv_lengths = tlv_headers["type"][fits], tlv_lengths[fits]
+
+        entries.append((active, tlv_types, p, tlv_lengths))
+        pos[active] = p + tlv_lengths
+        step += 1
+        active = active[num_tlvs[active] > step]
+
+    if entries:
+        frames, types, offsets, sizes = (np.concatenate(c) for c in zip(*entries))
+    else:
+        frames = types = offsets = sizes = np.empty(0, np.int64)
+
+    # Check the TLVs like the parser does, and pick the TLVs of every type
+    selected: Dict[int, tuple[np.ndarray, np.ndarray, np.ndarray]] = {}
+    counts: Dict[int, np.ndarray] = {}
+    for tlv_type, schema in schemas.items():
+        mask = types == tlv_type
+        if not mask.any():
+            continue
+
+        itemsize = schema.dtype.itemsize
+        valid[frames[mask][sizes[mask] % itemsize != 0]] = False
+        tlv_frames, tlv_offsets, tlv_sizes = _last_per_frame(
+            frames[mask], offsets[mask], sizes[mask]
+        )
+        selected[tlv_type] = (tlv_frames, tlv_offsets, tlv_sizes // itemsize)
+        counts[tlv_type] = np.zeros(len(headers), np.int64)
+        counts[tlv_type][tlv_frames] = tlv_sizes // itemsize
+
+    for tlv_type, tlv_counts in counts.items():
+        annotates = schemas[tlv_type].annotates
+        if annotates is not None:
+            valid &= tlv_counts <= counts.get(annotates, 0)
+
+    corrupt += int(np.count_nonzero(~valid))
+    index = np.cumsum(valid) - 1  # Index of every valid frame in the batch
+    num_frames = int(np.count_nonzero(valid))
+
+    def tlv_records(tlv_type: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Records of a TLV in the valid frames, the index of their frames and the number of records per frame."""
+        dtype = AREA_SCANNER_TLVS[tlv_type].dtype
+        if tlv_type not in selected:
+            return np.empty(0, dtype), np.empty(0, np.int64), np.empty(0, np.int64)
+
+        tlv_frames, tlv_offsets, tlv_counts = selected[tlv_type]
+        keep = valid[tlv_frames]
+        tlv_counts = tlv_counts[keep]
+        return (
+            _concat(raw, tlv_offsets[keep], tlv_counts * dtype.itemsize, dtype),
+            index[tlv_frames[keep]],
+            tlv_counts,
+        )
+
+    def csr_offsets(tlv_frames: np.ndarray, tlv_counts: np.ndarray) -> np.ndarray:
+        per_frame = np.zeros(num_frames, np.int64)
+        per_frame[tlv_frames] = tlv_counts
+        return np.concatenate(([0], np.cumsum(per_frame)))
+
+    points, point_frames, point_counts = tlv_records(1)
+    dynamic_offsets = csr_offsets(point_frames, point_counts)
+    dynamic_points = DynamicPoints.decode(
+        points,
+        _align(*tlv_records(7), dynamic_offsets, fill=0),
+        _align(*tlv_records(11), dynamic_offsets, fill=255),
+        rotation,
+        height,
+    )
+
+    points, point_frames, point_counts = tlv_records(8)
+    static_offsets = csr_offsets(point_frames, point_counts)
+    static_points = StaticPoints.decode(
+        points, _align(*tlv_records(9), static_offsets, fill=0), rotation, height
+    )
+
+    objects, object_frames, object_counts = tlv_records(10)
+    tracked_offsets = csr_offsets(object_frames, object_counts)
+    tracked_objects = TrackedObjects.decode(objects, rotation, height)
+
+    return AreaScannerBatch(
+        headers=headers[valid],
+        timestamps_ns=timestamps_ns[valid] if timestamps_ns is not None else None,
+        dynamic_points=dynamic_points,
+        dynamic_offsets=dynamic_offsets,
+        static_points=static_points,
+        static_offsets=static_offsets,
+        tracked_objects=tracked_objects,
+        tracked_offsets=tracked_offsets,
+        corrupt=corrupt,
+    )
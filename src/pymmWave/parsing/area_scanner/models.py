@@ -1,8 +1,90 @@
-from dataclasses import dataclass
-from typing import Dict
+import weakref
+from collections import deque
+from dataclasses import dataclass, field
+from functools import cached_property
+from itertools import repeat
+from typing import Any, Dict, Optional
 
+import numpy as np
 
-@dataclass(frozen=True)
+from ...buffer_pool import BufferPool
+from ...timestamps import FrameTimestamps
+from ...utils import (
+    cartesian_to_spherical_array,
+    rotation_matrix,
+    spherical_to_cartesian_array,
+    transform_direction_array,
+    transform_point_array,
+)
+from ..tlv import TlvSchema
+
+# Layout of the TLV payloads, one record per point or object
+SPHERICAL_POINT_DTYPE = np.dtype(
+    [("range", "<f4"), ("angle", "<f4"), ("elev", "<f4"), ("doppler", "<f4")]
+)  # TLV 1
+SIDE_INFO_DTYPE = np.dtype([("snr", "<u2"), ("noise", "<u2")])  # TLVs 7 and 9
+CARTESIAN_POINT_DTYPE = np.dtype(
+    [("x", "<f4"), ("y", "<f4"), ("z", "<f4"), ("doppler", "<f4")]
+)  # TLV 8
+TRACKED_OBJECT_DTYPE = np.dtype(
+    [
+        ("target_id", "<u4"),
+        ("pos_x", "<f4"),
+        ("pos_y", "<f4"),
+        ("vel_x", "<f4"),
+        ("vel_y", "<f4"),
+        ("acc_x", "<f4"),
+        ("acc_y", "<f4"),
+        ("pos_z", "<f4"),
+        ("vel_z", "<f4"),
+        ("acc_z", "<f4"),
+    ]
+)  # TLV 10
+TARGET_INDEX_DTYPE = np.dtype("<u1")  # TLV 11
+FRAME_HEADER_DTYPE = np.dtype(
+    [
+        ("version", "<u4"),
+        ("total_packet_len", "<u4"),
+        ("platform_type", "<u4"),
+        ("frame_number", "<u4"),
+        ("time_cpu_cycles", "<u4"),
+        ("num_detected_obj", "<u4"),
+        ("num_tlvs", "<u4"),
+        ("subframe_number", "<u4"),
+        ("num_static_detected_obj", "<u4"),
+    ]
+)  # Frame header after the magic word
+
+
+def _columns(dtype: np.dtype, *columns: np.ndarray) -> np.ndarray:
+    """Stack float32 columns of a structured array into an N x 3 array of dtype."""
+    return np.column_stack(columns).astype(dtype, copy=False)
+
+
+def _side_info(
+    n: int, side_info: Optional[np.ndarray]
+) -> tuple[np.ndarray, np.ndarray]:
+    """snr and noise columns for n points, defaulting to 0 for points without side info."""
+    snr = np.zeros(n, np.uint16)
+    noise = np.zeros(n, np.uint16)
+    if side_info is not None:
+        snr[: len(side_info)] = side_info["snr"]
+        noise[: len(side_info)] = side_info["noise"]
+    return snr, noise
+
+
+def _build(cls: type, columns: Dict[str, list]) -> list:
+    """Build instances of a frozen dataclass with slots from lists of field values, without a dict per instance.
+    Sets each field for all instances at once through its slot descriptor, so the loops run in C.
+    """
+    n = len(next(iter(columns.values()))) if columns else 0
+    instances = list(map(object.__new__, repeat(cls, n)))
+    for name, values in columns.items():
+        deque(map(getattr(cls, name).__set__, instances, values), maxlen=0)
+    return instances
+
+
+@dataclass(frozen=True, slots=True)
 class TrackedObject:
     target_id: int
     pos_x: float
@@ -28,7 +110,7 @@ class TrackedObject:
         object.__setattr__(self, "acc_z", data["acc_z"])
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DynamicPoint:
     target_id: int
     """
@@ -56,7 +138,7 @@ class DynamicPoint:
         object.__setattr__(self, "noise", data["noise"])
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StaticPoint:
     x: float
     y: float
@@ -74,7 +156,7 @@ class StaticPoint:
         object.__setattr__(self, "noise", data["noise"])
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AreaScannerData:
     major_num: int
     minor_num: int
@@ -93,6 +175,9 @@ class AreaScannerData:
     static_points: list[StaticPoint]
     tracked_objects: list[TrackedObject]
 
+    timestamps: Optional[FrameTimestamps] = field(default=None, compare=False)
+    """Host times at which the frame passed the pipeline, if it came from a sensor"""
+
     def __init__(self, data: Dict):
         object.__setattr__(self, "major_num", data["major_num"])
         object.__setattr__(self, "minor_num", data["minor_num"])
@@ -129,3 +214,666 @@ class AreaScannerData:
             for obj in data["tracked_objects"]:
                 tracked_objects.append(TrackedObject(obj))
         object.__setattr__(self, "tracked_objects", tracked_objects)
+
+        object.__setattr__(self, "timestamps", FrameTimestamps.of(data))
+
+    @classmethod
+    def from_frame(cls, frame: "AreaScannerFrame") -> "AreaScannerData":
+        """Build the data straight from the columns of a frame, without building dicts first.
+
+        Args:
+            frame (AreaScannerFrame): Parsed frame
+
+        Returns:
+            AreaScannerData: Frame data
+        """
+        data = object.__new__(cls)
+        object.__setattr__(data, "major_num", frame.major_num)
+        object.__setattr__(data, "minor_num", frame.minor_num)
+        object.__setattr__(data, "bugfix_num", frame.bugfix_num)
+        object.__setattr__(data, "build_num", frame.build_num)
+        object.__setattr__(data, "total_packet_len", frame.total_packet_len)
+        object.__setattr__(data, "platform_type", frame.platform_type)
+        object.__setattr__(data, "frame_number", frame.frame_number)
+        object.__setattr__(data, "time_cpu_cycles", frame.time_cpu_cycles)
+        object.__setattr__(data, "num_detected_obj", frame.num_detected_obj)
+        object.__setattr__(data, "num_tlvs", frame.num_tlvs)
+        object.__setattr__(data, "subframe_number", frame.subframe_number)
+        object.__setattr__(
+            data, "num_static_detected_obj", frame.num_static_detected_obj
+        )
+
+        dynamic_points = frame.dynamic_points
+        static_points = frame.static_points
+        tracked_objects = frame.tracked_objects
+        object.__setattr__(
+            data,
+            "dynamic_points",
+            dynamic_points.to_points() if dynamic_points is not None else [],
+        )
+        object.__setattr__(
+            data,
+            "static_points",
+            static_points.to_points() if static_points is not None else [],
+        )
+        object.__setattr__(
+            data,
+            "tracked_objects",
+            tracked_objects.to_objects() if tracked_objects is not None else [],
+        )
+        object.__setattr__(data, "timestamps", frame.timestamps)
+        return data
+
+
+@dataclass(frozen=True)
+class DynamicPoints:
+    """Dynamic points of a frame as columns, one array entry per point. Positions are transformed like in :obj:`DynamicPoint`.
+    Positions are kept in cartesian coordinates. Range, angle and elevation are computed from them when first accessed.
+    """
+
+    target_id: np.ndarray
+    """uint8, see :attr:`DynamicPoint.target_id`"""
+    x: np.ndarray
+    y: np.ndarray
+    z: np.ndarray
+    doppler: np.ndarray
+    snr: np.ndarray
+    """uint16"""
+    noise: np.ndarray
+    """uint16"""
+
+    @classmethod
+    def decode(
+        cls,
+        points: Optional[np.ndarray],
+        side_info: Optional[np.ndarray],
+        target_index: Optional[np.ndarray],
+        rotation: np.ndarray,
+        height: float,
+    ) -> "DynamicPoints":
+        """Transform the records of TLV 1, and combine them with their side info (TLV 7) and target IDs (TLV 11).
+
+        Args:
+            points (Optional[np.ndarray]): TLV 1 records
+            side_info (Optional[np.ndarray]): TLV 7 records, at most one per point
+            target_index (Optional[np.ndarray]): TLV 11 records, at most one per point
+            rotation (np.ndarray): 3x3 rotation for the tilt of the sensor. Results have its dtype, float32 or float64.
+            height (float): Height of the sensor from the ground in meters
+
+        Returns:
+            DynamicPoints: Transformed points
+        """
+        if points is None:
+            points = np.empty(0, SPHERICAL_POINT_DTYPE)
+
+        n = len(points)
+        snr, noise = _side_info(n, side_info)
+        target_id = np.full(n, 255, np.uint8)  # Default value
+        if target_index is not None:
+            target_id[: len(target_index)] = target_index
+
+        # Spherical to cartesian, then apply tilt and height
+        xyz = _columns(rotation.dtype, points["range"], points["angle"], points["elev"])
+        spherical_to_cartesian_array(xyz, out=xyz)
+        transform_point_array(xyz, height, out=xyz, rotation=rotation)
+        x, y, z = xyz.T
+
+        return cls(
+            target_id=target_id,
+            x=x,
+            y=y,
+            z=z,
+            doppler=points["doppler"].astype(rotation.dtype),
+            snr=snr,
+            noise=noise,
+        )
+
+    def __len__(self) -> int:
+        return len(self.x)
+
+    @cached_property
+    def spherical(self) -> np.ndarray:
+        """N x 3 array of range, angle and elev, computed on first access."""
+        return cartesian_to_spherical_array(np.column_stack((self.x, self.y, self.z)))
+
+    @property
+    def range(self) -> np.ndarray:
+        """Range in meters"""
+        return self.spherical[:, 0]
+
+    @property
+    def angle(self) -> np.ndarray:
+        """Azimuth angle in radians"""
+        return self.spherical[:, 1]
+
+    @property
+    def elev(self) -> np.ndarray:
+        """Elevation angle in radians"""
+        return self.spherical[:, 2]
+
+    def to_list(self) -> list[Dict]:
+        """Returns the points as a list of dicts, the format of the parser output."""
+        return [
+            {
+                "target_id": t,
+                "range": r,
+                "angle": a,
+                "elev": e,
+                "doppler": d,
+                "snr": s,
+                "noise": n,
+            }
+            for t, r, a, e, d, s, n in zip(
+                self.target_id.tolist(),
+                self.range.tolist(),
+                self.angle.tolist(),
+                self.elev.tolist(),
+                self.doppler.tolist(),
+                self.snr.tolist(),
+                self.noise.tolist(),
+            )
+        ]
+
+    def to_points(self) -> list[DynamicPoint]:
+        """Returns the points as :obj:`DynamicPoint` objects."""
+        return _build(
+            DynamicPoint,
+            {
+                "target_id": self.target_id.tolist(),
+                "range": self.range.tolist(),
+                "angle": self.angle.tolist(),
+                "elev": self.elev.tolist(),
+                "doppler": self.doppler.tolist(),
+                "snr": self.snr.tolist(),
+                "noise": self.noise.tolist(),
+            },
+        )
+
+
+@dataclass(frozen=True)
+class StaticPoints:
+    """Static points of a frame as columns, one array entry per point. Positions are transformed like in :obj:`StaticPoint`."""
+
+    x: np.ndarray
+    y: np.ndarray
+    z: np.ndarray
+    doppler: np.ndarray
+    snr: np.ndarray
+    """uint16"""
+    noise: np.ndarray
+    """uint16"""
+
+    @classmethod
+    def decode(
+        cls,
+        points: np.ndarray,
+        side_info: Optional[np.ndarray],
+        rotation: np.ndarray,
+        height: float,
+    ) -> "StaticPoints":
+        """Transform the records of TLV 8, and combine them with their side info (TLV 9).
+
+        Args:
+            points (np.ndarray): TLV 8 records
+            side_info (Optional[np.ndarray]): TLV 9 records, at most one per point
+            rotation (np.ndarray): 3x3 rotation for the tilt of the sensor. Results have its dtype, float32 or float64.
+            height (float): Height of the sensor from the ground in meters
+
+        Returns:
+            StaticPoints: Transformed points
+        """
+        snr, noise = _side_info(len(points), side_info)
+
+        # Transformed position
+        xyz = _columns(rotation.dtype, points["x"], points["y"], points["z"])
+        transform_point_array(xyz, height, out=xyz, rotation=rotation)
+
+        x, y, z = xyz.T
+        return cls(
+            x=x,
+            y=y,
+            z=z,
+            doppler=points["doppler"].astype(rotation.dtype),
+            snr=snr,
+            noise=noise,
+        )
+
+    def __len__(self) -> int:
+        return len(self.x)
+
+    def to_list(self) -> list[Dict]:
+        """Returns the points as a list of dicts, the format of the parser output."""
+        return [
+            {"x": x, "y": y, "z": z, "doppler": d, "snr": s, "noise": n}
+            for x, y, z, d, s, n in zip(
+                self.x.tolist(),
+                self.y.tolist(),
+                self.z.tolist(),
+                self.doppler.tolist(),
+                self.snr.tolist(),
+                self.noise.tolist(),
+            )
+        ]
+
+    def to_points(self) -> list[StaticPoint]:
+        """Returns the points as :obj:`StaticPoint` objects."""
+        return _build(
+            StaticPoint,
+            {
+                "x": self.x.tolist(),
+                "y": self.y.tolist(),
+                "z": self.z.tolist(),
+                "doppler": self.doppler.tolist(),
+                "snr": self.snr.tolist(),
+                "noise": self.noise.tolist(),
+            },
+        )
+
+
+@dataclass(frozen=True)
+class TrackedObjects:
+    """Tracked objects of a frame, one row per object."""
+
+    target_id: np.ndarray
+    """uint32"""
+    values: np.ndarray
+    """N x 9 array with the columns pos_x, pos_y, pos_z, vel_x, vel_y, vel_z, acc_x, acc_y and acc_z"""
+
+    @classmethod
+    def decode(
+        cls, objects: np.ndarray, rotation: np.ndarray, height: float
+    ) -> "TrackedObjects":
+        """Transform position, velocity and acceleration of the records of TLV 10.
+
+        Args:
+            objects (np.ndarray): TLV 10 records
+            rotation (np.ndarray): 3x3 rotation for the tilt of the sensor. Results have its dtype, float32 or float64.
+            height (float): Height of the sensor from the ground in meters
+
+        Returns:
+            TrackedObjects: Transformed objects
+        """
+        values = np.empty((len(objects), 9), rotation.dtype)
+        # Transformed position
+        transform_point_array(
+            _columns(
+                rotation.dtype, objects["pos_x"], objects["pos_y"], objects["pos_z"]
+            ),
+            height,
+            out=values[:, 0:3],
+            rotation=rotation,
+        )
+        # Transformed velocity and acceleration
+        transform_direction_array(
+            _columns(
+                rotation.dtype, objects["vel_x"], objects["vel_y"], objects["vel_z"]
+            ),
+            out=values[:, 3:6],
+            rotation=rotation,
+        )
+        transform_direction_array(
+            _columns(
+                rotation.dtype, objects["acc_x"], objects["acc_y"], objects["acc_z"]
+            ),
+            out=values[:, 6:9],
+            rotation=rotation,
+        )
+
+        return cls(target_id=objects["target_id"].copy(), values=values)
+
+    def __len__(self) -> int:
+        return len(self.target_id)
+
+    @property
+    def pos(self) -> np.ndarray:
+        """N x 3 view of the positions."""
+        return self.values[:, 0:3]
+
+    @property
+    def vel(self) -> np.ndarray:
+        """N x 3 view of the velocities."""
+        return self.values[:, 3:6]
+
+    @property
+    def acc(self) -> np.ndarray:
+        """N x 3 view of the accelerations."""
+        return self.values[:, 6:9]
+
+    def to_list(self) -> list[Dict]:
+        """Returns the objects as a list of dicts, the format of the parser output."""
+        return [
+            {
+                "target_id": t,
+                "pos_x": px,
+                "pos_y": py,
+                "vel_x": vx,
+                "vel_y": vy,
+                "acc_x": ax,
+                "acc_y": ay,
+                "pos_z": pz,
+                "vel_z": vz,
+                "acc_z": az,
+            }
+            for t, (px, py, pz, vx, vy, vz, ax, ay, az) in zip(
+                self.target_id.tolist(), self.values.tolist()
+            )
+        ]
+
+    def to_objects(self) -> list[TrackedObject]:
+        """Returns the objects as :obj:`TrackedObject` objects."""
+        columns = {"target_id": self.target_id.tolist()}
+        for name, values in zip(
+            (
+                "pos_x",
+                "pos_y",
+                "pos_z",
+                "vel_x",
+                "vel_y",
+                "vel_z",
+                "acc_x",
+                "acc_y",
+                "acc_z",
+            ),
+            self.values.T.tolist(),
+        ):
+            columns[name] = values
+        return _build(TrackedObject, columns)
+
+
+@dataclass(frozen=True)
+class AreaScannerFrame:
+    """A parsed frame in columnar form, holding NumPy arrays instead of a dict per point.
+    Returned by :meth:`AreaScannerParser.parse_frame<pymmWave.parsing.area_scanner.area_scanner_parser.AreaScannerParser.parse_frame>`. The dict and :obj:`AreaScannerData` representations are built from it on demand.
+    Only the header is decoded when the frame is parsed. Each TLV is decoded and transformed the first time it is accessed, using the sensor placement at the time of parsing.
+    """
+
+    major_num: int
+    minor_num: int
+    bugfix_num: int
+    build_num: int
+    total_packet_len: int
+    platform_type: int
+    frame_number: int
+    time_cpu_cycles: int
+    num_detected_obj: int
+    num_tlvs: int
+    subframe_number: int
+    num_static_detected_obj: int
+
+    timestamps: FrameTimestamps = field(
+        default_factory=FrameTimestamps, repr=False, compare=False
+    )
+    """Host times at which the frame passed the pipeline, set by sensors"""
+
+    # Owned copy of the packet and its length, which is shorter than a pooled buffer, the offset and length of every TLV payload in it,
+    # the schemas used to decode them, the TLVs decoded so far, and the sensor placement
+    _packet: bytes | bytearray = field(default=b"", repr=False, compare=False)
+    _length: Optional[int] = field(default=None, repr=False, compare=False)
+    _tlvs: Dict[int, tuple[int, int]] = field(
+        default_factory=dict, repr=False, compare=False
+    )
+    _schemas: Dict[int, TlvSchema] = field(
+        default_factory=lambda: AREA_SCANNER_TLVS, repr=False, compare=False
+    )
+    _decoded: Dict[int, Any] = field(default_factory=dict, repr=False, compare=False)
+    _rotation: np.ndarray = field(
+        default_factory=lambda: rotation_matrix(0), repr=False, compare=False
+    )
+    _height: float = field(default=0.0, repr=False, compare=False)
+    # Pool the packet buffer came from, it goes back there when the frame is released
+    _pool: Optional[BufferPool] = field(default=None, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        release = None
+        if self._pool is not None and isinstance(self._packet, bytearray):
+            # Also returns the buffer when the frame is garbage collected without being released
+            release = weakref.finalize(self, self._pool.release, self._packet)
+        object.__setattr__(self, "_release", release)
+
+    def __getstate__(self) -> Dict:
+        # A pickled frame owns its packet, and is not tied to a pool
+        state = dict(self.__dict__)
+        state["_packet"] = bytes(self._packet_view())
+        state["_pool"] = None
+        state["_release"] = None
+        return state
+
+    def __setstate__(self, state: Dict) -> None:
+        self.__dict__.update(state)
+
+    def release(self) -> None:
+        """Return the packet buffer of this frame to its buffer pool. Points decoded before remain valid, but raw TLVs can no longer be accessed.
+        Only release a frame when no other consumer uses it. Frames which are not released return their buffer once they are garbage collected.
+        """
+        if self._release is not None:
+            self._release()
+
+    @property
+    def released(self) -> bool:
+        """True if the packet buffer was returned to its pool."""
+        return self._release is not None and not self._release.alive
+
+    def _packet_view(self) -> memoryview:
+        if self.released:
+            raise Exception("Frame was released")
+        return memoryview(self._packet)[: self._length]
+
+    @property
+    def tlv_types(self) -> list[int]:
+        """Types of the TLVs in this frame, in packet order. Includes TLVs without a schema, which are skipped."""
+        return list(self._tlvs)
+
+    def payload(self, tlv_type: int) -> Optional[memoryview]:
+        """Returns the raw payload of a TLV, also for TLVs without a schema.
+
+        Args:
+            tlv_type (int): TLV type
+
+        Returns:
+            Optional[memoryview]: Read-only payload bytes, or None if the frame has no such TLV.
+
+        Raises:
+            Exception: If the frame was released.
+        """
+        if tlv_type not in self._tlvs:
+            return None
+
+        offset, length = self._tlvs[tlv_type]
+        return self._packet_view()[offset : offset + length].toreadonly()
+
+    def tlv(self, tlv_type: int) -> Optional[np.ndarray]:
+        """Returns the raw records of a TLV, without any transformation applied.
+
+        Args:
+            tlv_type (int): TLV type
+
+        Returns:
+            Optional[np.ndarray]: Read-only structured array viewing the packet, or None if the frame has no such TLV or it has no schema.
+
+        Raises:
+            Exception: If the frame was released.
+        """
+        schema = self._schemas.get(tlv_type)
+        if tlv_type not in self._tlvs or schema is None:
+            return None
+
+        offset, length = self._tlvs[tlv_type]
+        records = np.frombuffer(
+            self._packet_view(), schema.dtype, length // schema.dtype.itemsize, offset
+        )
+        records.flags.writeable = False
+        return records
+
+    def decoded(self, tlv_type: int) -> Any:
+        """Returns a TLV decoded by the transform of its schema. Decoded once, on first access.
+
+        Args:
+            tlv_type (int): TLV type
+
+        Returns:
+            Any: Decoded value, a copy of the records if the schema has no transform, or None if the frame has no such TLV or it has no schema.
+        """
+        if tlv_type not in self._decoded:
+            records = self.tlv(tlv_type)
+            if records is None:
+                self._decoded[tlv_type] = None
+            elif (transform := self._schemas[tlv_type].transform) is not None:
+                self._decoded[tlv_type] = transform(records, self)
+            else:
+                # Decoded values must not point into the packet buffer, which may be reused once the frame is released
+                self._decoded[tlv_type] = records.copy()
+        return self._decoded[tlv_type]
+
+    @property
+    def dynamic_points(self) -> Optional[DynamicPoints]:
+        """Dynamic points, None if the frame has no TLVs."""
+        if self.num_tlvs == 0:
+            return None
+        if 1 not in self._tlvs:
+            return _decode_dynamic_points(None, self)
+        return self.decoded(1)
+
+    @property
+    def static_points(self) -> Optional[StaticPoints]:
+        """Static points, None if the frame has no static point TLV."""
+        return self.decoded(8)
+
+    @property
+    def tracked_objects(self) -> Optional[TrackedObjects]:
+        """Tracked objects, None if the frame has no tracked object TLV."""
+        return self.decoded(10)
+
+    def to_dict(self) -> Dict:
+        """Returns the frame in the dict format of the parser output.
+        Every TLV with a schema is included under the name of its schema, except TLVs annotating another, which are part of the TLV they annotate.
+        Decoded values with a to_list method are converted by it, and arrays to lists, with a dict per record for structured arrays.
+
+        Returns:
+            Dict: Frame data
+        """
+        result = {
+            "major_num": self.major_num,
+            "minor_num": self.minor_num,
+            "bugfix_num": self.bugfix_num,
+            "build_num": self.build_num,
+            "total_packet_len": self.total_packet_len,
+            "platform_type": self.platform_type,
+            "frame_number": self.frame_number,
+            "time_cpu_cycles": self.time_cpu_cycles,
+            "num_detected_obj": self.num_detected_obj,
+            "num_tlvs": self.num_tlvs,
+            "subframe_number": self.subframe_number,
+            "num_static_detected_obj": self.num_static_detected_obj,
+        }
+        for tlv_type, schema in self._schemas.items():
+            if schema.annotates is not None:
+                continue
+
+            value = self.dynamic_points if tlv_type == 1 else self.decoded(tlv_type)
+            if value is None:
+                continue
+            if hasattr(value, "to_list"):
+                value = value.to_list()
+            elif isinstance(value, np.ndarray):
+                names = value.dtype.names
+                if names is None:
+                    value = value.tolist()
+                else:
+                    value = [dict(zip(names, row)) for row in value.tolist()]
+            result[schema.name] = value
+        return result
+
+    def to_data(self) -> AreaScannerData:
+        """Returns the frame as :obj:`AreaScannerData`.
+
+        Returns:
+            AreaScannerData: Frame data
+        """
+        return AreaScannerData.from_frame(self)
+
+
+@dataclass(frozen=True)
+class AreaScannerBatch:
+    """Many frames parsed at once by :meth:`AreaScannerParser.parse_batch<pymmWave.parsing.area_scanner.area_scanner_parser.AreaScannerParser.parse_batch>`, in CSR layout.
+    The points of all frames are concatenated into one set of columns. The dynamic points of frame i are the entries dynamic_offsets[i] to dynamic_offsets[i + 1], and likewise for static points and tracked objects.
+    """
+
+    headers: np.ndarray
+    """Header of every frame, a structured array with the fields of FRAME_HEADER_DTYPE"""
+    timestamps_ns: Optional[np.ndarray]
+    """Host receive time of every frame in nanoseconds since the epoch, or None if the frames were not read from a capture file"""
+    dynamic_points: DynamicPoints
+    dynamic_offsets: np.ndarray
+    """Offsets of the dynamic points of every frame, one more than there are frames"""
+    static_points: StaticPoints
+    static_offsets: np.ndarray
+    """Offsets of the static points of every frame, one more than there are frames"""
+    tracked_objects: TrackedObjects
+    tracked_offsets: np.ndarray
+    """Offsets of the tracked objects of every frame, one more than there are frames"""
+    corrupt: int = 0
+    """Number of frames left out because they were corrupt"""
+
+    def __len__(self) -> int:
+        return len(self.headers)
+
+    @property
+    def frame_number(self) -> np.ndarray:
+        """Frame number of every frame"""
+        return self.headers["frame_number"]
+
+    @property
+    def time_cpu_cycles(self) -> np.ndarray:
+        """Device time in cycles of every frame"""
+        return self.headers["time_cpu_cycles"]
+
+    @cached_property
+    def dynamic_frame_index(self) -> np.ndarray:
+        """Index of the frame of every dynamic point"""
+        return _frame_index(self.dynamic_offsets)
+
+    @cached_property
+    def static_frame_index(self) -> np.ndarray:
+        """Index of the frame of every static point"""
+        return _frame_index(self.static_offsets)
+
+    @cached_property
+    def tracked_frame_index(self) -> np.ndarray:
+        """Index of the frame of every tracked object"""
+        return _frame_index(self.tracked_offsets)
+
+
+def _frame_index(offsets: np.ndarray) -> np.ndarray:
+    """Expand CSR offsets into the index of the frame of every entry."""
+    return np.repeat(np.arange(len(offsets) - 1), np.diff(offsets))
+
+
+def _decode_dynamic_points(
+    records: Optional[np.ndarray], frame: AreaScannerFrame
+) -> DynamicPoints:
+    return DynamicPoints.decode(
+        records, frame.tlv(7), frame.tlv(11), frame._rotation, frame._height
+    )
+
+
+def _decode_static_points(records: np.ndarray, frame: AreaScannerFrame) -> StaticPoints:
+    return StaticPoints.decode(records, frame.tlv(9), frame._rotation, frame._height)
+
+
+def _decode_tracked_objects(
+    records: np.ndarray, frame: AreaScannerFrame
+) -> TrackedObjects:
+    return TrackedObjects.decode(records, frame._rotation, frame._height)
+
+
+AREA_SCANNER_TLVS: Dict[int, TlvSchema] = {
+    1: TlvSchema("dynamic_points", SPHERICAL_POINT_DTYPE, None, _decode_dynamic_points),
+    7: TlvSchema("dynamic_side_info", SIDE_INFO_DTYPE, annotates=1),
+    8: TlvSchema("static_points", CARTESIAN_POINT_DTYPE, None, _decode_static_points),
+    9: TlvSchema("static_side_info", SIDE_INFO_DTYPE, annotates=8),
+    10: TlvSchema(
+        "tracked_objects", TRACKED_OBJECT_DTYPE, None, _decode_tracked_objects
+    ),
+    11: TlvSchema("target_index", TARGET_INDEX_DTYPE, annotates=1),
+}
+"""Schemas of the TLVs of the Area Scanner firmware."""
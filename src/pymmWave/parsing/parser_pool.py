@@ -0,0 +1,251 @@
+from concurrent.futures import Future, ProcessPoolExecutor
+from copy import copy
+from dataclasses import fields, is_dataclass
+from multiprocessing import get_context
+from multiprocessing.shared_memory import SharedMemory
+from queue import SimpleQueue
+from time import perf_counter
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+from ..constants import MAX_PACKET_LEN
+from ..metrics import LatencyHistogram
+from .sensor_parser import PacketParser
+
+# Decoded output is larger than its packet, since 4 byte fields may become 8 bytes and side info is added to every point.
+_OUTPUT_SIZE_FACTOR = 8
+
+# State of a worker process, set up by _init_worker
+_worker_parser: Optional[PacketParser] = None
+_worker_slots: list[tuple[SharedMemory, SharedMemory]] = []
+
+
+def _attach(name: str) -> SharedMemory:
+    """Attach to shared memory created by the parent process, without making this process responsible for cleaning it up."""
+    try:
+        return SharedMemory(name, track=False)  # type: ignore
+    except TypeError:
+        # Before python 3.13, attaching registers the memory with the resource tracker. Spawned workers share the tracker of the parent process,
+        # which already registered it, so this is a no-op. Unregistering here would remove the registration of the parent.
+        return SharedMemory(name)
+
+
+def _init_worker(parser: PacketParser, slot_names: list[tuple[str, str]]) -> None:
+    global _worker_parser, _worker_slots
+    _worker_parser = parser
+    _worker_slots = [(_attach(i), _attach(o)) for i, o in slot_names]
+
+
+def _share(array: np.ndarray, buf: memoryview, offset: int) -> tuple:
+    """Copy an array into buf at offset.
+
+    Returns:
+        tuple: Dtype, shape and offset of the copy
+    """
+    shared = np.ndarray(array.shape, array.dtype, buffer=buf, offset=offset)
+    shared[...] = array
+    return array.dtype, array.shape, offset
+
+
+def _encode(frame: Any, buf: memoryview) -> tuple[list[tuple[int, str, Any]], float]:
+    """Decode every TLV of a frame in columnar form, and write the arrays of the decoded values into buf.
+    Decoded values are arrays or dataclasses of arrays, like :obj:`DynamicPoints<pymmWave.parsing.area_scanner.models.DynamicPoints>`. Other values, and values which do not fit into buf, are pickled.
+
+    Returns:
+        tuple[list[tuple[int, str, Any]], float]: TLV type, kind and encoded value of every decoded TLV, and the seconds spent decoding
+    """
+    schemas = getattr(_worker_parser, "tlv_schemas", {})
+    encoded = []
+    offset = 0
+    decode_time = 0.0
+    for tlv_type in frame.tlv_types:
+        schema = schemas.get(tlv_type)
+        if schema is None or schema.annotates is not None:
+            continue  # Annotating TLVs are decoded with the TLV they annotate
+
+        start = perf_counter()
+        value = frame.decoded(tlv_type)
+        decode_time += perf_counter() - start
+        try:
+            if isinstance(value, np.ndarray):
+                entry = (tlv_type, "array", _share(value, buf, offset))
+                offset += value.nbytes
+            elif is_dataclass(value) and all(
+                isinstance(getattr(value, f.name), np.ndarray) for f in fields(value)
+            ):
+                columns = {}
+                for f in fields(value):
+                    column = getattr(value, f.name)
+                    columns[f.name] = _share(column, buf, offset)
+                    offset += column.nbytes
+                entry = (tlv_type, "columns", (type(value), columns))
+            else:
+                entry = (tlv_type, "pickled", value)
+        except TypeError:
+            entry = (tlv_type, "pickled", value)  # Does not fit into buf
+        encoded.append(entry)
+    return encoded, decode_time
+
+
+def _parse_in_slot(index: int, length: int) -> tuple[str, Any]:
+    """Worker function: parse the packet in a slot and write the result to the output memory of that slot."""
+    packet_shm, output_shm = _worker_slots[index]
+    packet = packet_shm.buf[:length]
+    if not hasattr(_worker_parser, "parse_frame"):
+        # Parsers without columnar form hand back their result pickled
+        return "pickled", _worker_parser.parse_packet(packet)  # type: ignore
+
+    frame = _worker_parser.parse_frame(packet)  # type: ignore
+    if frame is None:
+        return "none", None
+    return "shared", _encode(frame, output_shm.buf)
+
+
+def _decode(encoded: list[tuple[int, str, Any]], buf: memoryview) -> Dict[int, Any]:
+    """Rebuild the decoded TLVs from the output of _encode, copying their arrays out of buf."""
+
+    def unshare(dtype: np.dtype, shape: tuple, offset: int) -> np.ndarray:
+        return np.ndarray(shape, dtype, buffer=buf, offset=offset).copy()
+
+    decoded = {}
+    for tlv_type, kind, value in encoded:
+        if kind == "array":
+            decoded[tlv_type] = unshare(*value)
+        elif kind == "columns":
+            cls, columns = value
+            decoded[tlv_type] = cls(
+                **{name: unshare(*column) for name, column in columns.items()}
+            )
+        else:
+            decoded[tlv_type] = value
+    return decoded
+
+
+class ParserPool:
+    """Parses packets in a pool of worker processes, so parsing of several sensors is not limited to a single core by the GIL.
+    Packets are handed to the workers through shared memory. For parsers with a columnar form, like :obj:`AreaScannerParser<pymmWave.parsing.area_scanner.area_scanner_parser.AreaScannerParser>`,
+    the workers decode and transform every TLV, and the arrays come back through shared memory, so the parent process only copies them. Frames are returned as dicts like parse_packet does,
+    or as :obj:`AreaScannerFrame<pymmWave.parsing.area_scanner.models.AreaScannerFrame>` if the parser is columnar, which saves building the lists.
+    Parsers without parse_frame have their parse_packet result pickled, which costs the parent process about as much as parsing.
+    A pool can be shared by several sensors using the same parser configuration. Changes to the parser after the pool was created do not reach the workers.
+
+    Example:
+        >>> with ParserPool(my_parser, workers=4) as pool:
+        ...     sensor1 = IWR6843AOP("1", read_mode=ReadMode.THREAD, parser_pool=pool)
+        ...     sensor2 = IWR6843AOP("2", read_mode=ReadMode.THREAD, parser_pool=pool)
+    """
+
+    def __init__(
+        self,
+        parser: PacketParser,
+        workers: int = 2,
+        slots: Optional[int] = None,
+    ):
+        """Create the shared memory and the worker processes
+
+        Args:
+            parser (PacketParser): Parser copied into every worker
+            workers (int, optional): Number of worker processes. Defaults to 2.
+            slots (Optional[int], optional): Number of packets which can be parsed or waiting to be parsed at once. Defaults to twice the number of workers.
+        """
+        self.slots = slots if slots is not None else 2 * workers
+        # Indexes the TLVs of the frames the workers decoded, which is cheap
+        self._parser = copy(parser)
+
+        self._shm: list[tuple[SharedMemory, SharedMemory]] = [
+            (
+                SharedMemory(create=True, size=MAX_PACKET_LEN),
+                SharedMemory(create=True, size=_OUTPUT_SIZE_FACTOR * MAX_PACKET_LEN),
+            )
+            for _ in range(self.slots)
+        ]
+        self._free: SimpleQueue[int] = SimpleQueue()
+        for index in range(self.slots):
+            self._free.put(index)
+
+        # Workers are spawned, since forking a process running an event loop and reader threads is unsafe
+        self._executor = ProcessPoolExecutor(
+            workers,
+            mp_context=get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(parser, [(i.name, o.name) for i, o in self._shm]),
+        )
+        self._closed = False
+
+    def submit(
+        self,
+        packet: bytes | memoryview,
+        transform_time: Optional[LatencyHistogram] = None,
+    ) -> "Future[Any]":
+        """Copy a packet into a free slot and parse it in a worker. Blocks until a slot is free, so do not call this from the event loop.
+
+        Args:
+            packet (bytes | memoryview): Packet bytes, starting right after the magic word
+            transform_time (Optional[LatencyHistogram], optional): Records the time the worker spent decoding and transforming the TLVs of the frame, plus the time spent building the dict. Only recorded for parsers with a columnar form. Defaults to None.
+
+        Returns:
+            Future[Any]: Resolves to the parsed frame as parse_packet would return it, or None if the parser discarded the packet. Raises what the parser raised.
+        """
+        if self._closed:
+            raise Exception("Parser pool is closed")
+        if len(packet) > MAX_PACKET_LEN:
+            raise ValueError(f"Packet of {len(packet)} bytes exceeds MAX_PACKET_LEN")
+
+        index = self._free.get()
+        packet_shm, output_shm = self._shm[index]
+        packet_shm.buf[: len(packet)] = packet
+
+        length = len(packet)
+        result: Future[Any] = Future()
+
+        def on_parsed(parsed: Future) -> None:
+            # Runs on the executor's management thread. The slot is free again once its packet and output were copied out.
+            try:
+                kind, value = parsed.result()
+                if kind == "shared":
+                    encoded, decode_time = value
+                    frame = self._parser.parse_frame(packet_shm.buf[:length])  # type: ignore
+                    frame._decoded.update(_decode(encoded, output_shm.buf))
+                    value = frame
+                    if not getattr(self._parser, "columnar", True):
+                        # The TLVs are decoded already, this only builds the lists
+                        start = perf_counter()
+                        value = frame.to_dict()
+                        decode_time += perf_counter() - start
+                    if transform_time is not None:
+                        transform_time.record(decode_time)
+            except BaseException as e:
+                self._free.put(index)
+                result.set_exception(e)
+                return
+
+            self._free.put(index)
+            result.set_result(value)
+
+        try:
+            self._executor.submit(_parse_in_slot, index, length).add_done_callback(
+                on_parsed
+            )
+        except BaseException:
+            self._free.put(index)
+            raise
+        return result
+
+    def close(self) -> None:
+        """Stop the workers and free the shared memory."""
+        if self._closed:
+            return
+
+        self._closed = True
+        self._executor.shutdown()
+        for packet_shm, output_shm in self._shm:
+            for shm in (packet_shm, output_shm):
+                shm.close()
+                shm.unlink()
+
+    def __enter__(self) -> "ParserPool":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
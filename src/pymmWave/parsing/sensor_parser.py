@@ -1,12 +1,16 @@
+import struct
 from abc import ABC, abstractmethod
 from typing import Dict
 
 from aioserial import AioSerial
 
+from ..constants import MAX_PACKET_LEN, MIN_PACKET_LEN
+
 
 class SensorParser(ABC):
     """
     Base Sensor Parser Class. The goal of this class implementation is such that users can implement classes which can then be used with our library of algorithms easily.
+    Parsers for firmware whose packets start with a version and total packet length should subclass :obj:`PacketParser` instead.
     """
 
     @abstractmethod
@@ -20,3 +24,43 @@ class SensorParser(ABC):
             Dict | None: Parsed data, or None if the data is discarded
         """
         return {}
+
+
+class PacketParser(SensorParser):
+    """
+    Base class of parsers which parse complete packets. Packets start with a version and total packet length, so they can be read whole,
+    and the parser can be fed by a :obj:`FrameReader<pymmWave.frame_reader.FrameReader>`, which avoids reading the serial port piece by piece.
+    """
+
+    async def parse(self, s: AioSerial) -> Dict | None:
+        """Read the version and total packet length, then the rest of the packet, and hand it to parse_packet.
+
+        Args:
+            s (Serial): Serial to read data from
+
+        Returns:
+            Dict | None: Parsed data, or None if the data is discarded
+        """
+        header = await s.read_async(8)
+
+        _, total_packet_len = struct.unpack("<2I", header)
+        if not MIN_PACKET_LEN <= total_packet_len <= MAX_PACKET_LEN:
+            return None  # Corrupt header, don't wait for a garbage amount of data
+
+        # The total packet length includes the magic word and the 8 bytes read above
+        data = await s.read_async(total_packet_len - 16)  # Read the rest of the packet
+
+        return self.parse_packet(memoryview(header + data))
+
+    @abstractmethod
+    def parse_packet(self, packet: memoryview) -> Dict | None:
+        """Parse a complete packet which was already read from the sensor. The packet does not contain the magic word.
+        The packet may be a view into a buffer which is reused afterwards, so it must not be kept after returning.
+
+        Args:
+            packet (memoryview): Packet bytes, starting right after the magic word
+
+        Returns:
+            Dict | None: Parsed data, or None if the data is discarded
+        """
+        return {}
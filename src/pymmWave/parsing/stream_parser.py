@@ -0,0 +1,198 @@
+import struct
+from time import monotonic, perf_counter
+from typing import Any, Callable, Optional
+
+from aioserial import AioSerial, SerialException
+
+from ..clock import ClockModel
+from ..constants import MAGIC_NUMBER
+from ..frame_reader import FrameReader, FrameStats
+from ..metrics import SensorMetrics
+from ..timestamps import stamp
+from .sensor_parser import PacketParser
+
+
+class StreamParser:
+    """Push-based parser for a raw frame stream, independent of where the bytes come from.
+    Bytes are pushed in chunks of any size, partial frames are kept until the rest arrives, and every feed returns the frames it completed.
+    Works with any PacketParser, so serial ports, capture files, sockets and byte buffers can all share it.
+    Parsed frames get timestamps of when their magic word was found and when parsing completed, see :obj:`FrameTimestamps<pymmWave.timestamps.FrameTimestamps>`.
+
+    Example:
+        >>> stream = StreamParser(AreaScannerParser())
+        >>> for chunk in iter(lambda: sock.recv(4096), b""):
+        ...     for frame in stream.feed(chunk):
+        ...         handle(frame)
+    """
+
+    def __init__(
+        self,
+        parser: PacketParser,
+        reader: Optional[FrameReader] = None,
+        on_frame: Optional[Callable[[memoryview], None]] = None,
+        metrics: Optional[SensorMetrics] = None,
+        clock: Optional[ClockModel] = None,
+    ):
+        """Initialize the stream
+
+        Args:
+            parser (PacketParser): Parser of the packets
+            reader (Optional[FrameReader], optional): Reader splitting the stream into frames. Defaults to a new FrameReader.
+            on_frame (Optional[Callable[[memoryview], None]], optional): Called with every raw frame, including its magic word, before it is parsed. The frame must be copied if it is kept. Defaults to None.
+            metrics (Optional[SensorMetrics], optional): Records the time spent scanning, reading and parsing every frame, and counts bytes, frames and points. Defaults to None.
+            clock (Optional[ClockModel], optional): Clock model of the sensor, updated with every parsed frame to set its corrected timestamp. Defaults to None.
+        """
+        self.parser = parser
+        self.reader = reader if reader is not None else FrameReader()
+        """Reader splitting the stream into frames, which also holds the partial frame."""
+        self.on_frame = on_frame
+        self.metrics = metrics
+        self.clock = clock
+        self._scan_time = (
+            0.0  # Time spent scanning for the frame which is not complete yet
+        )
+
+    def __len__(self) -> int:
+        """Number of buffered bytes which have not been parsed yet."""
+        return len(self.reader)
+
+    @property
+    def stats(self) -> FrameStats:
+        """Counters for the frames read so far, including frames the parser failed on or discarded."""
+        return self.reader.stats
+
+    def bytes_missing(self) -> int:
+        """Minimum number of bytes that still have to be pushed before the next frame can be complete.
+
+        Returns:
+            int: Number of bytes, at least 1.
+        """
+        return self.reader.bytes_missing()
+
+    def push(self, data: bytes | memoryview) -> None:
+        """Buffer received bytes without parsing them. Use :meth:`next_parsed` to parse the frames they complete one at a time.
+
+        Args:
+            data (bytes | memoryview): Raw bytes of any length
+        """
+        self.reader.feed(data)  # type: ignore
+        if self.metrics is not None:
+            self.metrics.bytes.add(len(data))
+
+    def feed(self, data: bytes | memoryview) -> list[Any]:
+        """Buffer received bytes and parse every frame they complete.
+
+        Args:
+            data (bytes | memoryview): Raw bytes of any length
+
+        Returns:
+            list[Any]: Parsed frames in stream order, empty if no frame was completed. Frames which are corrupt or discarded by the parser are left out and counted in stats.
+        """
+        self.push(data)
+        parsed = []
+        while (new_data := self.next_parsed()) is not None:
+            parsed.append(new_data)
+        return parsed
+
+    def next_parsed(self) -> Optional[Any]:
+        """Parse the next complete frame in the buffer, skipping frames which are corrupt or discarded by the parser.
+
+        Returns:
+            Optional[Any]: Parsed frame, or None if more bytes are needed.
+        """
+        while (frame := self.next_frame()) is not None:
+            new_data = self.parse_frame(frame)
+            if new_data is not None:
+                return new_data
+        return None
+
+    def next_frame(self) -> Optional[memoryview]:
+        """Return the next complete raw frame in the buffer without parsing it, for frames which are parsed elsewhere.
+
+        Returns:
+            Optional[memoryview]: View of the frame starting with the magic word, valid until the next call to :meth:`push` or :meth:`feed`. None if no complete frame is buffered.
+        """
+        metrics = self.metrics
+        if metrics is None:
+            return self.reader.next_frame()
+
+        start = perf_counter()
+        frame = self.reader.next_frame()
+        self._scan_time += perf_counter() - start
+        if frame is not None:
+            metrics.sync_scan.record(self._scan_time)
+            self._scan_time = 0.0
+            if self.reader.frame_time is not None:
+                metrics.read.record(monotonic() - self.reader.frame_time)
+        return frame
+
+    def parse_frame(self, frame: memoryview) -> Optional[Any]:
+        """Parse a single raw frame, counting it as corrupt if the parser fails on it, or as discarded if the parser returns None.
+
+        Args:
+            frame (memoryview): Raw frame starting with the magic word
+
+        Returns:
+            Optional[Any]: Parsed frame, or None if it was corrupt or discarded.
+        """
+        if self.on_frame is not None:
+            self.on_frame(frame)
+        start = perf_counter()
+        try:
+            new_data = self._parse_packet(frame[len(MAGIC_NUMBER) :])
+        except (IndexError, ValueError, struct.error) as _:
+            self.reader.stats.corrupt += 1
+            return None
+
+        if new_data is None:
+            self.reader.stats.discarded += 1
+            return None
+
+        stamp(new_data, self.reader.frame_time, monotonic())
+        if self.clock is not None:
+            self.clock.stamp(new_data)
+        if self.metrics is not None:
+            self.metrics.parse.record(perf_counter() - start)
+            self.metrics.count_frame(new_data)
+        return new_data
+
+    def _parse_packet(self, packet: memoryview) -> Optional[Any]:
+        """Parse a packet with the parser. With metrics, parsers with a columnar form which hand out dicts parse with parse_frame and convert with to_dict here, so the time spent decoding and transforming is recorded."""
+        parse_frame = getattr(self.parser, "parse_frame", None)
+        if (
+            self.metrics is None
+            or parse_frame is None
+            or getattr(self.parser, "columnar", True)
+        ):
+            return self.parser.parse_packet(packet)
+
+        parsed = parse_frame(packet)
+        if parsed is None:
+            return None
+        start = perf_counter()
+        new_data = parsed.to_dict()
+        self.metrics.transform.record(perf_counter() - start)
+        return new_data
+
+    async def read(self, s: AioSerial) -> Any:
+        """Read from a serial port until a frame was parsed.
+
+        Args:
+            s (AioSerial): Serial to read data from
+
+        Returns:
+            Any: Parsed frame
+        """
+        while True:
+            frame = self.next_frame()
+            if frame is None:
+                # Read all bytes waiting in the OS buffer, or at least as many as are needed to complete the frame
+                data = await s.read_async(max(s.in_waiting, self.bytes_missing()))
+                if data is None:
+                    raise SerialException()
+                self.push(data)
+                continue
+
+            new_data = self.parse_frame(frame)
+            if new_data is not None:
+                return new_data
@@ -0,0 +1,23 @@
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class TlvSchema:
+    """Declares how the payload of one TLV type is laid out and decoded. Parsers look TLVs up in a dict of schemas by type, so supporting another firmware means registering its schemas.
+
+    Example:
+        >>> parser.register_tlv(12, TlvSchema("presence", np.dtype("<u4")))
+        >>> frame.decoded(12)
+    """
+
+    name: str
+    """Name of the TLV, for display"""
+    dtype: np.dtype
+    """Layout of one record, the payload is an array of these"""
+    annotates: Optional[int] = None
+    """Type of the TLV whose records this TLV adds fields to, like side info for points. It may not have more records than that TLV."""
+    transform: Optional[Callable[[np.ndarray, Any], Any]] = None
+    """Turns the records and the frame they belong to into the decoded value. Without it, the decoded value is the records themselves."""
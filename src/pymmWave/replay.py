@@ -0,0 +1,169 @@
+from asyncio import get_running_loop, sleep
+from time import time
+from typing import Dict, Optional
+
+from .capture import read_capture
+from .constants import QueuePolicy
+from .frame_queue import FrameQueue
+from .frame_reader import FrameStats
+from .parsing.area_scanner.area_scanner_parser import AreaScannerParser
+from .parsing.sensor_parser import PacketParser
+from .parsing.stream_parser import StreamParser
+from .sensor import Sensor
+
+
+class ReplaySensor(Sensor):
+    """:obj:`Sensor<pymmWave.sensor.Sensor>` implementation which plays back a capture file recorded with :meth:`IWR6843AOP.start_recording<pymmWave.IWR6843AOP.IWR6843AOP.start_recording>`.
+    Frames are parsed with any PacketParser, and handed out with the same semantics as a live sensor. Playback runs at the recorded pace, scaled, or as fast as possible.
+    """
+
+    parser: PacketParser
+    """The parser used to parse the recorded frames. Defaults to AreaScannerParser()"""
+
+    def __init__(
+        self,
+        name: str,
+        path: str,
+        speed: Optional[float] = 1.0,
+        queue_size: int = 1,
+        queue_policy: QueuePolicy = QueuePolicy.DROP_OLDEST,
+    ):
+        """Initialize the sensor
+
+        Args:
+            name (str): Public name of the sensor
+            path (str): Capture file to play back
+            speed (Optional[float], optional): Playback speed relative to the recording, e.g. 2.0 plays twice as fast. None plays as fast as possible. Defaults to 1.0.
+            queue_size (int, optional): Number of parsed frames kept for get_data. Defaults to 1.
+            queue_policy (QueuePolicy, optional): What happens to new frames when the queue is full. Use QueuePolicy.BLOCK to process every frame when playing as fast as possible. Defaults to QueuePolicy.DROP_OLDEST.
+        """
+        super().__init__()
+        if speed is not None and speed <= 0:
+            raise ValueError("Playback speed must be positive")
+
+        self.name = name
+        self.path = path
+        self.speed = speed
+        self._is_alive: bool = True
+        self._active_data: FrameQueue[Dict] = FrameQueue(queue_size, queue_policy)
+        self._freq: float = 10.0
+        self._last_t: float = 0.0
+
+        self.parser: PacketParser = AreaScannerParser()
+        self._stream = StreamParser(self.parser)
+
+    def model(self) -> str:
+        """Returns the model of this sensor.
+
+        Returns:
+            str: "Replay"
+        """
+        return "Replay"
+
+    def is_alive(self) -> bool:
+        """Check if playback is still running or about to start.
+
+        Returns:
+            bool: False once the capture file was played back entirely, or the sensor was stopped.
+        """
+        return self._is_alive
+
+    async def start_sensor(self) -> None:
+        """Plays back the capture file, placing parsed frames into the queue. Returns at the end of the file, or once the sensor is stopped.
+
+        Raises:
+            Exception: If playback already ended.
+            ValueError: If the file is not a capture file.
+        """
+        if not self._is_alive:
+            raise Exception("Playback already ended")
+
+        self._last_t = time()
+        loop = get_running_loop()
+        start_time = loop.time()
+        first_timestamp_ns: Optional[int] = None
+        self._stream.parser = self.parser
+
+        for timestamp_ns, raw_frame in read_capture(self.path):
+            if not self._is_alive:
+                break
+
+            if self.speed is None:
+                await sleep(0)  # Still let consumers run
+            else:
+                if first_timestamp_ns is None:
+                    first_timestamp_ns = timestamp_ns
+                due = (
+                    start_time + (timestamp_ns - first_timestamp_ns) / 1e9 / self.speed
+                )
+                await sleep(max(0.0, due - loop.time()))
+
+            # The stream validates the frame and keeps the same statistics as for a live sensor
+            for new_data in self._stream.feed(raw_frame):
+                await self._put(new_data)
+
+        self._is_alive = False
+        return None
+
+    def _frame_queues(self) -> list[FrameQueue]:
+        return [self._active_data] + super()._frame_queues()
+
+    async def get_data(self) -> Dict:
+        """Returns data when it is ready. This function also updates the frequency measurement of the sensor.
+        This function is blocking.
+
+        Returns:
+            dict: Sensor data
+        """
+        data = await self._active_data.get()
+        self._dequeued(data)
+        tt = time()
+        self._freq = (1 / (tt - self._last_t)) * 0.5 + self._freq * 0.5
+        self._last_t = tt
+        return data
+
+    def get_data_nowait(self) -> Optional[Dict]:
+        """Returns data if it is ready, otherwise none. This function also updates the frequency measurement of the sensor if data is available.
+
+        Returns:
+            Optional[dict]: Data if there is data available, otherwise returns None.
+        """
+        if not self._active_data.empty():
+            tt = time()
+            self._freq = (1 / (tt - self._last_t)) * 0.5 + self._freq * 0.5
+            self._last_t = tt
+            data = self._active_data.get_nowait()
+            self._dequeued(data)
+            return data
+
+        return None
+
+    def stop_sensor(self) -> None:
+        """Stops playback."""
+        self._is_alive = False
+
+    @property
+    def frame_stats(self) -> FrameStats:
+        """Counters for the frames played back, including lost, corrupt and resynchronized frames."""
+        return self._stream.stats
+
+    @property
+    def dropped_frames(self) -> int:
+        """Number of parsed frames discarded because the queue was full."""
+        return self._active_data.dropped
+
+    @property
+    def overwritten_frames(self) -> int:
+        """Number of queued frames replaced by a newer frame because the queue was full."""
+        return self._active_data.overwritten
+
+    def get_update_freq(self) -> float:
+        """Returns the frequency that the sensor is returning data at, which is the rate the application is successfully getting data.
+
+        Returns:
+            float: Hz
+        """
+        return self._freq
+
+    def __repr__(self) -> str:
+        return f"{self.model()} of {self.path} is alive: {self._is_alive} at {self._freq}Hz."
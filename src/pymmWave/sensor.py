@@ -1,10 +1,74 @@
 from abc import ABC, abstractmethod
+from asyncio import QueueEmpty, QueueFull
 from enum import Enum
 from typing import Any, Dict, Optional
 
 from scipy.spatial.transform.rotation import Rotation
 
+from .clock import ClockModel
+from .constants import QueuePolicy
+from .frame_queue import FrameQueue
 from .logging import Logger, StdOutLogger
+from .timestamps import FrameTimestamps, mark_dequeued
+
+
+class Subscription(object):
+    """Receives every frame of a :obj:`Sensor<pymmWave.sensor.Sensor>` through its own bounded queue. Create one with :meth:`Sensor.subscribe`.
+    Frames are parsed once and the same object is handed to every subscription, so they must be treated as read-only.
+    """
+
+    def __init__(self, sensor: "Sensor", maxsize: int, policy: QueuePolicy):
+        self._sensor = sensor
+        self._frames: FrameQueue[Dict] = FrameQueue(maxsize, policy)
+
+    async def get(self) -> Dict:
+        """Returns the next frame for this subscription, waiting until one is available.
+
+        Returns:
+            dict: Sensor data
+        """
+        data = await self._frames.get()
+        self._sensor._dequeued(data)
+        return data
+
+    def get_nowait(self) -> Optional[Dict]:
+        """Returns the next frame for this subscription if there is one.
+
+        Returns:
+            Optional[dict]: Data if there is data available, otherwise returns None.
+        """
+        try:
+            data = self._frames.get_nowait()
+        except QueueEmpty:
+            return None
+        self._sensor._dequeued(data)
+        return data
+
+    @property
+    def dropped_frames(self) -> int:
+        """Number of frames this subscription missed because its queue was full."""
+        return self._frames.dropped
+
+    @property
+    def overwritten_frames(self) -> int:
+        """Number of queued frames replaced by a newer frame because the queue was full."""
+        return self._frames.overwritten
+
+    def close(self) -> None:
+        """Stop receiving frames."""
+        self._sensor.unsubscribe(self)
+
+    def __enter__(self) -> "Subscription":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def __aiter__(self) -> "Subscription":
+        return self
+
+    async def __anext__(self) -> Dict:
+        return await self.get()
 
 
 class Sensor(ABC):
@@ -15,6 +79,7 @@ class Sensor(ABC):
     def __init__(self) -> None:
         super().__init__()
         self._log: Logger = StdOutLogger()
+        self._subscriptions: list[Subscription] = []
 
     def set_logger(self, new_logger: Logger):
         """Replace the default stdout logger with another.
@@ -32,6 +97,79 @@ class Sensor(ABC):
         """Report an error to the logger."""
         self._log.log(*args, **kwargs)
 
+    def subscribe(
+        self, maxsize: int = 1, policy: QueuePolicy = QueuePolicy.DROP_OLDEST
+    ) -> Subscription:
+        """Subscribe to the frames of this sensor. Every subscription receives every frame, independent of get_data and other subscriptions.
+
+        Args:
+            maxsize (int, optional): Number of frames buffered for this subscription. Defaults to 1.
+            policy (QueuePolicy, optional): What happens to new frames when the buffer is full. QueuePolicy.BLOCK pauses reading for all consumers of the sensor. Defaults to QueuePolicy.DROP_OLDEST.
+
+        Returns:
+            Subscription: The new subscription
+
+        Example:
+            >>> async for data in my_sensor.subscribe(maxsize=10, policy=QueuePolicy.BLOCK):
+            ...     print(data["frame_number"])
+        """
+        subscription = Subscription(self, maxsize, policy)
+        self._subscriptions.append(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """Remove a subscription. Frames still buffered for it are discarded.
+
+        Args:
+            subscription (Subscription): Subscription returned by subscribe
+        """
+        if subscription in self._subscriptions:
+            self._subscriptions.remove(subscription)
+        # Wakes up a reader waiting for room in this subscription
+        subscription._frames.clear()
+
+    def _frame_queues(self) -> list[FrameQueue]:
+        """Internal func listing every queue a new frame is put into. Sensors with a queue of their own add it here."""
+        return [subscription._frames for subscription in self._subscriptions]
+
+    def _dequeued(self, data: Dict) -> None:
+        """Internal func called whenever a consumer takes a frame from a queue of this sensor."""
+        mark_dequeued(data)
+
+    def _may_block(self) -> bool:
+        """Internal func which checks if publishing a frame can wait for consumers."""
+        return any(queue.policy == QueuePolicy.BLOCK for queue in self._frame_queues())
+
+    def _publish(self, data: Dict) -> None:
+        """Internal func to hand a parsed frame to all consumers. Must be called from the event loop.
+
+        Raises:
+            QueueFull: If a queue with policy QueuePolicy.BLOCK is full. The frame is then not handed to any consumer.
+        """
+        queues = self._frame_queues()
+        for queue in queues:
+            if queue.policy == QueuePolicy.BLOCK and queue.full():
+                raise QueueFull()
+
+        for queue in queues:
+            queue.put_nowait(data)
+
+    async def _put(self, data: Dict) -> None:
+        """Internal func to hand a parsed frame to all consumers, waiting while a queue with policy QueuePolicy.BLOCK is full."""
+        while True:
+            for queue in self._frame_queues():
+                if queue.policy == QueuePolicy.BLOCK and queue.full():
+                    await queue.wait_for_room()
+                    break
+            else:
+                self._publish(data)
+                return
+
+    @property
+    def clock(self) -> Optional[ClockModel]:
+        """Model of the device clock used to correct the timestamps of frames, None if the sensor keeps none."""
+        return None
+
     @abstractmethod
     def model(self) -> str:
         """Return the model of a sensor
@@ -103,6 +241,28 @@ class SpatialSensor(object):
         # This speeds up code later
         self.pitch_rads: Rotation = Rotation.from_rotvec(pitch_rads)  # type: ignore
 
+    @property
+    def clock(self) -> Optional[ClockModel]:
+        """Model of the device clock of the sensor, None if it keeps none."""
+        return self.sensor.clock
+
+    def timestamp(self, data: Any) -> Optional[float]:
+        """Host time of a frame of this sensor, comparable with frames of other sensors.
+        The corrected timestamp if the clock model of the sensor set one, as it is free of transport delays. Otherwise the receive time.
+
+        Args:
+            data (Any): Frame handed out by the sensor
+
+        Returns:
+            Optional[float]: Seconds of time.monotonic(), None if the frame has no timestamps.
+        """
+        timestamps = FrameTimestamps.of(data)
+        if timestamps is None:
+            return None
+        if timestamps.corrected is not None:
+            return timestamps.corrected
+        return timestamps.received
+
 
 class InvalidSensorException(Exception):
     def __init__(self, message: str, errors: str):
@@ -0,0 +1,274 @@
+import os
+import select
+import struct
+import tty
+from threading import Event, Thread
+from time import monotonic
+from typing import Optional
+
+import numpy as np
+
+from .constants import MAGIC_NUMBER
+
+# Area Scanner header after the magic word: version, total packet length, platform, frame number, time in cycles,
+# number of detected objects, number of TLVs, subframe number and number of static detected objects.
+_HEADER = struct.Struct("<9I")
+_TLV_HEADER = struct.Struct("<2I")
+
+_VERSION = 0x03060000
+_PLATFORM = 0xA6843
+_CPU_CLOCK_HZ = 200e6
+
+
+def build_area_scanner_frame(
+    frame_number: int,
+    dynamic_points: np.ndarray,
+    static_points: np.ndarray,
+    tracked_objects: np.ndarray,
+    time_cpu_cycles: int = 0,
+) -> bytes:
+    """Build a raw frame in the format of the Area Scanner firmware, including the magic word.
+
+    Args:
+        frame_number (int): Frame number
+        dynamic_points (np.ndarray): N x 7 array of range, angle, elev, doppler, snr, noise and target_id per point (TLVs 1, 7 and 11)
+        static_points (np.ndarray): M x 6 array of x, y, z, doppler, snr and noise per point (TLVs 8 and 9)
+        tracked_objects (np.ndarray): K x 10 array of target_id, pos_x, pos_y, vel_x, vel_y, acc_x, acc_y, pos_z, vel_z and acc_z per object (TLV 10)
+        time_cpu_cycles (int, optional): Device time in cycles. Defaults to 0.
+
+    Returns:
+        bytes: The frame, padded to a multiple of 32 bytes like the firmware does
+    """
+    dynamic_points = np.asarray(dynamic_points, dtype=np.float64).reshape(-1, 7)
+    static_points = np.asarray(static_points, dtype=np.float64).reshape(-1, 6)
+    tracked_objects = np.asarray(tracked_objects, dtype=np.float64).reshape(-1, 10)
+
+    tlvs: list[tuple[int, bytes]] = []
+    if len(dynamic_points):
+        tlvs.append((1, dynamic_points[:, 0:4].astype("<f4").tobytes()))
+        tlvs.append((7, dynamic_points[:, 4:6].astype("<u2").tobytes()))
+    if len(static_points):
+        tlvs.append((8, static_points[:, 0:4].astype("<f4").tobytes()))
+        tlvs.append((9, static_points[:, 4:6].astype("<u2").tobytes()))
+    if len(tracked_objects):
+        objects = np.empty(
+            len(tracked_objects), dtype=[("id", "<u4"), ("values", "<f4", 9)]
+        )
+        objects["id"] = tracked_objects[:, 0]
+        objects["values"] = tracked_objects[:, 1:]
+        tlvs.append((10, objects.tobytes()))
+    if len(dynamic_points):
+        tlvs.append((11, dynamic_points[:, 6].astype("<u1").tobytes()))
+
+    body = b"".join(_TLV_HEADER.pack(t, len(payload)) + payload for t, payload in tlvs)
+    total_packet_len = len(MAGIC_NUMBER) + _HEADER.size + len(body)
+    padding = -total_packet_len % 32
+    total_packet_len += padding
+
+    header = _HEADER.pack(
+        _VERSION,
+        total_packet_len,
+        _PLATFORM,
+        frame_number,
+        time_cpu_cycles & 0xFFFFFFFF,
+        len(dynamic_points),
+        len(tlvs),
+        0,
+        len(static_points),
+    )
+    return MAGIC_NUMBER + header + body + bytes(padding)
+
+
+class AreaScannerSimulator:
+    """Simulates an IWR6843AOP running the Area Scanner firmware on two pseudo-terminals, so :obj:`IWR6843AOP<pymmWave.IWR6843AOP.IWR6843AOP>` can run without hardware.
+    The config port answers every command like the firmware CLI does, and after sensorStart the data port streams frames with random points and tracked objects.
+    Requires pseudo-terminals, which are available on Linux and MacOS.
+
+    Example:
+        >>> with AreaScannerSimulator(frame_rate=20) as sim:
+        ...     my_sensor.connect_config(sim.config_port, 115200)
+        ...     my_sensor.connect_data(sim.data_port, 921600)
+    """
+
+    def __init__(
+        self,
+        frame_rate: Optional[float] = 20.0,
+        num_dynamic_points: int = 64,
+        num_static_points: int = 16,
+        num_tracked_objects: int = 2,
+        seed: Optional[int] = None,
+    ):
+        """Initialize the simulator. The ports exist once it is started.
+
+        Args:
+            frame_rate (Optional[float], optional): Frames per second, or None to send as fast as the port is read. Defaults to 20.0.
+            num_dynamic_points (int, optional): Dynamic points per frame. Defaults to 64.
+            num_static_points (int, optional): Static points per frame. Defaults to 16.
+            num_tracked_objects (int, optional): Tracked objects per frame. Defaults to 2.
+            seed (Optional[int], optional): Seed for the random point clouds. Defaults to None.
+        """
+        self.frame_rate = frame_rate
+        self.num_dynamic_points = num_dynamic_points
+        self.num_static_points = num_static_points
+        self.num_tracked_objects = num_tracked_objects
+
+        self.config_port: Optional[str] = None
+        """Device name of the config port."""
+        self.data_port: Optional[str] = None
+        """Device name of the data port."""
+        self.frames_sent: int = 0
+        """Number of frames written to the data port."""
+
+        self._rng = np.random.default_rng(seed)
+        self._fds: list[int] = []
+        self._config_fd = -1
+        self._data_fd = -1
+        self._streaming = Event()
+        self._stopped = Event()
+        self._threads: list[Thread] = []
+
+    def _open_pty(self) -> tuple[int, str]:
+        """Open a pseudo-terminal pair in raw mode, returning the controlling side and the device name of the other side."""
+        master, slave = os.openpty()
+        tty.setraw(slave)
+        # The device side stays open, so the simulator keeps working when a client disconnects
+        self._fds += [master, slave]
+        return master, os.ttyname(slave)
+
+    def start(self) -> None:
+        """Create the ports and start answering on them."""
+        self._stopped.clear()
+        self._config_fd, self.config_port = self._open_pty()
+        self._data_fd, self.data_port = self._open_pty()
+
+        self._threads = [
+            Thread(target=self._serve_config, name="simulator config", daemon=True),
+            Thread(target=self._serve_data, name="simulator data", daemon=True),
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def stop(self) -> None:
+        """Stop the simulator and close its ports."""
+        self._stopped.set()
+        self._streaming.clear()
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+
+        for fd in self._fds:
+            os.close(fd)
+        self._fds = []
+
+    def __enter__(self) -> "AreaScannerSimulator":
+        self.start()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.stop()
+
+    def _write_all(self, fd: int, data: bytes) -> bool:
+        """Write everything, giving up when the simulator is stopped. Returns False if it gave up."""
+        view = memoryview(data)
+        while view:
+            _, writable, _ = select.select([], [fd], [], 0.1)
+            if self._stopped.is_set():
+                return False
+            if writable:
+                view = view[os.write(fd, view) :]
+        return True
+
+    def _answer(self, command: str) -> str:
+        """Reply of the firmware CLI to a command."""
+        name = command.split(" ")[0]
+        if name == "sensorStop" and not self._streaming.is_set():
+            return "Ignored: Sensor is already stopped"
+
+        if name == "sensorStart":
+            self._streaming.set()
+        elif name == "sensorStop":
+            self._streaming.clear()
+        return "Done"
+
+    def _serve_config(self) -> None:
+        """Body of the config port thread."""
+        pending = b""
+        while not self._stopped.is_set():
+            readable, _, _ = select.select([self._config_fd], [], [], 0.1)
+            if not readable:
+                continue
+
+            pending += os.read(self._config_fd, 1024)
+            *lines, pending = pending.split(b"\n")
+            for line in lines:
+                command = line.decode(errors="replace").strip()
+                if not command:
+                    continue
+                # The CLI echoes every command before replying
+                self._write_all(
+                    self._config_fd, f"{command}\n{self._answer(command)}\n".encode()
+                )
+
+    def _random_frame(self, frame_number: int, time_cpu_cycles: int) -> bytes:
+        """Build a frame with random contents."""
+        rng = self._rng
+
+        n = self.num_dynamic_points
+        dynamic_points = np.column_stack(
+            [
+                rng.uniform(0.2, 9.0, n),  # range
+                rng.uniform(-1.0, 1.0, n),  # angle
+                rng.uniform(-0.5, 0.5, n),  # elev
+                rng.normal(0.0, 0.5, n),  # doppler
+                rng.integers(0, 2000, n),  # snr
+                rng.integers(0, 2000, n),  # noise
+                rng.choice([0, 1, 253, 254, 255], n),  # target_id
+            ]
+        )
+
+        m = self.num_static_points
+        static_points = np.column_stack(
+            [
+                rng.uniform(-4.0, 4.0, m),  # x
+                rng.uniform(0.2, 9.0, m),  # y
+                rng.uniform(-1.0, 1.0, m),  # z
+                np.zeros(m),  # doppler
+                rng.integers(0, 2000, m),  # snr
+                rng.integers(0, 2000, m),  # noise
+            ]
+        )
+
+        k = self.num_tracked_objects
+        tracked_objects = np.column_stack([np.arange(k), rng.normal(0.0, 1.0, (k, 9))])
+
+        return build_area_scanner_frame(
+            frame_number,
+            dynamic_points,
+            static_points,
+            tracked_objects,
+            time_cpu_cycles,
+        )
+
+    def _serve_data(self) -> None:
+        """Body of the data port thread."""
+        start = monotonic()
+        next_frame = start
+        frame_number = 0
+        while not self._stopped.is_set():
+            if not self._streaming.wait(0.1):
+                next_frame = monotonic()
+                continue
+
+            if self.frame_rate is not None:
+                delay = next_frame - monotonic()
+                if delay > 0 and self._stopped.wait(delay):
+                    return
+                next_frame += 1 / self.frame_rate
+
+            frame_number += 1
+            time_cpu_cycles = int((monotonic() - start) * _CPU_CLOCK_HZ)
+            if not self._write_all(
+                self._data_fd, self._random_frame(frame_number, time_cpu_cycles)
+            ):
+                return
+            self.frames_sent += 1
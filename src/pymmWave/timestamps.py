@@ -0,0 +1,94 @@
+from dataclasses import dataclass
+from time import monotonic
+from typing import Any, Optional
+
+
+@dataclass(slots=True)
+class FrameTimestamps:
+    """Host times at which a frame passed the stages of the pipeline, in seconds of time.monotonic().
+    Sensors attach them to every frame they parse. Frame objects carry them as their timestamps attribute. Dicts carry the same fields as a dict of floats under the "timestamps" key,
+    so they stay JSON serializable. Use :meth:`of` to read them from either.
+    """
+
+    received: Optional[float] = None
+    """When the magic word of the frame was found in the received data"""
+    parsed: Optional[float] = None
+    """When parsing the frame completed"""
+    dequeued: Optional[float] = None
+    """When a consumer took the frame from a queue of the sensor. With several consumers, the first one."""
+    corrected: Optional[float] = None
+    """When the frame would have been received without transport delays, according to the :obj:`ClockModel<pymmWave.clock.ClockModel>` of the sensor. Use this to align frames of several sensors."""
+
+    @property
+    def latency(self) -> Optional[float]:
+        """Seconds from receiving the frame until it was dequeued, None if either is unknown."""
+        if self.received is None or self.dequeued is None:
+            return None
+        return self.dequeued - self.received
+
+    def age(self) -> Optional[float]:
+        """Seconds since the frame was received, None if that is unknown."""
+        if self.received is None:
+            return None
+        return monotonic() - self.received
+
+    @staticmethod
+    def of(data: Any) -> Optional["FrameTimestamps"]:
+        """Returns the timestamps of a parsed frame. For dicts, they are a copy, so changing them does not change the frame.
+
+        Args:
+            data (Any): Frame handed out by a sensor or parser
+
+        Returns:
+            Optional[FrameTimestamps]: Timestamps of the frame, or None if it has none.
+        """
+        if isinstance(data, dict):
+            timestamps = data.get("timestamps")
+            if not isinstance(timestamps, dict):
+                return None
+            return FrameTimestamps(
+                timestamps.get("received"),
+                timestamps.get("parsed"),
+                timestamps.get("dequeued"),
+                timestamps.get("corrected"),
+            )
+
+        timestamps = getattr(data, "timestamps", None)
+        return timestamps if isinstance(timestamps, FrameTimestamps) else None
+
+
+def stamp(data: Any, received: Optional[float], parsed: float) -> None:
+    """Record when a parsed frame was received and parsed. Dicts get a "timestamps" key, and frame objects with timestamps are updated. Other frames are left alone."""
+    if isinstance(data, dict):
+        data["timestamps"] = {
+            "received": received,
+            "parsed": parsed,
+            "dequeued": None,
+            "corrected": None,
+        }
+        return
+
+    timestamps = FrameTimestamps.of(data)
+    if timestamps is not None:
+        timestamps.received = received
+        timestamps.parsed = parsed
+
+
+def set_timestamp(data: Any, name: str, value: float) -> None:
+    """Set one of the timestamps of a parsed frame, a dict or a frame object. Frames without timestamps are left alone."""
+    if isinstance(data, dict):
+        timestamps = data.get("timestamps")
+        if isinstance(timestamps, dict):
+            timestamps[name] = value
+        return
+
+    timestamps = FrameTimestamps.of(data)
+    if timestamps is not None:
+        setattr(timestamps, name, value)
+
+
+def mark_dequeued(data: Any) -> None:
+    """Record that a consumer took a frame from a queue, unless an earlier consumer already did."""
+    timestamps = FrameTimestamps.of(data)
+    if timestamps is not None and timestamps.dequeued is None:
+        set_timestamp(data, "dequeued", monotonic())
@@ -1,3 +1,5 @@
+from typing import Optional
+
 import numpy as np
 
 
@@ -21,6 +23,182 @@ def load_cfg_file(filepath: str) -> list[str]:
     return data
 
 
+def rotation_matrix(elevation_tilt: float, azimuth_tilt: float = 0) -> np.ndarray:
+    """
+    Rotation for a sensor with the given tilts, applied by the transform functions. Compute it once and pass it to the array transforms to reuse it.
+
+    :param elevation_tilt: Elevation tilt of the sensor in radians.
+    :param azimuth_tilt: Azimuth tilt of the sensor in radians.
+    :return: 3x3 rotation matrix, the azimuth rotation applied after the elevation rotation.
+    """
+
+    rotmat_az = np.array(
+        [
+            [np.cos(azimuth_tilt), -np.sin(azimuth_tilt), 0],
+            [np.sin(azimuth_tilt), np.cos(azimuth_tilt), 0],
+            [0, 0, 1],
+        ]
+    )
+
+    rotmat_el = np.array(
+        [
+            [1, 0, 0],
+            [0, np.cos(elevation_tilt), -np.sin(elevation_tilt)],
+            [0, np.sin(elevation_tilt), np.cos(elevation_tilt)],
+        ]
+    )
+
+    return np.dot(rotmat_az, rotmat_el)
+
+
+def _output(points: np.ndarray, out: Optional[np.ndarray]) -> np.ndarray:
+    """Output array for an array function, checking the input has 3 components per point."""
+    if points.shape[-1:] != (3,):
+        raise ValueError(f"Expected points of 3 components, got shape {points.shape}")
+    if out is None:
+        return np.empty(points.shape, np.result_type(points.dtype, np.float32))
+    if out.shape != points.shape:
+        raise ValueError(
+            f"Output of shape {out.shape} for points of shape {points.shape}"
+        )
+    return out
+
+
+def spherical_to_cartesian_array(
+    points: np.ndarray, out: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Convert many points from spherical to cartesian coordinates.
+
+    :param points: Array of shape (..., 3) holding range in meters, azimuth angle and elevation angle in radians.
+    :param out: Array of the same shape to write the result to, may be points itself.
+    :return: Array of shape (..., 3) holding x, y and z.
+    """
+
+    points = np.asarray(points)
+    out = _output(points, out)
+
+    range = points[..., 0]
+    angle = points[..., 1]
+    elev = points[..., 2]
+
+    r = range * np.cos(elev)
+    z = range * np.sin(elev)
+    x = r * np.sin(angle)
+    y = r * np.cos(angle)
+
+    out[..., 0] = x
+    out[..., 1] = y
+    out[..., 2] = z
+    return out
+
+
+def cartesian_to_spherical_array(
+    points: np.ndarray, out: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Convert many points from cartesian to spherical coordinates. Points at the origin get an angle and elevation of 0.
+
+    :param points: Array of shape (..., 3) holding x, y and z.
+    :param out: Array of the same shape to write the result to, may be points itself.
+    :return: Array of shape (..., 3) holding range, angle and elev.
+    """
+
+    points = np.asarray(points)
+    out = _output(points, out)
+
+    x = points[..., 0]
+    y = points[..., 1]
+    z = points[..., 2]
+
+    range = np.sqrt(x**2 + y**2 + z**2)
+    nonzero = range != 0
+    safe_range = np.where(nonzero, range, 1)
+    elev = np.where(nonzero, np.arcsin(np.clip(z / safe_range, -1, 1)), 0)
+    angle = np.where(nonzero, np.arctan2(x, y), 0)
+
+    out[..., 0] = range
+    out[..., 1] = angle
+    out[..., 2] = elev
+    return out
+
+
+def transform_direction_array(
+    vectors: np.ndarray,
+    elevation_tilt: float = 0,
+    azimuth_tilt: float = 0,
+    out: Optional[np.ndarray] = None,
+    rotation: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    Transform many direction vectors using elevation and azimuth tilts.
+
+    :param vectors: Array of shape (..., 3) holding the raw X, Y and Z components.
+    :param elevation_tilt: Elevation tilt of the sensor in radians.
+    :param azimuth_tilt: Azimuth tilt of the sensor in radians.
+    :param out: Array of the same shape to write the result to, may be vectors itself.
+    :param rotation: Rotation from rotation_matrix, used instead of the tilts.
+    :return: Array of shape (..., 3) holding the transformed vectors.
+    """
+
+    vectors = np.asarray(vectors)
+    out = _output(vectors, out)
+    if rotation is None:
+        rotation = rotation_matrix(elevation_tilt, azimuth_tilt)
+
+    return np.matmul(vectors, rotation.T, out=out)
+
+
+def transform_point_array(
+    points: np.ndarray,
+    height: float,
+    elevation_tilt: float = 0,
+    azimuth_tilt: float = 0,
+    out: Optional[np.ndarray] = None,
+    rotation: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    Transform many points using a given height from the ground and elevation tilt.
+
+    :param points: Array of shape (..., 3) holding the raw X, Y and Z coordinates.
+    :param height: Height of the sensor from the ground in meters.
+    :param elevation_tilt: Elevation tilt of the sensor in radians.
+    :param azimuth_tilt: Azimuth tilt of the sensor in radians.
+    :param out: Array of the same shape to write the result to, may be points itself.
+    :param rotation: Rotation from rotation_matrix, used instead of the tilts.
+    :return: Array of shape (..., 3) holding the transformed points.
+    """
+
+    out = transform_direction_array(points, elevation_tilt, azimuth_tilt, out, rotation)
+    out[..., 2] += height
+    return out
+
+
+def transform_spherical_point_array(
+    points: np.ndarray,
+    height: float,
+    elevation_tilt: float = 0,
+    azimuth_tilt: float = 0,
+    out: Optional[np.ndarray] = None,
+    rotation: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    Transform many points in spherical coordinates using a given height from the ground and elevation tilt.
+
+    :param points: Array of shape (..., 3) holding range in meters, azimuth angle and elevation angle in radians.
+    :param height: Height of the sensor from the ground in meters.
+    :param elevation_tilt: Elevation tilt of the sensor in radians.
+    :param azimuth_tilt: Azimuth tilt of the sensor in radians.
+    :param out: Array of the same shape to write the result to, may be points itself.
+    :param rotation: Rotation from rotation_matrix, used instead of the tilts.
+    :return: Array of shape (..., 3) holding the transformed range, angle and elev.
+    """
+
+    out = spherical_to_cartesian_array(points, out)
+    transform_point_array(out, height, elevation_tilt, azimuth_tilt, out, rotation)
+    return cartesian_to_spherical_array(out, out)
+
+
 def spherical_to_cartesian(
     range: float, angle: float, elev: float
 ) -> tuple[float, float, float]:
@@ -33,11 +211,9 @@ def spherical_to_cartesian(
     :return: Cartesian coordinates.
     """
 
-    r = range * np.cos(elev)
-    x: float = float(r * np.sin(angle))
-    y: float = float(r * np.cos(angle))
-    z: float = float(range * np.sin(elev))
-
+    x, y, z = spherical_to_cartesian_array(
+        np.array([range, angle, elev], np.float64)
+    ).tolist()
     return x, y, z
 
 
@@ -51,15 +227,9 @@ def cartesian_to_spherical(x: float, y: float, z: float) -> tuple[float, float,
     :return: Spherical coordinates in the order: range, angle, elev.
     """
 
-    range: float = float(np.sqrt(x**2 + y**2 + z**2))
-
-    if range == 0:
-        angle: float = 0.0
-        elev: float = 0.0
-    else:
-        elev: float = float(np.arcsin(z / range))
-        angle: float = float(np.arctan2(x, y))
-
+    range, angle, elev = cartesian_to_spherical_array(
+        np.array([x, y, z], np.float64)
+    ).tolist()
     return range, angle, elev
 
 
@@ -83,27 +253,9 @@ def transform_point(
     :return: Transformed point
     """
 
-    rotmat_az = np.array(
-        [
-            [np.cos(azimuth_tilt), -np.sin(azimuth_tilt), 0],
-            [np.sin(azimuth_tilt), np.cos(azimuth_tilt), 0],
-            [0, 0, 1],
-        ]
-    )
-
-    rotmat_el = np.array(
-        [
-            [1, 0, 0],
-            [0, np.cos(elevation_tilt), -np.sin(elevation_tilt)],
-            [0, np.sin(elevation_tilt), np.cos(elevation_tilt)],
-        ]
-    )
-
-    trans = np.dot(rotmat_az, np.dot(rotmat_el, np.array([[x], [y], [z]])))
-    corr_x: float = float(trans[0, :][0])
-    corr_y: float = float(trans[1, :][0])
-    corr_z: float = float(trans[2, :][0] + height)
-
+    corr_x, corr_y, corr_z = transform_point_array(
+        np.array([x, y, z], np.float64), height, elevation_tilt, azimuth_tilt
+    ).tolist()
     return corr_x, corr_y, corr_z
 
 
@@ -125,27 +277,9 @@ def transform_direction(
     :return: Transformed velocity vector
     """
 
-    rotmat_az = np.array(
-        [
-            [np.cos(azimuth_tilt), -np.sin(azimuth_tilt), 0],
-            [np.sin(azimuth_tilt), np.cos(azimuth_tilt), 0],
-            [0, 0, 1],
-        ]
-    )
-
-    rotmat_el = np.array(
-        [
-            [1, 0, 0],
-            [0, np.cos(elevation_tilt), -np.sin(elevation_tilt)],
-            [0, np.sin(elevation_tilt), np.cos(elevation_tilt)],
-        ]
-    )
-
-    trans = np.dot(rotmat_az, np.dot(rotmat_el, np.array([[vx], [vy], [vz]])))
-    corr_vx: float = float(trans[0, :][0])
-    corr_vy: float = float(trans[1, :][0])
-    corr_vz: float = float(trans[2, :][0])
-
+    corr_vx, corr_vy, corr_vz = transform_direction_array(
+        np.array([vx, vy, vz], np.float64), elevation_tilt, azimuth_tilt
+    ).tolist()
     return corr_vx, corr_vy, corr_vz
 
 
@@ -0,0 +1,313 @@
+import os
+import struct
+import tempfile
+import unittest
+from dataclasses import FrozenInstanceError
+
+import numpy as np
+
+import src.pymmWave.utils as utils
+from src.pymmWave.constants import MAGIC_NUMBER
+from src.pymmWave.parsing.area_scanner.area_scanner_parser import AreaScannerParser
+from src.pymmWave.capture import CaptureWriter
+from src.pymmWave.parsing.area_scanner.models import AreaScannerData, AreaScannerFrame
+from src.pymmWave.parsing.tlv import TlvSchema
+from src.pymmWave.simulator import build_area_scanner_frame
+
+
+def build_packet(dynamic_points, static_points, tracked_objects) -> memoryview:
+    frame = build_area_scanner_frame(1, dynamic_points, static_points, tracked_objects)
+    return memoryview(frame)[len(MAGIC_NUMBER) :]
+
+
+class TestAreaScannerParser(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.dynamic_points = np.column_stack(
+            [
+                rng.uniform(0.2, 9.0, 50),
+                rng.uniform(-1.0, 1.0, 50),
+                rng.uniform(-0.5, 0.5, 50),
+                rng.normal(0.0, 0.5, 50),
+                rng.integers(0, 2000, 50),
+                rng.integers(0, 2000, 50),
+                rng.choice([0, 1, 253, 254, 255], 50),
+            ]
+        ).astype(np.float32)
+        self.static_points = np.column_stack(
+            [rng.normal(0.0, 3.0, (20, 4)), rng.integers(0, 2000, (20, 2))]
+        ).astype(np.float32)
+        self.tracked_objects = np.column_stack(
+            [np.arange(3), rng.normal(0.0, 1.0, (3, 9))]
+        ).astype(np.float32)
+
+        self.parser = AreaScannerParser()
+        self.parser.height = 1.5
+        self.parser.elevation_tilt = np.radians(-20)
+
+    def test_same_as_scalar_transforms(self):
+        result = self.parser.parse_packet(
+            build_packet(self.dynamic_points, self.static_points, self.tracked_objects)
+        )
+        height, tilt = self.parser.height, self.parser.elevation_tilt
+
+        self.assertEqual(len(result["dynamic_points"]), len(self.dynamic_points))
+        for point, raw in zip(result["dynamic_points"], self.dynamic_points.tolist()):
+            expected = utils.transform_spherical_point(*raw[:3], height, tilt)
+            np.testing.assert_allclose(
+                [point["range"], point["angle"], point["elev"]], expected, atol=1e-9
+            )
+            self.assertEqual(
+                [point["doppler"], point["snr"], point["noise"], point["target_id"]],
+                raw[3:],
+            )
+
+        for point, raw in zip(result["static_points"], self.static_points.tolist()):
+            expected = utils.transform_point(*raw[:3], height, tilt)
+            np.testing.assert_allclose(
+                [point["x"], point["y"], point["z"]], expected, atol=1e-9
+            )
+            self.assertEqual([point["snr"], point["noise"]], raw[4:])
+
+        for obj, raw in zip(result["tracked_objects"], self.tracked_objects.tolist()):
+            self.assertEqual(obj["target_id"], raw[0])
+            np.testing.assert_allclose(
+                [obj["pos_x"], obj["pos_y"], obj["pos_z"]],
+                utils.transform_point(raw[1], raw[2], raw[7], height, tilt),
+                atol=1e-9,
+            )
+            np.testing.assert_allclose(
+                [obj["vel_x"], obj["vel_y"], obj["vel_z"]],
+                utils.transform_direction(raw[3], raw[4], raw[8], tilt),
+                atol=1e-9,
+            )
+            np.testing.assert_allclose(
+                [obj["acc_x"], obj["acc_y"], obj["acc_z"]],
+                utils.transform_direction(raw[5], raw[6], raw[9], tilt),
+                atol=1e-9,
+            )
+
+    def test_empty_frame(self):
+        result = self.parser.parse_packet(build_packet([], [], []))
+        self.assertEqual(result["num_tlvs"], 0)
+        self.assertNotIn("dynamic_points", result)
+
+    def test_columnar(self):
+        packet = build_packet(
+            self.dynamic_points, self.static_points, self.tracked_objects
+        )
+        expected = self.parser.parse_packet(packet)
+
+        self.parser.columnar = True
+        frame = self.parser.parse_packet(packet)
+        self.assertIsInstance(frame, AreaScannerFrame)
+        self.assertEqual(frame.to_dict(), expected)
+        self.assertEqual(len(frame.dynamic_points), len(self.dynamic_points))
+        np.testing.assert_array_equal(
+            frame.dynamic_points.target_id, self.dynamic_points[:, 6]
+        )
+        np.testing.assert_array_equal(
+            frame.tracked_objects.vel[:, 0],
+            [obj["vel_x"] for obj in expected["tracked_objects"]],
+        )
+
+        data = frame.to_data()
+        self.assertEqual(data.frame_number, 1)
+        self.assertEqual(data.static_points[3].z, expected["static_points"][3]["z"])
+        self.assertEqual(data, AreaScannerData(expected))
+        self.assertFalse(hasattr(data.dynamic_points[0], "__dict__"))
+        with self.assertRaises(FrozenInstanceError):
+            data.tracked_objects[0].pos_x = 1.0
+
+    def test_lazy_decoding(self):
+        frame = self.parser.parse_frame(
+            build_packet(self.dynamic_points, self.static_points, self.tracked_objects)
+        )
+        self.assertEqual(frame.tlv_types, [1, 7, 8, 9, 10, 11])
+        np.testing.assert_array_equal(frame.tlv(1)["range"], self.dynamic_points[:, 0])
+        self.assertIsNone(frame.tlv(12))
+        self.assertNotIn(1, frame._decoded)
+
+        # Placement at the time of parsing applies
+        height = self.parser.height
+        self.parser.height = 10.0
+        np.testing.assert_allclose(
+            frame.tracked_objects.pos[0],
+            utils.transform_point(
+                *self.tracked_objects[0, [1, 2, 7]].tolist(),
+                height,
+                self.parser.elevation_tilt,
+            ),
+        )
+        self.assertNotIn(1, frame._decoded)
+        self.assertIs(frame.tracked_objects, frame.tracked_objects)
+
+    def test_side_info_without_points(self):
+        tlv = struct.pack("<2I2H", 7, 4, 100, 10)
+        packet = struct.pack("<9I", 0x03060000, 44 + len(tlv), 0, 1, 0, 0, 1, 0, 0)
+        with self.assertRaises(ValueError):
+            self.parser.parse_frame(memoryview(packet + tlv))
+
+    def test_unknown_tlv_skipped(self):
+        packet = bytes(build_packet(self.dynamic_points, [], self.tracked_objects))
+        unknown = struct.pack("<2I", 12, 8) + struct.pack("<2I", 3, 4)
+        header = bytearray(packet[:36])
+        struct.pack_into("<I", header, 4, len(packet) + len(unknown) + 8)
+        struct.pack_into("<I", header, 24, struct.unpack_from("<I", header, 24)[0] + 1)
+        packet = memoryview(bytes(header) + unknown + packet[36:])
+
+        expected = self.parser.parse_packet(
+            build_packet(self.dynamic_points, [], self.tracked_objects)
+        )
+        result = self.parser.parse_packet(packet)
+        self.assertEqual(result["dynamic_points"], expected["dynamic_points"])
+        self.assertEqual(result["tracked_objects"], expected["tracked_objects"])
+
+        frame = self.parser.parse_frame(packet)
+        self.assertEqual(frame.tlv_types[0], 12)
+        self.assertIsNone(frame.tlv(12))
+        self.assertEqual(bytes(frame.payload(12)), struct.pack("<2I", 3, 4))
+
+        # Registering a schema decodes it, without affecting other parsers
+        self.parser.register_tlv(
+            12,
+            TlvSchema(
+                "counters",
+                np.dtype("<u4"),
+                transform=lambda records, frame: int(records.sum()),
+            ),
+        )
+        self.assertEqual(self.parser.parse_frame(packet).decoded(12), 7)
+        self.assertEqual(self.parser.parse_packet(packet)["counters"], 7)
+        self.assertIsNone(AreaScannerParser().parse_frame(packet).decoded(12))
+        self.assertNotIn("counters", AreaScannerParser().parse_packet(packet))
+
+        parser = AreaScannerParser()
+        parser.register_tlv(12, TlvSchema("counters", np.dtype("<u4")))
+        self.assertEqual(parser.parse_packet(packet)["counters"], [3, 4])
+
+    def test_azimuth_tilt(self):
+        parser = AreaScannerParser(height=2.0, elevation_tilt=0.3, azimuth_tilt=0.5)
+        rotation = parser.rotation
+        parser.height = 1.0
+        self.assertIs(parser.rotation, rotation)
+        parser.azimuth_tilt = -0.4
+        self.assertIsNot(parser.rotation, rotation)
+
+        frame = parser.parse_frame(
+            build_packet(self.dynamic_points, self.static_points, self.tracked_objects)
+        )
+        for i, raw in enumerate(self.dynamic_points.tolist()):
+            np.testing.assert_allclose(
+                [
+                    frame.dynamic_points.range[i],
+                    frame.dynamic_points.angle[i],
+                    frame.dynamic_points.elev[i],
+                ],
+                utils.transform_spherical_point(*raw[:3], 1.0, 0.3, -0.4),
+                atol=1e-9,
+            )
+        for i, raw in enumerate(self.tracked_objects.tolist()):
+            np.testing.assert_allclose(
+                frame.tracked_objects.vel[i],
+                utils.transform_direction(raw[3], raw[4], raw[8], 0.3, -0.4),
+                atol=1e-9,
+            )
+
+    def test_dynamic_points_cartesian(self):
+        points = self.parser.parse_frame(
+            build_packet(self.dynamic_points, [], [])
+        ).dynamic_points
+        for i, raw in enumerate(self.dynamic_points.tolist()):
+            np.testing.assert_allclose(
+                [points.x[i], points.y[i], points.z[i]],
+                utils.transform_point(
+                    *utils.spherical_to_cartesian(*raw[:3]),
+                    self.parser.height,
+                    self.parser.elevation_tilt,
+                ),
+                atol=1e-9,
+            )
+        self.assertNotIn("spherical", points.__dict__)
+        np.testing.assert_allclose(
+            np.column_stack((points.range, points.angle, points.elev)),
+            points.spherical,
+        )
+
+    def test_float32(self):
+        packet = build_packet(
+            self.dynamic_points, self.static_points, self.tracked_objects
+        )
+        expected = self.parser.parse_frame(packet)
+        self.parser.float32 = True
+        frame = self.parser.parse_frame(packet)
+
+        for name in ("x", "y", "z", "range", "doppler"):
+            values = getattr(frame.dynamic_points, name)
+            self.assertEqual(values.dtype, np.float32)
+            np.testing.assert_allclose(
+                values, getattr(expected.dynamic_points, name), atol=1e-5
+            )
+        self.assertEqual(frame.static_points.x.dtype, np.float32)
+        self.assertEqual(frame.tracked_objects.values.dtype, np.float32)
+        np.testing.assert_allclose(
+            frame.tracked_objects.values, expected.tracked_objects.values, atol=1e-5
+        )
+
+    def test_parse_batch(self):
+        contents = [
+            (self.dynamic_points, self.static_points, self.tracked_objects),
+            ([], [], []),
+            (self.dynamic_points[:7], [], self.tracked_objects[:1]),
+            ([], self.static_points[:3], []),
+        ]
+        frames = [build_area_scanner_frame(i, *c) for i, c in enumerate(contents)]
+        # Garbage, and a frame cut short by the next one
+        stream = b"\x00\x01" + frames[0] + frames[1][:-10] + b"".join(frames[1:])
+
+        batch = self.parser.parse_batch(stream)
+        self.assertEqual(batch.frame_number.tolist(), [0, 1, 2, 3])
+        self.assertEqual(batch.corrupt, 1)
+        self.assertIsNone(batch.timestamps_ns)
+        self.assertEqual(batch.dynamic_offsets.tolist(), [0, 50, 50, 57, 57])
+        self.assertEqual(batch.static_frame_index.tolist(), [0] * 20 + [3] * 3)
+
+        for i, frame in enumerate(frames):
+            expected = self.parser.parse_frame(memoryview(frame)[len(MAGIC_NUMBER) :])
+            for name, offsets in (
+                ("dynamic_points", batch.dynamic_offsets),
+                ("static_points", batch.static_offsets),
+                ("tracked_objects", batch.tracked_offsets),
+            ):
+                columns = getattr(batch, name)
+                values = getattr(expected, name)
+                if values is None:
+                    self.assertEqual(offsets[i], offsets[i + 1])
+                    continue
+                for field in columns.__dataclass_fields__:
+                    np.testing.assert_array_equal(
+                        getattr(columns, field)[offsets[i] : offsets[i + 1]],
+                        getattr(values, field),
+                    )
+
+        # Capture files carry the receive times
+        fd, path = tempfile.mkstemp(suffix=".cap")
+        os.close(fd)
+        try:
+            with CaptureWriter(path) as writer:
+                for i, frame in enumerate(frames):
+                    writer.write(frame, timestamp_ns=1000 * i)
+            with open(path, "rb") as f:
+                captured = self.parser.parse_batch(f.read())
+        finally:
+            os.remove(path)
+
+        self.assertEqual(captured.timestamps_ns.tolist(), [0, 1000, 2000, 3000])
+        np.testing.assert_array_equal(captured.headers, batch.headers)
+        np.testing.assert_array_equal(captured.dynamic_points.x, batch.dynamic_points.x)
+
+        # Other layouts for the Area Scanner TLVs are rejected rather than decoded wrongly
+        parser = AreaScannerParser()
+        parser.register_tlv(7, TlvSchema("dynamic_side_info", np.dtype("<u4"), 1))
+        with self.assertRaises(ValueError):
+            parser.parse_batch(b"".join(frames))
@@ -0,0 +1,105 @@
+import pickle
+import unittest
+from threading import Thread
+
+import numpy as np
+
+from src.pymmWave.buffer_pool import BufferPool
+from src.pymmWave.constants import MAGIC_NUMBER, MAX_PACKET_LEN
+from src.pymmWave.parsing.area_scanner.area_scanner_parser import AreaScannerParser
+from src.pymmWave.simulator import AreaScannerSimulator
+
+
+class TestBufferPool(unittest.TestCase):
+    def test_reuse(self):
+        pool = BufferPool(16, max_buffers=1)
+        a = pool.acquire()
+        b = pool.acquire()
+        pool.release(a)
+        pool.release(b)  # Pool is full
+        self.assertIs(pool.acquire(), a)
+        self.assertEqual((pool.allocated, pool.reused), (2, 1))
+
+    def test_threads(self):
+        pool = BufferPool(16)
+
+        def churn():
+            for _ in range(10_000):
+                pool.release(pool.acquire())
+
+        threads = [Thread(target=churn) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(pool.allocated + pool.reused, 40_000)
+
+        # Pickles without its lock, e.g. along with a parser
+        copy = pickle.loads(pickle.dumps(pool))
+        self.assertEqual(len(copy.acquire()), 16)
+
+    def test_size_classes(self):
+        pool = BufferPool(1024)
+        self.assertEqual(len(pool.acquire(1024)), 1024)
+        self.assertEqual(len(pool.acquire(1025)), 2048)
+        self.assertEqual(len(pool.acquire(MAX_PACKET_LEN)), pool.max_size)
+        with self.assertRaises(ValueError):
+            pool.acquire(pool.max_size + 1)
+
+        small = pool.acquire(100)
+        pool.release(small)
+        pool.release(bytearray(1000))  # Not a size of this pool
+        self.assertIsNot(pool.acquire(4000), small)
+        self.assertIs(pool.acquire(1000), small)
+
+    def test_not_reused_while_viewed(self):
+        pool = BufferPool(16)
+        buf = pool.acquire()
+        view = np.frombuffer(buf, np.uint8)
+        pool.release(buf)
+        self.assertEqual(len(pool), 0)
+
+        del view
+        pool.release(buf)
+        self.assertEqual(len(pool), 1)
+
+
+class TestFrameRelease(unittest.TestCase):
+    def setUp(self):
+        sim = AreaScannerSimulator(seed=0)
+        self.packet = memoryview(sim._random_frame(1, 0))[len(MAGIC_NUMBER) :]
+        self.parser = AreaScannerParser()
+        self.parser.buffer_pool = BufferPool(256)
+
+    def test_release(self):
+        frame = self.parser.parse_frame(self.packet)
+        points = frame.dynamic_points
+        frame.release()
+        self.assertTrue(frame.released)
+        self.assertEqual(len(self.parser.buffer_pool), 1)
+
+        # Decoded points stay valid, raw TLVs are gone
+        self.assertIs(frame.dynamic_points, points)
+        with self.assertRaises(Exception):
+            frame.tlv(1)
+
+    def test_garbage_collected(self):
+        for _ in range(10):
+            self.parser.parse_packet(self.packet)
+        self.assertEqual(self.parser.buffer_pool.allocated, 1)
+        self.assertEqual(self.parser.buffer_pool.reused, 9)
+
+    def test_outstanding_records(self):
+        frame = self.parser.parse_frame(self.packet)
+        records = frame.tlv(10)
+        frame.release()
+        self.assertEqual(len(self.parser.buffer_pool), 0)
+        self.assertFalse(records.flags.writeable)
+
+    def test_pickle(self):
+        frame = self.parser.parse_frame(self.packet)
+        pickled = pickle.dumps(frame)
+        self.assertLess(len(pickled), len(self.packet) + 2048)
+        copy = pickle.loads(pickled)
+        frame.release()
+        self.assertEqual(copy.to_dict(), self.parser.parse_packet(self.packet))
@@ -0,0 +1,58 @@
+import os
+import tempfile
+import unittest
+
+from src.pymmWave.capture import CaptureWriter, index_capture, read_capture
+
+from test_frame_reader import build_frame
+
+
+class TestCapture(unittest.TestCase):
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp(suffix=".cap")
+        os.close(fd)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_round_trip(self):
+        frames = [build_frame(i, [(1.0, 0.5, 0.0, 0.0)] * i) for i in range(50)]
+        with CaptureWriter(self.path) as writer:
+            for i, frame in enumerate(frames):
+                writer.write(memoryview(frame), timestamp_ns=1_000_000 * i)
+
+        records = list(read_capture(self.path))
+        self.assertEqual([frame for _, frame in records], frames)
+        self.assertEqual([t for t, _ in records], [1_000_000 * i for i in range(50)])
+
+    def test_truncated(self):
+        with CaptureWriter(self.path) as writer:
+            writer.write(build_frame(1, []))
+            writer.write(build_frame(2, []))
+
+        with open(self.path, "r+b") as f:
+            f.truncate(os.path.getsize(self.path) - 5)
+
+        self.assertEqual(len(list(read_capture(self.path))), 1)
+
+    def test_not_a_capture(self):
+        with open(self.path, "wb") as f:
+            f.write(build_frame(1, []))
+
+        with self.assertRaises(ValueError):
+            list(read_capture(self.path))
+
+    def test_index(self):
+        frames = [build_frame(i, [(1.0, 0.5, 0.0, 0.0)] * i) for i in range(5)]
+        with CaptureWriter(self.path) as writer:
+            for i, frame in enumerate(frames):
+                writer.write(frame, timestamp_ns=i)
+
+        with open(self.path, "rb") as f:
+            data = f.read()[:-5]
+
+        records = index_capture(data)
+        self.assertEqual([t for t, _, _ in records], [0, 1, 2, 3])
+        self.assertEqual([data[o : o + n] for _, o, n in records], frames[:4])
+        with self.assertRaises(ValueError):
+            index_capture(frames[0])
@@ -0,0 +1,85 @@
+import unittest
+
+import numpy as np
+
+from src.pymmWave.clock import ClockModel
+from src.pymmWave.timestamps import stamp
+
+CLOCK_HZ = 200e6
+
+
+def sensor_frames(
+    rng: np.random.Generator, sent: np.ndarray, start: float, drift: float
+) -> tuple[np.ndarray, np.ndarray]:
+    """time_cpu_cycles and receive times of frames sent at the given host times by a sensor whose clock runs drift slow."""
+    cycles = np.round((sent - sent[0]) * CLOCK_HZ / (1 + drift) + start * CLOCK_HZ)
+    # Constant transport delay, and jitter which only ever delays frames
+    received = sent + 0.004 + rng.exponential(0.003, len(sent))
+    return cycles.astype(np.int64) % (1 << 32), received
+
+
+class TestClockModel(unittest.TestCase):
+    def test_wraps_and_drift(self):
+        rng = np.random.default_rng(0)
+        # 100 s at 20 Hz, the counter wraps 4 times
+        sent = 1000.0 + np.arange(2000) / 20
+        cycles, received = sensor_frames(rng, sent, 15.0, 40e-6)
+
+        clock = ClockModel()
+        corrected = np.array(
+            [clock.update(int(c), r) for c, r in zip(cycles, received)]
+        )
+
+        self.assertAlmostEqual(clock.drift, 40e-6, delta=5e-6)
+        self.assertEqual(clock.resets, 0)
+        self.assertTrue(np.all(corrected <= received))
+        # Once fit, corrected times follow the send times up to the constant transport delay
+        error = corrected[200:] - sent[200:] - 0.004
+        self.assertLess(np.abs(error).max(), 0.001)
+        self.assertGreater(np.abs(received - sent - 0.004).max(), 0.01)
+
+    def test_gap_longer_than_wrap(self):
+        rng = np.random.default_rng(1)
+        sent = np.concatenate((np.arange(200), 200 + 30 * 20 + np.arange(200))) / 20
+        cycles, received = sensor_frames(rng, sent, 0.0, 0.0)
+
+        clock = ClockModel()
+        corrected = [clock.update(int(c), r) for c, r in zip(cycles, received)]
+        self.assertEqual(clock.resets, 0)
+        self.assertLess(abs(corrected[-1] - sent[-1] - 0.004), 0.002)
+
+    def test_restart(self):
+        clock = ClockModel()
+        for i in range(100):
+            clock.update(int(5e9) + i * int(1e7), i * 0.05)
+        self.assertEqual(clock.samples, 100)
+
+        # The counter starts over after the sensor was restarted
+        clock.update(int(1e7), 5.0)
+        self.assertEqual(clock.resets, 1)
+        self.assertEqual(clock.samples, 1)
+
+    def test_align_sensors(self):
+        rng = np.random.default_rng(2)
+        sent = 50.0 + np.arange(600) / 20
+        clocks = [ClockModel(), ClockModel()]
+        corrected = []
+        for clock, (start, drift) in zip(clocks, ((3.0, 30e-6), (17.0, -25e-6))):
+            cycles, received = sensor_frames(rng, sent, start, drift)
+            corrected.append(
+                np.array([clock.update(int(c), r) for c, r in zip(cycles, received)])
+            )
+
+        # Frames sent together line up across sensors despite different clocks and jitter
+        self.assertLess(np.abs(corrected[0] - corrected[1])[100:].max(), 0.002)
+
+    def test_stamp(self):
+        clock = ClockModel()
+        data = {"time_cpu_cycles": 1000}
+        stamp(data, 10.0, 10.001)
+        clock.stamp(data)
+        self.assertEqual(data["timestamps"]["corrected"], 10.0)
+
+        clock.stamp({"time_cpu_cycles": 2000})
+        clock.stamp({"time_cpu_cycles": 2000, "timestamps": {"received": None}})
+        self.assertEqual(clock.samples, 1)
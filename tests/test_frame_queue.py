@@ -0,0 +1,61 @@
+import asyncio
+import unittest
+
+from src.pymmWave.constants import QueuePolicy
+from src.pymmWave.frame_queue import FrameQueue
+
+
+class TestFrameQueue(unittest.TestCase):
+    def _fill(self, policy: QueuePolicy) -> FrameQueue:
+        queue = FrameQueue(2, policy)
+        for i in range(5):
+            queue.put_nowait(i)
+        return queue
+
+    def _drain(self, queue: FrameQueue) -> list:
+        items = []
+        while not queue.empty():
+            items.append(queue.get_nowait())
+        return items
+
+    def test_drop_oldest(self):
+        queue = self._fill(QueuePolicy.DROP_OLDEST)
+        self.assertEqual(self._drain(queue), [3, 4])
+        self.assertEqual(queue.dropped, 3)
+        self.assertEqual(queue.overwritten, 0)
+
+    def test_drop_newest(self):
+        queue = self._fill(QueuePolicy.DROP_NEWEST)
+        self.assertEqual(self._drain(queue), [0, 1])
+        self.assertEqual(queue.dropped, 3)
+
+    def test_coalesce(self):
+        queue = self._fill(QueuePolicy.COALESCE)
+        self.assertEqual(self._drain(queue), [0, 4])
+        self.assertEqual(queue.dropped, 0)
+        self.assertEqual(queue.overwritten, 3)
+
+    def test_block(self):
+        queue = FrameQueue(2, QueuePolicy.BLOCK)
+
+        async def run() -> list:
+            async def produce():
+                for i in range(10):
+                    await queue.put(i)
+
+            producer = asyncio.create_task(produce())
+            items = [await queue.get() for _ in range(10)]
+            await producer
+            return items
+
+        self.assertEqual(asyncio.run(run()), list(range(10)))
+        self.assertEqual(queue.dropped, 0)
+
+        queue.put_nowait(0)
+        queue.put_nowait(1)
+        with self.assertRaises(asyncio.QueueFull):
+            queue.put_nowait(2)
+
+    def test_invalid_size(self):
+        with self.assertRaises(ValueError):
+            FrameQueue(0)
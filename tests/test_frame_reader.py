@@ -0,0 +1,158 @@
+import asyncio
+import random
+import struct
+import unittest
+
+from src.pymmWave.constants import MAGIC_NUMBER
+from src.pymmWave.frame_reader import FrameReader
+from src.pymmWave.parsing.area_scanner.area_scanner_parser import AreaScannerParser
+from src.pymmWave.parsing.sensor_parser import PacketParser
+
+
+def build_frame(frame_number: int, points: list[tuple[float, float, float, float]]):
+    """Build an Area Scanner frame with a single dynamic point TLV."""
+    tlv = struct.pack("<2I", 1, 16 * len(points))
+    tlv += b"".join(struct.pack("<4f", *p) for p in points)
+    total_packet_len = 44 + len(tlv)
+    header = MAGIC_NUMBER + struct.pack(
+        "<9I", 0x03060000, total_packet_len, 0, frame_number, 0, len(points), 1, 0, 0
+    )
+    return header + tlv
+
+
+class TestFrameReader(unittest.TestCase):
+    def test_single_frame(self):
+        frame = build_frame(1, [(1.0, 0.0, 0.0, 0.5)])
+        reader = FrameReader()
+        reader.feed(frame)
+        self.assertEqual(bytes(reader.next_frame()), frame)
+        self.assertIsNone(reader.next_frame())
+
+    def test_garbage_and_chunks(self):
+        frames = [build_frame(i, [(float(i), 0.0, 0.0, 0.0)] * i) for i in range(20)]
+        stream = b"".join(b"\x00\x02\x01" + f for f in frames)
+
+        reader = FrameReader(capacity=64)
+        received = []
+        pos = 0
+        while pos < len(stream):
+            n = random.randint(1, 300)
+            reader.feed(stream[pos : pos + n])
+            pos += n
+            while (frame := reader.next_frame()) is not None:
+                received.append(bytes(frame))
+
+        self.assertEqual(received, frames)
+
+    def test_bytes_missing(self):
+        frame = build_frame(1, [(1.0, 0.0, 0.0, 0.5)] * 4)
+        reader = FrameReader()
+        self.assertEqual(reader.bytes_missing(), 24)
+        reader.feed(frame[:30])
+        self.assertIsNone(reader.next_frame())
+        self.assertEqual(reader.bytes_missing(), len(frame) - 30)
+        reader.feed(frame[30:])
+        self.assertIsNotNone(reader.next_frame())
+
+    def test_invalid_length(self):
+        frame = build_frame(2, [])
+        corrupt = MAGIC_NUMBER + struct.pack("<2I", 0, 3)
+        reader = FrameReader()
+        reader.feed(corrupt + frame)
+        self.assertEqual(bytes(reader.next_frame()), frame)
+        self.assertEqual(reader.stats.corrupt, 1)
+        self.assertEqual(reader.stats.resynced, 1)
+
+    def test_garbage_length_resync(self):
+        # A huge length must not make the reader wait for the following frames
+        corrupt = MAGIC_NUMBER + struct.pack("<4I", 0, 50_000_000, 0, 3) + bytes(16)
+        frames = [build_frame(4, []), build_frame(5, [])]
+        reader = FrameReader()
+        reader.feed(build_frame(1, []) + corrupt + b"".join(frames))
+
+        received = []
+        while (frame := reader.next_frame()) is not None:
+            received.append(bytes(frame))
+
+        self.assertEqual(received, [build_frame(1, [])] + frames)
+        self.assertEqual(reader.stats.frames, 3)
+        # Frame 2 never arrived, frame 3 arrived corrupt
+        self.assertEqual(reader.stats.corrupt, 1)
+        self.assertEqual(reader.stats.lost, 1)
+
+    def test_truncated_frame(self):
+        # The first frame is cut short, so its length runs into the next frame
+        truncated = build_frame(1, [(1.0, 0.0, 0.0, 0.0)] * 4)[:-20]
+        frame = build_frame(2, [(1.0, 0.0, 0.0, 0.0)] * 4)
+        reader = FrameReader()
+        reader.feed(truncated)
+        self.assertIsNone(reader.next_frame())
+        reader.feed(frame)
+
+        self.assertEqual(bytes(reader.next_frame()), frame)
+        self.assertEqual(reader.stats.corrupt, 1)
+        self.assertEqual(reader.stats.frames, 1)
+        self.assertEqual(reader.stats.lost, 0)
+
+    def test_corrupt_not_lost(self):
+        # Frame 2 is cut short, so the magic word of frame 3 lies within it
+        truncated = build_frame(2, [(1.0, 0.0, 0.0, 0.0)] * 4)[:-20]
+        reader = FrameReader()
+        reader.feed(build_frame(1, []) + truncated + build_frame(3, []))
+        while reader.next_frame() is not None:
+            pass
+
+        self.assertEqual(reader.stats.frames, 2)
+        self.assertEqual(reader.stats.corrupt, 1)
+        self.assertEqual(reader.stats.lost, 0)
+
+    def test_lost_frames(self):
+        reader = FrameReader()
+        for frame_number in [3, 4, 7, 8, 12, 0, 1]:
+            reader.feed(build_frame(frame_number, []))
+            self.assertIsNotNone(reader.next_frame())
+
+        # A restarted sensor counting from 0 again is no loss
+        self.assertEqual(reader.stats.lost, 5)
+        self.assertEqual(reader.stats.frames, 7)
+        self.assertEqual(reader.stats.resynced, 0)
+
+
+class TestAreaScannerPacket(unittest.TestCase):
+    def test_parse_packet(self):
+        frame = build_frame(7, [(2.0, 0.25, -0.1, 0.5), (4.0, -0.5, 0.2, -1.0)])
+        result = AreaScannerParser().parse_packet(memoryview(frame)[8:])
+
+        self.assertEqual(result["frame_number"], 7)
+        self.assertEqual(result["total_packet_len"], len(frame))
+        self.assertEqual(len(result["dynamic_points"]), 2)
+        self.assertAlmostEqual(result["dynamic_points"][0]["range"], 2.0, places=5)
+        self.assertAlmostEqual(result["dynamic_points"][1]["angle"], -0.5, places=5)
+        self.assertAlmostEqual(result["dynamic_points"][1]["elev"], 0.2, places=5)
+        self.assertAlmostEqual(result["dynamic_points"][1]["doppler"], -1.0, places=5)
+
+    def test_parse_from_serial(self):
+        class FrameNumberParser(PacketParser):
+            def parse_packet(self, packet):
+                return {"frame_number": struct.unpack_from("<I", packet, 12)[0]}
+
+        class Serial:
+            def __init__(self, data: bytes):
+                self.data = data
+
+            async def read_async(self, size: int) -> bytes:
+                chunk, self.data = self.data[:size], self.data[size:]
+                return chunk
+
+        # The packets of both frames are read by the default parse, after their magic words
+        s = Serial(build_frame(3, [(1.0, 0.0, 0.0, 0.0)])[8:] + build_frame(4, [])[8:])
+        parser = FrameNumberParser()
+        self.assertEqual(asyncio.run(parser.parse(s)), {"frame_number": 3})
+        self.assertEqual(asyncio.run(parser.parse(s)), {"frame_number": 4})
+
+    def test_parse_packet_required(self):
+        class IncompleteParser(PacketParser):
+            pass
+
+        with self.assertRaises(TypeError):
+            IncompleteParser()
@@ -0,0 +1,188 @@
+import asyncio
+import os
+import tempfile
+import tty
+import unittest
+
+from aioserial import SerialException
+
+from src.pymmWave.capture import read_capture
+from src.pymmWave.constants import QueuePolicy, ReadMode
+from src.pymmWave.IWR6843AOP import IWR6843AOP
+from src.pymmWave.timestamps import FrameTimestamps
+
+from test_frame_reader import build_frame
+
+
+@unittest.skipUnless(hasattr(os, "openpty"), "requires pseudo-terminals")
+class TestReadModes(unittest.TestCase):
+    def setUp(self):
+        self._fds = []
+
+    def tearDown(self):
+        for fd in self._fds:
+            os.close(fd)
+
+    def _open_pty(self) -> tuple[int, str]:
+        master, slave = os.openpty()
+        tty.setraw(slave)
+        self._fds += [master, slave]
+        return master, os.ttyname(slave)
+
+    def _connected_sensor(
+        self, read_mode: ReadMode, **kwargs
+    ) -> tuple[IWR6843AOP, int]:
+        sensor = IWR6843AOP("test", read_mode=read_mode, **kwargs)
+        _, config_port = self._open_pty()
+        data_master, data_port = self._open_pty()
+        self.assertTrue(sensor.connect_config(config_port, 115200))
+        self.assertTrue(sensor.connect_data(data_port, 921600, timeout=0.05))
+        sensor._config_sent = True  # No device to answer the config here
+        return sensor, data_master
+
+    def _receive_frames(self, read_mode: ReadMode) -> list[int]:
+        sensor, data_master = self._connected_sensor(read_mode)
+
+        async def run() -> list[int]:
+            task = asyncio.create_task(sensor.start_sensor())
+            received = []
+            for i in range(5):
+                os.write(data_master, build_frame(i, [(1.0, 0.0, 0.0, 0.0)] * i))
+                data = await asyncio.wait_for(sensor.get_data(), 2)
+                received.append(data["frame_number"])
+
+            sensor.stop_sensor(send_stop=False)
+            await asyncio.wait_for(task, 2)
+            return received
+
+        return asyncio.run(run())
+
+    def test_thread(self):
+        self.assertEqual(self._receive_frames(ReadMode.THREAD), [0, 1, 2, 3, 4])
+
+    def test_selector(self):
+        self.assertEqual(self._receive_frames(ReadMode.SELECTOR), [0, 1, 2, 3, 4])
+
+    def test_selector_port_closed(self):
+        sensor, data_master = self._connected_sensor(ReadMode.SELECTOR)
+        self._fds.remove(data_master)
+        os.close(data_master)
+
+        async def run():
+            await asyncio.wait_for(sensor.start_sensor(), 2)
+
+        with self.assertRaises(SerialException):
+            asyncio.run(run())
+        sensor.stop_sensor(send_stop=False)
+
+    def _receive_burst(self, read_mode: ReadMode) -> list[int]:
+        sensor, data_master = self._connected_sensor(
+            read_mode, queue_size=2, queue_policy=QueuePolicy.BLOCK
+        )
+
+        async def run() -> list[int]:
+            task = asyncio.create_task(sensor.start_sensor())
+            os.write(data_master, b"".join(build_frame(i, []) for i in range(8)))
+            await asyncio.sleep(0.2)
+
+            received = []
+            for _ in range(8):
+                data = await asyncio.wait_for(sensor.get_data(), 2)
+                received.append(data["frame_number"])
+
+            sensor.stop_sensor(send_stop=False)
+            await asyncio.wait_for(task, 2)
+            return received
+
+        received = asyncio.run(run())
+        self.assertEqual(sensor.dropped_frames, 0)
+        return received
+
+    def test_block_thread(self):
+        self.assertEqual(self._receive_burst(ReadMode.THREAD), list(range(8)))
+
+    def test_block_selector(self):
+        self.assertEqual(self._receive_burst(ReadMode.SELECTOR), list(range(8)))
+
+    def test_subscriptions(self):
+        sensor, data_master = self._connected_sensor(ReadMode.SELECTOR, queue_size=8)
+        first = sensor.subscribe(maxsize=8)
+        second = sensor.subscribe(maxsize=8)
+
+        async def run():
+            task = asyncio.create_task(sensor.start_sensor())
+            os.write(data_master, b"".join(build_frame(i, []) for i in range(5)))
+
+            received = {"first": [], "second": [], "sensor": []}
+            for _ in range(5):
+                a = await asyncio.wait_for(first.get(), 2)
+                b = await asyncio.wait_for(second.get(), 2)
+                c = await asyncio.wait_for(sensor.get_data(), 2)
+                # Parsed once and shared
+                self.assertIs(a, b)
+                self.assertIs(b, c)
+                received["first"].append(a["frame_number"])
+                received["second"].append(b["frame_number"])
+                received["sensor"].append(c["frame_number"])
+
+            second.close()
+            os.write(data_master, build_frame(5, []))
+            self.assertEqual(
+                (await asyncio.wait_for(first.get(), 2))["frame_number"], 5
+            )
+            self.assertIsNone(second.get_nowait())
+
+            sensor.stop_sensor(send_stop=False)
+            await asyncio.wait_for(task, 2)
+            return received
+
+        received = asyncio.run(run())
+        for frames in received.values():
+            self.assertEqual(frames, list(range(5)))
+
+    def test_recording(self):
+        sensor, data_master = self._connected_sensor(ReadMode.SELECTOR)
+        frames = [build_frame(i, [(1.0, 0.0, 0.0, 0.0)] * i) for i in range(3)]
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "test.cap")
+
+            async def run() -> list[int]:
+                task = asyncio.create_task(sensor.start_sensor())
+                writer = sensor.start_recording(path)
+                received = []
+                for frame in frames:
+                    os.write(data_master, frame)
+                    data = await asyncio.wait_for(sensor.get_data(), 2)
+                    received.append(writer.epoch_ns(FrameTimestamps.of(data).received))
+
+                sensor.stop_sensor(send_stop=False)
+                await asyncio.wait_for(task, 2)
+                return received
+
+            received = asyncio.run(run())
+            records = list(read_capture(path))
+            self.assertEqual([frame for _, frame in records], frames)
+            # Recorded with the time the frame was received, not when it was written
+            self.assertEqual([t for t, _ in records], received)
+
+
+class TestPublishFromThread(unittest.TestCase):
+    def test_blocking_subscription_added_late(self):
+        # The reader thread saw no QueuePolicy.BLOCK queue, and posted the frames before the subscription was added
+        sensor = IWR6843AOP("test")
+        subscription = sensor.subscribe(maxsize=1, policy=QueuePolicy.BLOCK)
+
+        async def run() -> list[int]:
+            self.assertIsNone(sensor._publish_in_order({"frame_number": 0}))
+            self.assertIsNotNone(sensor._publish_in_order({"frame_number": 1}))
+            sensor._publish_in_order({"frame_number": 2})
+
+            received = []
+            for _ in range(3):
+                data = await asyncio.wait_for(subscription.get(), 2)
+                received.append(data["frame_number"])
+            return received
+
+        self.assertEqual(asyncio.run(run()), [0, 1, 2])
+        self.assertIsNone(sensor._pending_put)
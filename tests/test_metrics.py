@@ -0,0 +1,49 @@
+import unittest
+
+import numpy as np
+
+from src.pymmWave.metrics import LatencyHistogram, RateMeter, SensorMetrics
+
+
+class TestLatencyHistogram(unittest.TestCase):
+    def test_percentiles(self):
+        durations = np.random.default_rng(0).lognormal(-7, 1.5, 10_000)
+        histogram = LatencyHistogram()
+        for d in durations:
+            histogram.record(d)
+
+        self.assertEqual(histogram.count, len(durations))
+        self.assertAlmostEqual(histogram.max, durations.max(), delta=1e-9)
+        self.assertAlmostEqual(histogram.mean, durations.mean(), delta=1e-9)
+        for p in (50, 90, 99, 99.9):
+            self.assertAlmostEqual(
+                histogram.percentile(p) / np.percentile(durations, p), 1, delta=0.04
+            )
+
+    def test_limits(self):
+        histogram = LatencyHistogram(max_seconds=1.0)
+        self.assertIsNone(histogram.percentile(50))
+        histogram.record(5e-9)
+        histogram.record(-1.0)
+        histogram.record(100.0)
+        self.assertEqual(histogram.min, 0)
+        self.assertEqual(histogram.percentile(50), 5e-9)
+        self.assertAlmostEqual(histogram.percentile(100), 1.0, delta=0.02)
+
+        histogram.reset()
+        self.assertEqual(histogram.summary()["count"], 0)
+
+
+class TestSensorMetrics(unittest.TestCase):
+    def test_count_frame(self):
+        metrics = SensorMetrics()
+        metrics.count_frame({"num_detected_obj": 3, "num_static_detected_obj": 2})
+        metrics.count_frame(object())
+        self.assertEqual(metrics.frames.total, 2)
+        self.assertEqual(metrics.points.total, 5)
+        self.assertEqual(metrics.summary()["points_per_second"], 0)
+
+        meter = RateMeter(window=2)
+        meter.add(10)
+        # The current second is not complete yet
+        self.assertEqual(meter.rate(), 0)
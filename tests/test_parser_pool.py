@@ -0,0 +1,118 @@
+import asyncio
+import os
+import tty
+import unittest
+
+import numpy as np
+
+from src.pymmWave.constants import MAGIC_NUMBER, QueuePolicy, ReadMode
+from src.pymmWave.IWR6843AOP import IWR6843AOP
+from src.pymmWave.parsing.area_scanner.area_scanner_parser import AreaScannerParser
+from src.pymmWave.parsing.area_scanner.models import AreaScannerFrame
+from src.pymmWave.parsing.parser_pool import ParserPool
+from src.pymmWave.parsing.sensor_parser import PacketParser
+
+from test_frame_reader import build_frame
+
+
+class LengthParser(PacketParser):
+    def parse_packet(self, packet):
+        return {"length": len(packet)}
+
+
+class TestParserPool(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.pool = ParserPool(AreaScannerParser(), workers=2, slots=3)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.pool.close()
+
+    def test_same_as_in_process(self):
+        parser = AreaScannerParser()
+        packets = [
+            build_frame(i, [(1.0 + i, 0.1, 0.2, 0.5)] * i)[len(MAGIC_NUMBER) :]
+            for i in range(10)
+        ]
+        futures = [self.pool.submit(packet) for packet in packets]
+        for packet, future in zip(packets, futures):
+            self.assertEqual(future.result(10), parser.parse_packet(memoryview(packet)))
+
+    def test_parser_errors(self):
+        packet = build_frame(1, [(1.0, 0.0, 0.0, 0.0)])[len(MAGIC_NUMBER) :]
+        with self.assertRaises(ValueError):
+            self.pool.submit(packet[:-4]).result(10)
+
+        # The slot of the failed packet is free again
+        for _ in range(4):
+            self.assertEqual(self.pool.submit(packet).result(10)["frame_number"], 1)
+
+    def test_columnar(self):
+        parser = AreaScannerParser()
+        parser.columnar = True
+        parser.float32 = True
+        packet = build_frame(1, [(1.0, 0.1, 0.2, 0.5)] * 3)[len(MAGIC_NUMBER) :]
+        with ParserPool(parser, workers=1) as pool:
+            frame = pool.submit(packet).result(10)
+            self.assertIsInstance(frame, AreaScannerFrame)
+            self.assertEqual(frame.dynamic_points.x.dtype, np.float32)
+            expected = parser.parse_frame(memoryview(packet))
+            self.assertEqual(frame.to_dict(), expected.to_dict())
+            self.assertEqual(frame.tlv(1).tobytes(), expected.tlv(1).tobytes())
+
+    def test_without_columnar_form(self):
+        packet = build_frame(3, [(1.0, 0.1, 0.2, 0.5)])[len(MAGIC_NUMBER) :]
+        with ParserPool(LengthParser(), workers=1) as pool:
+            self.assertEqual(pool.submit(packet).result(10), {"length": len(packet)})
+
+
+@unittest.skipUnless(hasattr(os, "openpty"), "requires pseudo-terminals")
+class TestSensorWithPool(unittest.TestCase):
+    def test_in_order(self):
+        fds = []
+        for _ in range(2):
+            master, slave = os.openpty()
+            tty.setraw(slave)
+            fds += [master, slave]
+
+        def run(pool: ParserPool) -> tuple[list[int], int]:
+            sensor = IWR6843AOP(
+                "test",
+                read_mode=ReadMode.THREAD,
+                queue_size=2,
+                queue_policy=QueuePolicy.BLOCK,
+                parser_pool=pool,
+            )
+            self.assertTrue(sensor.connect_config(os.ttyname(fds[1]), 115200))
+            self.assertTrue(sensor.connect_data(os.ttyname(fds[3]), 921600, 0.05))
+            sensor._config_sent = True
+
+            async def receive() -> tuple[list[int], int]:
+                task = asyncio.create_task(sensor.start_sensor())
+                os.write(fds[2], b"".join(build_frame(i, []) for i in range(12)))
+
+                received = []
+                for _ in range(12):
+                    data = await asyncio.wait_for(sensor.get_data(), 10)
+                    self.assertIsInstance(data, dict)
+                    received.append(data["frame_number"])
+
+                sensor.stop_sensor(send_stop=False)
+                await asyncio.wait_for(task, 2)
+                return received, sensor.metrics.transform.count
+
+            return asyncio.run(receive())
+
+        try:
+            with ParserPool(AreaScannerParser(), workers=2) as pool:
+                # The workers' decode times are recorded
+                self.assertEqual(run(pool), (list(range(12)), 12))
+        finally:
+            for fd in fds:
+                os.close(fd)
+
+    def test_requires_thread_mode(self):
+        with ParserPool(AreaScannerParser(), workers=1) as pool:
+            with self.assertRaises(ValueError):
+                IWR6843AOP("test", read_mode=ReadMode.SELECTOR, parser_pool=pool)
@@ -0,0 +1,73 @@
+import asyncio
+import os
+import tempfile
+import time
+import unittest
+
+from src.pymmWave.capture import CaptureWriter
+from src.pymmWave.constants import QueuePolicy
+from src.pymmWave.replay import ReplaySensor
+from src.pymmWave.timestamps import FrameTimestamps
+
+from test_frame_reader import build_frame
+
+
+class TestReplaySensor(unittest.TestCase):
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp(suffix=".cap")
+        os.close(fd)
+        # 10 frames recorded at 20 Hz
+        with CaptureWriter(self.path) as writer:
+            for i in range(10):
+                frame = build_frame(i, [(1.0, 0.1 * i, 0.0, 0.0)] * 3)
+                writer.write(frame, timestamp_ns=50_000_000 * i)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def _play(self, sensor: ReplaySensor) -> tuple[list[int], float]:
+        async def run():
+            task = asyncio.create_task(sensor.start_sensor())
+            received = []
+            for _ in range(10):
+                data = await asyncio.wait_for(sensor.get_data(), 2)
+                received.append(data["frame_number"])
+            await asyncio.wait_for(task, 2)
+            return received
+
+        start = time.monotonic()
+        received = asyncio.run(run())
+        return received, time.monotonic() - start
+
+    def test_max_speed(self):
+        sensor = ReplaySensor(
+            "replay", self.path, speed=None, queue_policy=QueuePolicy.BLOCK
+        )
+        received, _ = self._play(sensor)
+        self.assertEqual(received, list(range(10)))
+        self.assertFalse(sensor.is_alive())
+        self.assertEqual(sensor.frame_stats.frames, 10)
+        self.assertEqual(sensor.dropped_frames, 0)
+
+    def test_timestamps(self):
+        sensor = ReplaySensor("replay", self.path, speed=None, queue_size=10)
+
+        async def run():
+            await sensor.start_sensor()
+            return sensor.get_data_nowait()
+
+        timestamps = FrameTimestamps.of(asyncio.run(run()))
+        self.assertLessEqual(timestamps.received, timestamps.parsed)
+        self.assertLessEqual(timestamps.parsed, timestamps.dequeued)
+        self.assertGreaterEqual(timestamps.latency, 0)
+
+    def test_scaled_speed(self):
+        sensor = ReplaySensor("replay", self.path, speed=3.0, queue_size=10)
+        received, elapsed = self._play(sensor)
+        self.assertEqual(received, list(range(10)))
+        # 450ms of recording at 3x speed
+        self.assertGreaterEqual(elapsed, 0.14)
+
+    def test_invalid_speed(self):
+        with self.assertRaises(ValueError):
+            ReplaySensor("replay", self.path, speed=0)
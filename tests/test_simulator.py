@@ -0,0 +1,72 @@
+import asyncio
+import os
+import unittest
+
+from src.pymmWave.constants import EXAMPLE_CONFIG, ReadMode
+from src.pymmWave.IWR6843AOP import IWR6843AOP
+from src.pymmWave.parsing.area_scanner.models import AreaScannerData
+from src.pymmWave.simulator import AreaScannerSimulator
+
+
+@unittest.skipUnless(hasattr(os, "openpty"), "requires pseudo-terminals")
+class TestAreaScannerSimulator(unittest.TestCase):
+    def _run_sensor(self, read_mode: ReadMode):
+        with AreaScannerSimulator(
+            frame_rate=100,
+            num_dynamic_points=30,
+            num_static_points=10,
+            num_tracked_objects=3,
+            seed=1,
+        ) as sim:
+            sensor = IWR6843AOP("sim", read_mode=read_mode)
+            self.assertTrue(sensor.connect_config(sim.config_port, 115200))
+            self.assertTrue(sensor.connect_data(sim.data_port, 921600))
+            self.assertTrue(sensor.send_config(EXAMPLE_CONFIG))
+
+            async def run() -> list[AreaScannerData]:
+                task = asyncio.create_task(sensor.start_sensor())
+                received = []
+                for _ in range(10):
+                    data = await asyncio.wait_for(sensor.get_data(), 2)
+                    received.append(AreaScannerData(data))
+                sensor.stop_sensor(send_stop=False)
+                await asyncio.wait_for(task, 2)
+                return received
+
+            received = asyncio.run(run())
+
+        for data in received:
+            self.assertEqual(len(data.dynamic_points), 30)
+            self.assertEqual(len(data.static_points), 10)
+            self.assertEqual(len(data.tracked_objects), 3)
+            self.assertTrue(all(p.snr < 2000 for p in data.dynamic_points))
+            self.assertTrue(
+                all(p.target_id in (0, 1, 253, 254, 255) for p in data.dynamic_points)
+            )
+
+        frame_numbers = [data.frame_number for data in received]
+        self.assertEqual(frame_numbers, sorted(frame_numbers))
+        self.assertEqual(sensor.frame_stats.corrupt, 0)
+
+        metrics = sensor.metrics
+        self.assertGreaterEqual(metrics.frames.total, 10)
+        self.assertEqual(metrics.points.total, 40 * metrics.frames.total)
+        self.assertGreater(metrics.bytes.total, 0)
+        for stage in (
+            metrics.sync_scan,
+            metrics.read,
+            metrics.parse,
+            metrics.transform,
+        ):
+            self.assertEqual(stage.count, metrics.frames.total)
+        self.assertEqual(metrics.queue_wait.count, 10)
+        self.assertLess(received[-1].timestamps.latency, 2)
+        self.assertEqual(sensor.clock.samples, metrics.frames.total)
+        for data in received:
+            self.assertLessEqual(data.timestamps.corrected, data.timestamps.received)
+
+    def test_selector(self):
+        self._run_sensor(ReadMode.SELECTOR)
+
+    def test_async(self):
+        self._run_sensor(ReadMode.ASYNC)
@@ -0,0 +1,91 @@
+import json
+import random
+import struct
+import time
+import unittest
+
+from src.pymmWave.constants import MAGIC_NUMBER
+from src.pymmWave.metrics import SensorMetrics
+from src.pymmWave.parsing.area_scanner.area_scanner_parser import AreaScannerParser
+from src.pymmWave.parsing.stream_parser import StreamParser
+from src.pymmWave.timestamps import FrameTimestamps
+from test_frame_reader import build_frame
+
+
+class TestStreamParser(unittest.TestCase):
+    def test_random_chunks(self):
+        frames = [build_frame(i, [(1.0 + i, 0.1, 0.0, 0.0)] * i) for i in range(1, 20)]
+        stream = b"".join(b"\x01\x02" + f for f in frames)
+
+        parser = StreamParser(AreaScannerParser())
+        parsed = []
+        pos = 0
+        while pos < len(stream):
+            n = random.randint(1, 500)
+            parsed += parser.feed(stream[pos : pos + n])
+            pos += n
+
+        self.assertEqual([p["frame_number"] for p in parsed], list(range(1, 20)))
+        self.assertEqual(parsed[3]["dynamic_points"][0]["range"], 5.0)
+        self.assertEqual(len(parser), 0)
+        self.assertEqual(parser.stats.frames, 19)
+
+    def test_many_frames_per_feed(self):
+        frames = b"".join(build_frame(i, []) for i in range(5))
+        parser = StreamParser(AreaScannerParser())
+        self.assertEqual(len(parser.feed(frames[:-1])), 4)
+        self.assertEqual(parser.bytes_missing(), 1)
+        self.assertEqual(len(parser.feed(frames[-1:])), 1)
+
+    def test_corrupt_and_recorded(self):
+        # TLV length which is no multiple of a point
+        header = MAGIC_NUMBER + struct.pack("<9I", 0x03060000, 60, 0, 1, 0, 1, 1, 0, 0)
+        corrupt = header + struct.pack("<2I", 1, 7) + bytes(8)
+        recorded = []
+
+        parser = StreamParser(
+            AreaScannerParser(), on_frame=lambda f: recorded.append(bytes(f))
+        )
+        parsed = parser.feed(corrupt + build_frame(2, []))
+
+        self.assertEqual([p["frame_number"] for p in parsed], [2])
+        self.assertEqual(parser.stats.corrupt, 1)
+        self.assertEqual(recorded, [corrupt, build_frame(2, [])])
+
+    def test_timestamps(self):
+        frame = build_frame(1, [(1.0, 0.0, 0.0, 0.0)])
+        parser = StreamParser(AreaScannerParser())
+        self.assertEqual(parser.feed(frame[:20]), [])
+        before = time.monotonic()
+        (parsed,) = parser.feed(frame[20:] + frame[:10])
+
+        timestamps = FrameTimestamps.of(parsed)
+        # The magic word was found in the first chunk
+        self.assertLess(timestamps.received, before)
+        self.assertGreaterEqual(timestamps.parsed, before)
+        self.assertIsNone(timestamps.latency)
+        # Dicts stay JSON serializable
+        self.assertEqual(
+            json.loads(json.dumps(parsed))["timestamps"]["received"],
+            timestamps.received,
+        )
+
+        parser.parser.columnar = True
+        (columnar,) = parser.feed(frame[10:])
+        self.assertGreaterEqual(columnar.timestamps.received, before)
+        self.assertIs(columnar.to_data().timestamps, columnar.timestamps)
+
+    def test_transform_metrics(self):
+        # One parser shared by two streams, each records its own transform times
+        parser = AreaScannerParser()
+        first = StreamParser(parser, metrics=SensorMetrics())
+        second = StreamParser(parser, metrics=SensorMetrics())
+        first.feed(build_frame(1, [(1.0, 0.0, 0.0, 0.0)]))
+        second.feed(build_frame(1, []) + build_frame(2, []))
+        self.assertEqual(first.metrics.transform.count, 1)
+        self.assertEqual(second.metrics.transform.count, 2)
+
+        # Columnar frames are decoded by their consumers
+        parser.columnar = True
+        first.feed(build_frame(2, []))
+        self.assertEqual(first.metrics.transform.count, 1)
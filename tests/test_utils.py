@@ -195,3 +195,66 @@ class TestTransformPoint(unittest.TestCase):
         self._test_transformation(
             height, elevation_tilt, azimuth_tilt, points, transformed
         )
+
+
+class TestArrayFunctions(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.points = rng.uniform(-10.0, 10.0, (50, 3))
+        self.points[0] = 0.0
+
+    def _assert_rows(self, result, scalar_function, *args):
+        for point, row in zip(self.points, result):
+            np.testing.assert_allclose(
+                row, scalar_function(*point, *args), rtol=1e-12, atol=1e-12
+            )
+
+    def test_same_as_scalar(self):
+        self._assert_rows(
+            utils.spherical_to_cartesian_array(self.points),
+            utils.spherical_to_cartesian,
+        )
+        self._assert_rows(
+            utils.cartesian_to_spherical_array(self.points),
+            utils.cartesian_to_spherical,
+        )
+        self._assert_rows(
+            utils.transform_point_array(self.points, 1.5, 0.3, -0.2),
+            utils.transform_point,
+            1.5,
+            0.3,
+            -0.2,
+        )
+        self._assert_rows(
+            utils.transform_direction_array(self.points, 0.3, -0.2),
+            utils.transform_direction,
+            0.3,
+            -0.2,
+        )
+        self._assert_rows(
+            utils.transform_spherical_point_array(self.points, 1.5, 0.3, -0.2),
+            utils.transform_spherical_point,
+            1.5,
+            0.3,
+            -0.2,
+        )
+
+    def test_out_and_rotation(self):
+        expected = utils.transform_spherical_point_array(self.points, 2.0, 0.4, 0.1)
+
+        out = self.points.copy()
+        rotation = utils.rotation_matrix(0.4, 0.1)
+        result = utils.transform_spherical_point_array(
+            out, 2.0, out=out, rotation=rotation
+        )
+        self.assertIs(result, out)
+        np.testing.assert_array_equal(out, expected)
+
+    def test_broadcast(self):
+        grid = self.points[:48].reshape(4, 12, 3)
+        np.testing.assert_array_equal(
+            utils.cartesian_to_spherical_array(grid).reshape(48, 3),
+            utils.cartesian_to_spherical_array(self.points[:48]),
+        )
+        with self.assertRaises(ValueError):
+            utils.transform_point_array(self.points[:, :2], 1.0)